@@ -0,0 +1,338 @@
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class MockConfig:
+    """Knobs for the synthetic RobotEvents server."""
+
+    def __init__(
+        self,
+        latency=0.0,
+        items=1000,
+        error_rate=0.0,
+        throttle_rate=0.0,
+        retry_after=1,
+        seed=0,
+    ):
+        """
+        Args:
+            latency: Seconds added to every response
+            items: Rows in every collection, so pages = ceil(items / per_page)
+            error_rate: Fraction of requests answered with a 503
+            throttle_rate: Fraction of requests answered with a 429
+            retry_after: Retry-After seconds sent with each 429
+            seed: Seed for payloads and injected failures
+        """
+        self.latency = latency
+        self.items = items
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.seed = seed
+
+
+def _team(i):
+    return {
+        "id": 100000 + i,
+        "number": f"{1000 + i // 4}{'ABCD'[i % 4]}",
+        "team_name": f"Team {i}",
+        "robot_name": None,
+        "organization": f"School {i // 8}",
+        "location": {"city": "Springfield", "region": ["Ohio", "Texas", "Ontario"][i % 3], "country": "United States"},
+        "registered": True,
+        "program": {"id": 1, "name": "VEX V5 Robotics Competition", "code": "V5RC"},
+        "grade": "High School" if i % 2 else "Middle School",
+    }
+
+
+def _event(i):
+    return {
+        "id": 50000 + i,
+        "sku": f"RE-V5RC-25-{50000 + i}",
+        "name": f"Synthetic Event {i}",
+        "start": "2025-10-04T00:00:00-04:00",
+        "end": "2025-10-04T00:00:00-04:00",
+        "season": {"id": 197, "name": "VEX V5 Robotics Competition 2025-2026: Push Back", "code": None},
+        "program": {"id": 1, "name": "VEX V5 Robotics Competition", "code": "V5RC"},
+        "location": {"venue": "Gym", "city": "Springfield", "region": "Ohio", "country": "United States"},
+        "divisions": [{"id": 1, "name": "Division 1", "order": 1}],
+        "level": "Signature",
+        "ongoing": False,
+        "awards_finalized": True,
+        "event_type": "tournament",
+    }
+
+
+def _season(i):
+    return {
+        "id": i,
+        "name": "VEX V5 Robotics Competition 2025-2026: Push Back",
+        "program": {"id": 1, "name": "VEX V5 Robotics Competition", "code": "V5RC"},
+        "start": "2025-04-26T00:00:00-04:00",
+        "end": "2026-04-25T00:00:00-04:00",
+        "years_start": 2025,
+        "years_end": 2026,
+    }
+
+
+def _program(i):
+    return {"id": i, "abbr": "V5RC", "name": "VEX V5 Robotics Competition"}
+
+
+def _match(i, rng):
+    def alliance(color, offset):
+        return {
+            "color": color,
+            "score": rng.randint(0, 120),
+            "teams": [
+                {"team": {"id": 100000 + (i * 4 + offset + k) % 500, "name": f"{1000 + (i + k) % 125}A", "code": None}, "sitting": False}
+                for k in range(2)
+            ],
+        }
+
+    return {
+        "id": 9000000 + i,
+        "event": {"id": 50000, "name": "Synthetic Event 0", "code": "RE-V5RC-25-50000"},
+        "division": {"id": 1, "name": "Division 1", "code": None},
+        "round": 2,
+        "instance": 1,
+        "matchnum": i + 1,
+        "scheduled": "2025-10-04T09:00:00-04:00",
+        "started": "2025-10-04T09:01:00-04:00",
+        "field": "Field 1",
+        "scored": True,
+        "name": f"Qualifier #{i + 1}",
+        "alliances": [alliance("blue", 0), alliance("red", 2)],
+    }
+
+
+def _ranking(i, rng):
+    return {
+        "id": 7000000 + i,
+        "event": {"id": 50000, "name": "Synthetic Event 0", "code": None},
+        "division": {"id": 1, "name": "Division 1", "code": None},
+        "rank": i + 1,
+        "team": {"id": 100000 + i, "name": f"{1000 + i // 4}A", "code": None},
+        "wins": rng.randint(0, 10),
+        "losses": rng.randint(0, 10),
+        "ties": 0,
+        "wp": rng.randint(0, 20),
+        "ap": rng.randint(0, 40),
+        "sp": rng.randint(0, 500),
+        "high_score": rng.randint(0, 120),
+        "average_points": rng.random() * 100,
+        "total_points": rng.randint(0, 1000),
+    }
+
+
+def _skill(i, rng):
+    return {
+        "id": 8000000 + i,
+        "event": {"id": 50000, "name": "Synthetic Event 0", "code": None},
+        "team": {"id": 100000 + i // 2, "name": f"{1000 + i // 8}A", "code": None},
+        "type": "driver" if i % 2 else "programming",
+        "season": {"id": 197, "name": None, "code": None},
+        "division": {"id": 1, "name": "Division 1", "code": None},
+        "rank": i // 2 + 1,
+        "score": rng.randint(0, 200),
+        "attempts": 3,
+    }
+
+
+def _award(i, rng):
+    return {
+        "id": 6000000 + i,
+        "event": {"id": 50000, "name": "Synthetic Event 0", "code": None},
+        "order": i,
+        "title": f"Award {i} (VRC/VEXU/VAIRC)",
+        "qualifications": ["Signature Event"],
+        "designation": None,
+        "classification": None,
+        "teamWinners": [{"division": {"id": 1}, "team": {"id": 100000 + i, "name": f"{1000 + i}A", "code": None}}],
+        "individualWinners": [],
+    }
+
+
+# Path pattern -> row factory, checked in order
+_COLLECTIONS = [
+    (re.compile(r"/matches$"), _match),
+    (re.compile(r"/(finalistR|r)ankings$"), _ranking),
+    (re.compile(r"/skills$"), _skill),
+    (re.compile(r"/awards$"), _award),
+    (re.compile(r"/teams$"), lambda i, rng: _team(i)),
+    (re.compile(r"/events$"), lambda i, rng: _event(i)),
+]
+_SINGLE = [
+    (re.compile(r"/teams/(\d+)$"), lambda i: _team(i % 100000)),
+    (re.compile(r"/events/(\d+)$"), lambda i: _event(i % 50000)),
+    (re.compile(r"/seasons/(\d+)$"), lambda i: _season(i)),
+    (re.compile(r"/programs/(\d+)$"), lambda i: _program(i)),
+]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops concurrent connects, costing a 1s SYN retry
+    request_queue_size = 128
+
+
+class MockRobotEvents:
+    """
+    Local stdlib HTTP server shaped like the RobotEvents v2 API
+
+    Collection paths return {"meta", "data"} pages, /teams/{id} and
+    /events/{id} return single objects. Supports ETag/If-None-Match and
+    injected latency, 503s and 429s (see MockConfig).
+    """
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or MockConfig()
+        self.stats = {"requests": 0, "errors": 0, "throttled": 0, "not_modified": 0}
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler())
+        self._thread = None
+        # Per-instance cache: a class-level lru_cache would keep every server alive
+        self.body = lru_cache(maxsize=4096)(self._body)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v2"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _body(self, path, page, per_page):
+        """Serialized response for a path/page, or None for unknown paths."""
+        for pattern, factory in _SINGLE:
+            match = pattern.search(path)
+            if match:
+                return json.dumps(factory(int(match.group(1)))).encode()
+        for pattern, factory in _COLLECTIONS:
+            if pattern.search(path):
+                total = self.config.items
+                last_page = max(1, -(-total // per_page))
+                first = (page - 1) * per_page
+                rng = random.Random(f"{path}:{page}")
+                data = [factory(i, rng) for i in range(first, min(total, first + per_page))]
+                meta = {
+                    "current_page": page,
+                    "first_page_url": None,
+                    "from": first + 1,
+                    "last_page": last_page,
+                    "per_page": per_page,
+                    "to": first + len(data),
+                    "total": total,
+                }
+                return json.dumps({"meta": meta, "data": data}).encode()
+        return None
+
+    def _fault(self):
+        # Decide under the lock so the injected sequence is reproducible
+        with self._lock:
+            self.stats["requests"] += 1
+            roll = self._rng.random()
+            if roll < self.config.throttle_rate:
+                self.stats["throttled"] += 1
+                return 429
+            if roll < self.config.throttle_rate + self.config.error_rate:
+                self.stats["errors"] += 1
+                return 503
+        return None
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this,
+            # Nagle + delayed ACK adds ~40ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _empty(self, status, headers=()):
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self):
+                if mock.config.latency:
+                    time.sleep(mock.config.latency)
+                fault = mock._fault()
+                if fault == 429:
+                    return self._empty(429, [("Retry-After", str(mock.config.retry_after))])
+                if fault:
+                    return self._empty(fault)
+
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                page = int(query.get("page", ["1"])[0])
+                per_page = int(query.get("per_page", ["25"])[0])
+                body = mock.body(url.path, page, per_page)
+                if body is None:
+                    return self._empty(404)
+
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    with mock._lock:
+                        mock.stats["not_modified"] += 1
+                    return self._empty(304, [("ETag", etag)])
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a synthetic RobotEvents API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        args.latency, args.items, args.error_rate, args.throttle_rate, args.retry_after, args.seed
+    )
+    server = MockRobotEvents(config, port=args.port).start()
+    # First line of output is the base URL so a parent process can read it
+    print(server.base_url, flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+        sys.exit(0)
@@ -0,0 +1,265 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from controllers.async_data import AsyncRobotEvents
+from controllers.cache import ResponseCache
+from controllers.data import RobotEvents
+from controllers.ratelimit import RateLimiter
+from models.endpoints import Endpoints
+
+TEAM_COUNT = 40
+
+
+def _client(base_url, **kwargs):
+    # Memo off unless a scenario asks for it, so every call reaches the cache/network;
+    # a generous limiter so the client, not the limiter, is what gets measured
+    kwargs.setdefault("memo", False)
+    kwargs.setdefault("limiter", RateLimiter(rate=10000, burst=1000, concurrency=16))
+    return RobotEvents(base_url=base_url, backoff_factor=0.01, **kwargs)
+
+
+def single_fetch(base_url, repeat):
+    latencies = []
+    with _client(base_url) as controller:
+        for i in range(repeat * 20):
+            start = time.perf_counter()
+            controller.fetch(Endpoints.TEAM, path_params={"id": i})
+            latencies.append(time.perf_counter() - start)
+    return latencies, len(latencies)
+
+
+def season_pagination(base_url, repeat):
+    latencies, items = [], 0
+    with _client(base_url) as controller:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in controller.iter_all(Endpoints.SEASON_EVENTS, path_params={"id": 197}):
+                items += 1
+            latencies.append(time.perf_counter() - start)
+    return latencies, items
+
+
+def fanout_serial(base_url, repeat):
+    latencies, items = [], 0
+    with _client(base_url) as controller:
+        for _ in range(repeat):
+            for team_id in range(TEAM_COUNT):
+                start = time.perf_counter()
+                result = controller.fetch(
+                    Endpoints.TEAM_MATCHES, path_params={"id": team_id}, params={"per_page": 250}
+                )
+                latencies.append(time.perf_counter() - start)
+                items += len((result or {}).get("data", []))
+    return latencies, items
+
+
+def fanout_async(base_url, repeat):
+    latencies, items = [], 0
+
+    async def one(client, team_id):
+        start = time.perf_counter()
+        result = await client.fetch(
+            Endpoints.TEAM_MATCHES, path_params={"id": team_id}, params={"per_page": 250}
+        )
+        latencies.append(time.perf_counter() - start)
+        return len((result or {}).get("data", []))
+
+    async def run():
+        limiter = RateLimiter(rate=10000, burst=1000, concurrency=16)
+        async with AsyncRobotEvents(
+            base_url=base_url, concurrency=16, memo=False, limiter=limiter
+        ) as client:
+            counts = []
+            for _ in range(repeat):
+                counts += await client.gather_many(one(client, t) for t in range(TEAM_COUNT))
+            return sum(counts)
+
+    items = asyncio.run(run())
+    return latencies, items
+
+
+def _cache_pass(base_url, cache, repeat):
+    latencies = []
+    with _client(base_url, cache=cache) as controller:
+        for i in range(repeat * 20):
+            start = time.perf_counter()
+            controller.fetch(Endpoints.TEAM, path_params={"id": i})
+            latencies.append(time.perf_counter() - start)
+    return latencies, len(latencies)
+
+
+def cache_cold(base_url, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(os.path.join(tmp, "cache.sqlite"))
+        try:
+            return _cache_pass(base_url, cache, repeat)
+        finally:
+            cache.close()
+
+
+@contextmanager
+def warmed_cache(base_url, repeat):
+    """Setup for cache_warm: a cache already holding every response, built untimed."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(os.path.join(tmp, "cache.sqlite"))
+        try:
+            _cache_pass(base_url, cache, repeat)
+            yield {"cache": cache}
+        finally:
+            cache.close()
+
+
+def cache_warm(base_url, repeat, cache):
+    return _cache_pass(base_url, cache, repeat)
+
+
+# name -> (function, mock server options[, setup]); setup(base_url, repeat) is a
+# context manager run outside the timed region, yielding extra kwargs for function
+SCENARIOS = {
+    "single_fetch": (single_fetch, {"latency": 0.005}),
+    "season_pagination": (season_pagination, {"latency": 0.01, "items": 5000}),
+    "fanout_serial": (fanout_serial, {"latency": 0.02, "items": 100}),
+    "fanout_async": (fanout_async, {"latency": 0.02, "items": 100}),
+    "cache_cold": (cache_cold, {"latency": 0.005}),
+    "cache_warm": (cache_warm, {"latency": 0.005}, warmed_cache),
+    "pagination_faults": (
+        season_pagination,
+        {"latency": 0.01, "items": 5000, "error_rate": 0.05, "throttle_rate": 0.05, "retry_after": 0},
+    ),
+}
+
+
+class MockProcess:
+    """Mock server in a child process so its work doesn't skew client numbers."""
+
+    def __init__(self, **options):
+        args = [sys.executable, "-m", "benchmarks.mock_server", "--port", "0"]
+        for name, value in options.items():
+            args += [f"--{name.replace('_', '-')}", str(value)]
+        self.process = subprocess.Popen(args, stdout=subprocess.PIPE, text=True)
+        self.base_url = self.process.stdout.readline().strip()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.process.terminate()
+        self.process.wait()
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(name, repeat, measure_memory=True):
+    function, options, *setup = SCENARIOS[name]
+    setup = setup[0] if setup else lambda base_url, repeat: nullcontext({})
+    with MockProcess(**options) as server:
+        with setup(server.base_url, repeat) as kwargs:
+            start = time.perf_counter()
+            latencies, items = function(server.base_url, repeat, **kwargs)
+            elapsed = time.perf_counter() - start
+
+        peak = None
+        if measure_memory:
+            # Separate pass: tracemalloc slows the client down noticeably
+            with setup(server.base_url, 1) as kwargs:
+                tracemalloc.start()
+                function(server.base_url, 1, **kwargs)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "ops": len(latencies),
+        "items": items,
+        "seconds": elapsed,
+        "ops_per_second": len(latencies) / elapsed if elapsed else None,
+        "items_per_second": items / elapsed if elapsed else None,
+        "latency_ms": {
+            q: percentile(latencies, int(q[1:])) * 1000 if latencies else None
+            for q in ("p50", "p95", "p99")
+        },
+        "peak_memory_bytes": peak,
+        "server": options,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline):
+    """Print per-scenario throughput/p95/memory changes against a baseline report."""
+    print(f"Comparing {current.get('commit')} against {baseline.get('commit')}")
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        changes = []
+        for label, key in (
+            ("throughput", lambda r: r["items_per_second"]),
+            ("p95", lambda r: r["latency_ms"]["p95"]),
+            ("memory", lambda r: r["peak_memory_bytes"]),
+        ):
+            old, new = key(before), key(result)
+            if old and new:
+                changes.append(f"{label} {100 * (new - old) / old:+.1f}%")
+        print(f"  {name}: {', '.join(changes)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the RobotEvents client")
+    parser.add_argument(
+        "scenarios", nargs="*", metavar="SCENARIO", help=f"Any of {', '.join(SCENARIOS)} (default: all)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Iterations per scenario")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="Baseline JSON report to diff against")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak-memory pass")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "scenarios": {},
+    }
+    for name in args.scenarios or SCENARIOS:
+        print(f"Running {name}...", file=sys.stderr)
+        report["scenarios"][name] = run_scenario(name, args.repeat, not args.no_memory)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
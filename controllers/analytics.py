@@ -0,0 +1,175 @@
+import argparse
+from collections import defaultdict, namedtuple
+import numpy as np
+from controllers.data import RobotEvents
+from models.endpoints import Endpoints
+
+# RobotEvents match round codes; OPR is conventionally computed on qualifications
+PRACTICE_ROUND = 1
+QUALIFICATION_ROUND = 2
+
+Ratings = namedtuple("Ratings", ["team_ids", "team_index", "opr", "dpr", "ccwm", "played"])
+Ratings.__doc__ = """
+Least-squares ratings for one event division
+
+team_ids[i] is the team whose ratings are opr[i], dpr[i], ccwm[i];
+team_index maps a team ID back to i. played[i] counts alliances used.
+"""
+
+
+def _id(obj):
+    return obj.get("id") if isinstance(obj, dict) else obj
+
+
+def alliance_rows(matches, rounds=(QUALIFICATION_ROUND,)):
+    """
+    Flatten EVENT_DIVISION_MATCHES rows into one row per alliance
+
+    Unscored matches and sitting teams are skipped.
+
+    Yields:
+        ((event_id, division_id), [team_id, ...], own_score, opponent_score)
+    """
+    for match in matches:
+        if rounds and match.get("round") not in rounds:
+            continue
+        if match.get("scored") is False:
+            continue
+        alliances = match.get("alliances") or []
+        if len(alliances) != 2:
+            continue
+        scores = [alliance.get("score") for alliance in alliances]
+        if None in scores:
+            continue
+        group = (_id(match.get("event")), _id(match.get("division")))
+        for side in (0, 1):
+            teams = [
+                _id(entry.get("team"))
+                for entry in alliances[side].get("teams") or []
+                if not entry.get("sitting")
+            ]
+            if teams:
+                yield group, teams, scores[side], scores[1 - side]
+
+
+def solve(alliance_teams, own_scores, opponent_scores):
+    """
+    Solve OPR/DPR/CCWM for one division
+
+    The alliance-by-team design matrix A has two or three ones per row, so
+    it is never built: the normal equations AᵀA x = Aᵀ[own, opponent] are
+    accumulated straight from the (row, column) membership indices with
+    np.add.at and solved in one least-squares call (teams x teams instead
+    of alliances x teams, and still the minimum-norm solution when teams
+    are not separable). CCWM is OPR - DPR.
+
+    Args:
+        alliance_teams: Sequence of team ID lists, one per alliance
+        own_scores: Score of each alliance
+        opponent_scores: Score of the opposing alliance
+    """
+    counts = np.fromiter((len(teams) for teams in alliance_teams), dtype=np.int64)
+    members = np.fromiter(
+        (team for teams in alliance_teams for team in teams),
+        dtype=np.int64,
+        count=int(counts.sum()),
+    )
+    team_ids, columns = np.unique(members, return_inverse=True)
+    rows = np.repeat(np.arange(len(alliance_teams)), counts)
+
+    # Every (member, partner) pair of an alliance, the member itself included,
+    # adds one to AᵀA
+    starts = np.cumsum(counts) - counts
+    partners = counts[rows]
+    offsets = np.arange(int(partners.sum())) - np.repeat(np.cumsum(partners) - partners, partners)
+    normal = np.zeros((len(team_ids), len(team_ids)))
+    np.add.at(
+        normal,
+        (np.repeat(columns, partners), columns[np.repeat(starts[rows], partners) + offsets]),
+        1.0,
+    )
+
+    scores = np.column_stack(
+        (
+            np.asarray(own_scores, dtype=np.float64),
+            np.asarray(opponent_scores, dtype=np.float64),
+        )
+    )
+    rhs = np.zeros((len(team_ids), 2))
+    np.add.at(rhs, columns, scores[rows])
+    solution, *_ = np.linalg.lstsq(normal, rhs, rcond=None)
+
+    opr = solution[:, 0]
+    dpr = solution[:, 1]
+    return Ratings(
+        team_ids=team_ids,
+        team_index={int(team): i for i, team in enumerate(team_ids)},
+        opr=opr,
+        dpr=dpr,
+        ccwm=opr - dpr,
+        played=np.bincount(columns, minlength=len(team_ids)),
+    )
+
+
+def compute_ratings(matches, rounds=(QUALIFICATION_ROUND,)):
+    """
+    OPR/DPR/CCWM for every event division found in matches
+
+    Accepts any iterable of match rows, e.g. the matches of a whole season
+    streamed from the warehouse; rows are grouped by (event, division) and
+    each group is solved independently.
+
+    Args:
+        matches: Iterable of EVENT_DIVISION_MATCHES / TEAM_MATCHES rows
+        rounds: Round codes to include (None for every round)
+
+    Returns:
+        Dictionary mapping (event_id, division_id) to Ratings
+    """
+    groups = defaultdict(lambda: ([], [], []))
+    for group, teams, own, opponent in alliance_rows(matches, rounds):
+        alliance_teams, own_scores, opponent_scores = groups[group]
+        alliance_teams.append(teams)
+        own_scores.append(own)
+        opponent_scores.append(opponent)
+    return {group: solve(*columns) for group, columns in groups.items()}
+
+
+def ranked(ratings: Ratings, by="opr"):
+    """Rows of (team_id, opr, dpr, ccwm, played) sorted by the given rating."""
+    order = np.argsort(-getattr(ratings, by), kind="stable")
+    return [
+        (
+            int(ratings.team_ids[i]),
+            float(ratings.opr[i]),
+            float(ratings.dpr[i]),
+            float(ratings.ccwm[i]),
+            int(ratings.played[i]),
+        )
+        for i in order
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OPR/DPR/CCWM for an event")
+    parser.add_argument("event_id", type=int)
+    parser.add_argument("--by", choices=["opr", "dpr", "ccwm"], default="opr")
+    args = parser.parse_args()
+
+    with RobotEvents() as controller:
+        event = controller.fetch(Endpoints.EVENT, path_params={"id": args.event_id}) or {}
+        matches = (
+            match
+            for division in event.get("divisions") or []
+            for match in controller.iter_all(
+                Endpoints.EVENT_DIVISION_MATCHES,
+                path_params={"id": args.event_id, "div": division["id"]},
+            )
+        )
+        results = compute_ratings(matches)
+
+    for (event_id, division_id), ratings in results.items():
+        print(f"Event {event_id} division {division_id}")
+        print(f"{'Team':>8} {'OPR':>8} {'DPR':>8} {'CCWM':>8} {'Played':>7}")
+        for team_id, opr, dpr, ccwm, played in ranked(ratings, args.by):
+            print(f"{team_id:>8} {opr:>8.2f} {dpr:>8.2f} {ccwm:>8.2f} {played:>7}")
@@ -0,0 +1,382 @@
+import asyncio
+import aiohttp
+import itertools
+import time
+import yarl
+from multidict import CIMultiDict, CIMultiDictProxy
+from controllers.cassette import Cassette, CassetteMiss
+from controllers.data import API_TOKEN, RobotEvents, build_url
+from controllers.instrumentation import Instrumentation
+from controllers.memo import RequestMemo, request_key
+from controllers.ratelimit import RateLimiter, parse_retry_after
+from models.endpoints import Endpoints
+from models.records import loads
+
+
+def encode_params(params):
+    """
+    Flatten query params into (key, value) pairs the way requests does
+
+    List values become repeated keys (e.g. {"season": [1, 2]} ->
+    season=1&season=2) so both clients send identical query strings.
+    """
+    pairs = []
+    for key, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        pairs.extend((key, str(v)) for v in values if v is not None)
+    return pairs
+
+
+class AsyncRobotEvents:
+    """asyncio counterpart of RobotEvents with the same Endpoints-based API."""
+
+    BASE_URL = RobotEvents.BASE_URL
+    RETRY_STATUSES = RobotEvents.RETRY_STATUSES
+
+    def __init__(
+        self,
+        api_token=None,
+        concurrency=8,
+        connect_timeout=5.0,
+        read_timeout=30.0,
+        max_retries=3,
+        backoff_factor=0.5,
+        base_url=None,
+        cache=None,
+        limiter=None,
+        max_throttle_retries=5,
+        memo=None,
+        instrumentation=None,
+        cassette: Cassette = None,
+    ):
+        """
+        Args:
+            api_token: RobotEvents bearer token (defaults to ROBOT_API_KEY)
+            concurrency: Maximum number of requests in flight at once
+            connect_timeout: Seconds to wait for the TCP/TLS handshake
+            read_timeout: Seconds to wait for the server to send a response
+            max_retries: Retries on 5xx responses and connection resets
+            backoff_factor: Base delay for exponential backoff between retries
+            base_url: Override BASE_URL (e.g. a local stub server or proxy)
+            cache: Optional ResponseCache consulted before every request
+            limiter: RateLimiter to share with other clients (one is created if omitted)
+            max_throttle_retries: How many 429 responses to wait out per request
+            memo: RequestMemo for in-process dedup (one is created if omitted,
+                pass False to disable)
+            instrumentation: Instrumentation receiving a trace per request (one
+                is created if omitted; share it to profile several clients)
+            cassette: Optional Cassette; in record mode every response is also
+                written to it, in replay mode it answers instead of the network
+        """
+        if base_url:
+            self.BASE_URL = base_url
+        self.headers = {
+            "Authorization": f"Bearer {api_token or API_TOKEN}",
+            "Content-Type": "application/json",
+        }
+        self.concurrency = concurrency
+        self.timeout = aiohttp.ClientTimeout(
+            sock_connect=connect_timeout, sock_read=read_timeout
+        )
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.cache = cache
+        self.limiter = limiter or RateLimiter()
+        self.max_throttle_retries = max_throttle_retries
+        self.memo = RequestMemo() if memo is None else memo or None
+        self.instrumentation = instrumentation or Instrumentation()
+        self.cassette = cassette
+        self.session = None
+        self._semaphore = None
+
+    async def open(self):
+        """Create the pooled session; called automatically by ``async with``."""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.concurrency)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=self.timeout,
+                trace_configs=[_trace_config()],
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def close(self):
+        """Close all pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def fetch(self, endpoint: Endpoints, **kwargs):
+        """
+        Generic fetch function that handles all API requests
+
+        Args:
+            endpoint: Endpoint object from Endpoints enum
+            **kwargs: Additional parameters including:
+                - params: Dictionary of query parameters
+                - path_params: Dictionary of path parameters (e.g., {id: 123, div: "blue"})
+        """
+        path_params = kwargs.get("path_params", {})
+        url = build_url(self.BASE_URL, endpoint, path_params)
+
+        # Extract query params if present
+        params = kwargs.get("params", None)
+
+        # Make the GET request
+        try:
+            return await self._get(endpoint, path_params, url, params)
+        except (aiohttp.ClientError, asyncio.TimeoutError, CassetteMiss) as e:
+            print(f"ERROR querying {url}:\n{e}")
+        return
+
+    async def iter_all(
+        self, endpoint: Endpoints, path_params=None, params=None, per_page=250, max_workers=4
+    ):
+        """
+        Async generator over every item of a paginated endpoint
+
+        Mirrors RobotEvents.iter_all: the first page gives meta.last_page,
+        the remaining pages are fetched with at most max_workers in flight,
+        and items are yielded in page order.
+
+        Raises:
+            aiohttp.ClientError: If any page fails
+        """
+        path_params = path_params or {}
+        url = build_url(self.BASE_URL, endpoint, path_params)
+        params = dict(params or {})
+        params["per_page"] = per_page
+
+        first = await self._get(endpoint, path_params, url, {**params, "page": 1})
+        if not isinstance(first, dict) or not isinstance(first.get("data"), list):
+            # Not a paginated response (e.g. a single team), yield it as-is
+            if first is not None:
+                yield first
+            return
+        for item in first["data"]:
+            yield item
+
+        last_page = (first.get("meta") or {}).get("last_page") or 1
+        pages = iter(range(2, last_page + 1))
+        del first
+
+        pending = [
+            asyncio.ensure_future(
+                self._get(endpoint, path_params, url, {**params, "page": page})
+            )
+            for page in itertools.islice(pages, max_workers)
+        ]
+        try:
+            while pending:
+                result = await pending.pop(0)
+                # Keep the window full before handing items to the caller
+                for page in itertools.islice(pages, 1):
+                    pending.append(
+                        asyncio.ensure_future(
+                            self._get(endpoint, path_params, url, {**params, "page": page})
+                        )
+                    )
+                for item in result.get("data", []):
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def gather_many(self, aws, limit=None):
+        """
+        Await many coroutines with bounded concurrency
+
+        Results are returned in the same order as ``aws`` regardless of
+        completion order, so callers can zip them back to their inputs.
+
+        Args:
+            aws: Iterable of awaitables (e.g. one per team)
+            limit: Maximum awaitables running at once (defaults to concurrency)
+        """
+        semaphore = asyncio.Semaphore(limit or self.concurrency)
+
+        async def bounded(aw):
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*(bounded(aw) for aw in aws))
+
+    async def _get(self, endpoint: Endpoints, path_params, url, params):
+        """Issue a GET with retry/backoff, raising on HTTP errors."""
+        await self.open()
+        trace = self.instrumentation.begin(endpoint, url)
+        try:
+            if self.memo is None:
+                return await self._load(endpoint, path_params, url, params, trace)
+            # Identical concurrent or recent requests share one response
+            return await self.memo.get_or_fetch_async(
+                request_key(url, params),
+                lambda: self._load(endpoint, path_params, url, params, trace),
+            )
+        except Exception as e:
+            trace.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            # Untouched by _load means the memo answered
+            trace.cache = trace.cache or "memo"
+            self.instrumentation.finish(trace)
+
+    async def _load(self, endpoint: Endpoints, path_params, url, params, trace):
+        """Serve a GET from the response cache or the network."""
+        if self.cassette is not None and self.cassette.replaying:
+            return await self._replay(url, params, trace)
+
+        # Serve fresh entries from the cache without touching the network
+        # (a cassette sees every request, so it must not be hidden behind it)
+        key = entry = None
+        headers = {}
+        trace.cache = "bypass"
+        if self.cache is not None and self.cassette is None:
+            key = self.cache.key(endpoint, path_params, params)
+            entry = self.cache.get(key)
+            if entry is not None and entry.fresh:
+                trace.cache = "hit"
+                return loads(entry.body)
+            headers = self.cache.conditional_headers(entry)
+            trace.cache = "miss"
+
+        attempt = throttled = 0
+        while True:
+            try:
+                async with self._semaphore, self.limiter.async_slot() as outcome:
+                    trace.limiter += outcome["waited"]
+                    setup = trace.dns + trace.connect
+                    start = time.monotonic()
+                    async with self.session.get(
+                        url, params=encode_params(params), headers=headers, trace_request_ctx=trace
+                    ) as response:
+                        headers_at = time.monotonic()
+                        body = await response.read()
+                        outcome["latency"] = time.monotonic() - start
+                        outcome["status"] = response.status
+                        trace.exchange(
+                            setup, headers_at - start, outcome["latency"] - (headers_at - start)
+                        )
+                        trace.status = response.status
+                        trace.bytes += len(body)
+                        # Wait out throttling; the limiter pauses every caller
+                        if response.status == 429:
+                            trace.throttled += 1
+                            outcome["retry_after"] = parse_retry_after(
+                                response.headers.get("Retry-After")
+                            )
+                            if throttled < self.max_throttle_retries:
+                                throttled += 1
+                                continue
+                        if (
+                            response.status in self.RETRY_STATUSES
+                            and attempt < self.max_retries
+                        ):
+                            raise _RetryableStatus(
+                                response.status,
+                                # Same as the sync client: only a 503 says how long to wait
+                                parse_retry_after(response.headers.get("Retry-After"), 0.0)
+                                if response.status == 503
+                                else 0.0,
+                            )
+                        # A 304 means the stale cached body still holds
+                        if entry is not None and response.status == 304:
+                            trace.cache = "revalidated"
+                            self.cache.revalidated(
+                                key, endpoint, path_params, response.headers
+                            )
+                            return loads(entry.body)
+                        if self.cassette is not None:
+                            self.cassette.record(
+                                url, params, response.status, body, response.headers
+                            )
+                        response.raise_for_status()
+                        data = _decode(body, url)
+                        if self.cache is not None and self.cassette is None:
+                            self.cache.store(
+                                key, endpoint, path_params, url, body, response.headers, data
+                            )
+                        return data
+            except (_RetryableStatus, aiohttp.ClientConnectionError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(
+                    max(self.backoff_factor * (2**attempt), getattr(e, "retry_after", 0.0))
+                )
+                attempt += 1
+                trace.retries += 1
+
+    async def _replay(self, url, params, trace):
+        """Answer from the cassette: no limiter, no network, optional fake latency."""
+        trace.cache = "bypass"
+        start = time.monotonic()
+        if self.cassette.latency:
+            await asyncio.sleep(self.cassette.latency)
+        status, body, headers = self.cassette.play(url, params)
+        trace.exchange(0.0, time.monotonic() - start, 0.0)
+        trace.status = status
+        trace.bytes += len(body)
+        if status != 200:
+            request_info = aiohttp.RequestInfo(yarl.URL(url), "GET", CIMultiDictProxy(CIMultiDict()))
+            raise aiohttp.ClientResponseError(
+                request_info, (), status=status, message=f"Recorded {status} response"
+            )
+        return _decode(body, url)
+
+
+def _decode(body, url):
+    """JSON body of a response; a malformed body raises aiohttp.ClientPayloadError."""
+    try:
+        return loads(body)
+    except ValueError as e:
+        raise aiohttp.ClientPayloadError(f"Invalid JSON in response from {url}: {e}") from e
+
+
+def _trace_config():
+    """
+    aiohttp hooks feeding DNS and connect time into the RequestTrace passed
+    as trace_request_ctx; connection creation covers DNS, so it is subtracted
+    """
+    config = aiohttp.TraceConfig()
+
+    def timer(phase, subtract=None):
+        async def on_start(session, ctx, params):
+            setattr(ctx, f"{phase}_start", time.perf_counter())
+
+        async def on_end(session, ctx, params):
+            trace = ctx.trace_request_ctx
+            started = getattr(ctx, f"{phase}_start", None)
+            if trace is None or started is None:
+                return
+            elapsed = time.perf_counter() - started
+            if subtract:
+                elapsed -= getattr(ctx, f"{subtract}_elapsed", 0.0)
+            setattr(ctx, f"{phase}_elapsed", elapsed)
+            setattr(trace, phase, getattr(trace, phase) + max(0.0, elapsed))
+
+        return on_start, on_end
+
+    dns_start, dns_end = timer("dns")
+    config.on_dns_resolvehost_start.append(dns_start)
+    config.on_dns_resolvehost_end.append(dns_end)
+    connect_start, connect_end = timer("connect", subtract="dns")
+    config.on_connection_create_start.append(connect_start)
+    config.on_connection_create_end.append(connect_end)
+    return config
+
+
+class _RetryableStatus(aiohttp.ClientError):
+    """Internal marker for a 5xx response that should be retried."""
+
+    def __init__(self, status, retry_after=0.0):
+        super().__init__(status)
+        self.status = status
+        self.retry_after = retry_after
@@ -0,0 +1,281 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
+from models.endpoints import Endpoints
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "bhm-vex-api", "responses.sqlite"
+)
+
+# How long (seconds) a cached response is served without revalidation
+DEFAULT_TTL = 300
+ENDPOINT_TTLS = {
+    Endpoints.PROGRAMS: 7 * 86400,
+    Endpoints.PROGRAM: 7 * 86400,
+    Endpoints.SEASONS: 7 * 86400,
+    Endpoints.SEASON: 7 * 86400,
+    Endpoints.SEASON_EVENTS: 6 * 3600,
+    Endpoints.EVENTS: 6 * 3600,
+    Endpoints.TEAMS: 86400,
+    Endpoints.TEAM: 86400,
+    Endpoints.TEAM_EVENTS: 3600,
+    Endpoints.TEAM_MATCHES: 600,
+    Endpoints.TEAM_RANKINGS: 600,
+    Endpoints.TEAM_SKILLS: 600,
+    Endpoints.TEAM_AWARDS: 600,
+    Endpoints.EVENT: 3600,
+    Endpoints.EVENT_TEAMS: 3600,
+    Endpoints.EVENT_SKILLS: 60,
+    Endpoints.EVENT_AWARDS: 60,
+    Endpoints.EVENT_DIVISION_MATCHES: 60,
+    Endpoints.EVENT_DIVISION_FINALIST_RANKINGS: 60,
+    Endpoints.EVENT_DIVISION_RANKINGS: 60,
+}
+
+# Endpoints scoped to a single event; frozen once that event is finished
+EVENT_SCOPED = {
+    Endpoints.EVENT,
+    Endpoints.EVENT_TEAMS,
+    Endpoints.EVENT_SKILLS,
+    Endpoints.EVENT_AWARDS,
+    Endpoints.EVENT_DIVISION_MATCHES,
+    Endpoints.EVENT_DIVISION_FINALIST_RANKINGS,
+    Endpoints.EVENT_DIVISION_RANKINGS,
+}
+
+# Endpoints whose payloads are event objects with an "end" date
+EVENT_PAYLOADS = {
+    Endpoints.EVENT,
+    Endpoints.EVENTS,
+    Endpoints.TEAM_EVENTS,
+    Endpoints.SEASON_EVENTS,
+}
+
+# Results and awards are often posted a few days after an event ends
+FINISHED_GRACE = timedelta(days=3)
+
+CacheEntry = namedtuple(
+    "CacheEntry", ["body", "etag", "last_modified", "stored_at", "fresh"]
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS finished_events (
+    event_id INTEGER PRIMARY KEY
+);
+"""
+
+
+class ResponseCache:
+    """
+    SQLite-backed HTTP response cache used under RobotEvents.fetch
+
+    Entries expire per endpoint (see ENDPOINT_TTLS) and are then revalidated
+    with If-None-Match/If-Modified-Since. Responses for events that have
+    finished are stored without an expiry. The total body size is capped
+    and least recently used entries are evicted first.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=256 * 1024 * 1024, ttls=None):
+        """
+        Args:
+            path: SQLite database file (":memory:" for a throwaway cache)
+            max_bytes: Maximum total size of cached bodies before eviction
+            ttls: Per-endpoint TTL overrides in seconds, merged over ENDPOINT_TTLS
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = {**ENDPOINT_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._finished = {
+            row[0] for row in self._conn.execute("SELECT event_id FROM finished_events")
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def key(endpoint: Endpoints, path_params=None, params=None):
+        """
+        Canonical cache key for a request
+
+        Query params are normalized so that key order, scalar-vs-list and
+        list order do not produce different keys for the same request.
+        """
+        normalized = {}
+        for name, value in (params or {}).items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                normalized[name] = sorted(str(v) for v in value)
+            else:
+                normalized[name] = [str(value)]
+        path = {name: str(value) for name, value in (path_params or {}).items()}
+        return json.dumps([endpoint.name, path, normalized], sort_keys=True)
+
+    def get(self, key):
+        """Return the CacheEntry for key (fresh or stale) or None."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, stored_at, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+        body, etag, last_modified, stored_at, expires_at = row
+        fresh = expires_at is None or expires_at > now
+        return CacheEntry(body, etag, last_modified, stored_at, fresh)
+
+    def conditional_headers(self, entry):
+        """Headers that let the server answer 304 for an unchanged entry."""
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        elif not entry.etag:
+            headers["If-Modified-Since"] = formatdate(entry.stored_at, usegmt=True)
+        return headers
+
+    def store(self, key, endpoint: Endpoints, path_params, url, body, headers, data=None):
+        """
+        Cache a 200 response
+
+        Args:
+            key: Key from ResponseCache.key
+            endpoint: Endpoint the response came from
+            path_params: Path parameters of the request
+            url: Full request URL (kept for debugging)
+            body: Raw response bytes
+            headers: Response headers (for ETag/Last-Modified)
+            data: Decoded JSON, used to spot finished events
+        """
+        if data is not None and endpoint in EVENT_PAYLOADS:
+            self._remember_finished(data)
+        now = time.time()
+        expires_at = self._expires_at(endpoint, path_params, now)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, body, etag, last_modified, stored_at, expires_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    body,
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    now,
+                    expires_at,
+                    now,
+                    len(body),
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def revalidated(self, key, endpoint: Endpoints, path_params, headers):
+        """Extend an entry's lifetime after the server answered 304."""
+        now = time.time()
+        expires_at = self._expires_at(endpoint, path_params, now)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE key = ?",
+                (expires_at, now, headers.get("ETag"), headers.get("Last-Modified"), key),
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def _expires_at(self, endpoint, path_params, now):
+        # None means immutable: never expires, never revalidated
+        if endpoint in EVENT_SCOPED and self._event_id(path_params) in self._finished:
+            return None
+        return now + self.ttls.get(endpoint, DEFAULT_TTL)
+
+    @staticmethod
+    def _event_id(path_params):
+        try:
+            return int((path_params or {}).get("id"))
+        except (TypeError, ValueError):
+            return None
+
+    def _remember_finished(self, data):
+        events = data.get("data") if isinstance(data, dict) and "data" in data else data
+        if isinstance(events, dict):
+            events = [events]
+        if not isinstance(events, list):
+            return
+        cutoff = datetime.now(timezone.utc) - FINISHED_GRACE
+        finished = []
+        for event in events:
+            if not isinstance(event, dict) or not event.get("end") or "id" not in event:
+                continue
+            try:
+                end = datetime.fromisoformat(event["end"])
+            except (TypeError, ValueError):
+                continue
+            if end.tzinfo is None:
+                end = end.replace(tzinfo=timezone.utc)
+            if end < cutoff and event["id"] not in self._finished:
+                finished.append(event["id"])
+        if finished:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO finished_events (event_id) VALUES (?)",
+                    [(event_id,) for event_id in finished],
+                )
+                self._conn.commit()
+            self._finished.update(finished)
+
+    def _evict(self):
+        # Caller holds the lock; drop least recently used rows over the cap
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        )
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
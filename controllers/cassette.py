@@ -0,0 +1,154 @@
+import argparse
+import base64
+import hashlib
+import json
+import threading
+import zipfile
+from http import HTTPStatus
+from urllib.parse import urlsplit
+import requests
+from requests.structures import CaseInsensitiveDict
+from controllers.memo import request_key
+
+# Response headers worth keeping; the rest (dates, cookies, ...) would only
+# make recordings differ between runs
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+
+
+class CassetteMiss(requests.exceptions.RequestException):
+    """Raised when replaying a request that was never recorded."""
+
+
+class Cassette:
+    """
+    Record/replay archive of RobotEvents responses
+
+    In "record" mode every response the client receives is written to a
+    zip archive, one deflated JSON member per request, named after a hash
+    of the request's path and sorted params (the host is left out, so a
+    cassette recorded against the API replays against a stub and vice
+    versa). In "replay" mode requests are answered from the archive with
+    no network access at all, optionally after a simulated latency.
+
+    Recording keeps the first response seen for each request, and adds to
+    an existing archive rather than replacing it. Bodies are stored as
+    text, or as base64 when they are not valid UTF-8.
+    """
+
+    def __init__(self, path, mode="replay", latency=0.0):
+        """
+        Args:
+            path: Archive file (conventionally .zip)
+            mode: "record" or "replay"
+            latency: Seconds to wait before each replayed response
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._zip = zipfile.ZipFile(
+            path, "a" if mode == "record" else "r", compression=zipfile.ZIP_DEFLATED
+        )
+        self._names = set(self._zip.namelist())
+
+    @property
+    def replaying(self):
+        return self.mode == "replay"
+
+    @staticmethod
+    def key(url, params=None):
+        """Host-independent canonical key: URL path plus sorted query params."""
+        return request_key(urlsplit(url).path, params)
+
+    @staticmethod
+    def _member(key):
+        return hashlib.sha1(key.encode()).hexdigest() + ".json"
+
+    def record(self, url, params, status, body, headers=None):
+        """Store one response (a no-op outside record mode or for known requests)."""
+        if self.mode != "record":
+            return
+        key = self.key(url, params)
+        member = self._member(key)
+        entry = {
+            "key": key,
+            "status": status,
+            "headers": {
+                name: headers[name] for name in RECORDED_HEADERS if headers and name in headers
+            },
+        }
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        try:
+            entry["body"] = bytes(body).decode("utf-8")
+        except UnicodeDecodeError:
+            # Bodies that are not text (e.g. a mangled error page) are kept as base64
+            entry["body"] = base64.b64encode(body).decode("ascii")
+            entry["encoding"] = "base64"
+        with self._lock:
+            if member in self._names:
+                return
+            self._zip.writestr(member, json.dumps(entry))
+            self._names.add(member)
+
+    def play(self, url, params=None):
+        """
+        Recorded (status, body bytes, headers) for a request
+
+        Raises:
+            CassetteMiss: If the request is not in the archive
+        """
+        key = self.key(url, params)
+        member = self._member(key)
+        if member not in self._names:
+            self.misses += 1
+            raise CassetteMiss(f"No recorded response for {key} in {self.path}")
+        self.hits += 1
+        entry = json.loads(self._zip.read(member))
+        if entry.get("encoding") == "base64":
+            body = base64.b64decode(entry["body"])
+        else:
+            body = entry["body"].encode("utf-8")
+        return entry["status"], body, entry["headers"]
+
+    def response(self, url, params=None):
+        """play() as a requests.Response, for the synchronous client."""
+        status, body, headers = self.play(url, params)
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response._content_consumed = True
+        response.headers = CaseInsensitiveDict(headers)
+        response.url = url
+        response.reason = HTTPStatus(status).phrase if status in HTTPStatus._value2member_map_ else ""
+        response.encoding = "utf-8"
+        return response
+
+    def __len__(self):
+        return len(self._names)
+
+    def close(self):
+        """Close the archive; required in record mode to finish the zip file."""
+        with self._lock:
+            self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List the requests recorded in a cassette")
+    parser.add_argument("path", help="Cassette archive")
+    args = parser.parse_args()
+
+    with zipfile.ZipFile(args.path) as archive:
+        for info in archive.infolist():
+            entry = json.loads(archive.read(info))
+            print(f"{entry['status']} {len(entry['body']):>9} B  {entry['key']}")
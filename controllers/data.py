@@ -1,19 +1,170 @@
 import requests
+import itertools
 import os
 import pprint
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from controllers.cassette import Cassette
+from controllers.instrumentation import InstrumentedAdapter, Instrumentation
+from controllers.memo import RequestMemo, request_key
+from controllers.ratelimit import RateLimiter, parse_retry_after
+from controllers.stream import PageReader
 from models.endpoints import Endpoints
+from models.records import decode, loads, record_type_for
 
 API_TOKEN = os.getenv("ROBOT_API_KEY")
 
+# gzip always, plus brotli when urllib3 can decode it (pip install brotli)
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+def build_url(base_url, endpoint: Endpoints, path_params):
+    """
+    Build the full URL for an endpoint
+
+    Args:
+        base_url: API root, e.g. RobotEvents.BASE_URL
+        endpoint: Endpoint object from Endpoints enum
+        path_params: Dictionary of path parameters (e.g., {id: 123, div: "blue"})
+    """
+    # Get the endpoint path pattern
+    url_pattern = f"{base_url}{endpoint.value}"
+
+    # Replace any path parameters in the URL
+    try:
+        return url_pattern.format(**path_params) if path_params else url_pattern
+    except KeyError as e:
+        # Map specific keys based on endpoint
+        if "team_id" in path_params and str(e) == "'id'":
+            # If team_id is provided but the URL expects 'id'
+            path_params["id"] = path_params["team_id"]
+            return url_pattern.format(**path_params)
+        else:
+            raise KeyError(f"Missing required path parameter: {e}")
+
+
+def _decode(response):
+    """
+    JSON body of a response
+
+    Raises:
+        requests.exceptions.InvalidJSONError: For a malformed body (e.g. an
+            HTML error page), so callers catching RequestException handle it
+            like any other failed request
+    """
+    try:
+        return loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON in response from {response.url}: {e}", response=response
+        ) from e
+
+
+class _Retry(Retry):
+    """
+    Retry that honors Retry-After on 503 only
+
+    429s are left to the shared RateLimiter so every caller backs off, so
+    urllib3 must not retry them on its own when they carry Retry-After.
+    """
+
+    RETRY_AFTER_STATUS_CODES = frozenset({503})
+
 
 class RobotEvents:
     BASE_URL = "https://www.robotevents.com/api/v2"
 
-    def __init__(self, api_token=None):
+    # Server-side failures worth retrying; client errors are returned as-is
+    RETRY_STATUSES = (500, 502, 503, 504)
+
+    def __init__(
+        self,
+        api_token=None,
+        pool_size=10,
+        connect_timeout=5.0,
+        read_timeout=30.0,
+        max_retries=3,
+        backoff_factor=0.5,
+        base_url=None,
+        cache=None,
+        limiter=None,
+        max_throttle_retries=5,
+        memo=None,
+        instrumentation=None,
+        cassette: Cassette = None,
+    ):
+        """
+        Args:
+            api_token: RobotEvents bearer token (defaults to ROBOT_API_KEY)
+            pool_size: Number of keep-alive connections kept open per host
+            connect_timeout: Seconds to wait for the TCP/TLS handshake
+            read_timeout: Seconds to wait for the server to send a response
+            max_retries: Retries on 5xx responses and connection resets
+            backoff_factor: Base delay for exponential backoff between retries
+            base_url: Override BASE_URL (e.g. a local stub server or proxy)
+            cache: Optional ResponseCache consulted before every request
+            limiter: RateLimiter to share with other clients (one is created if omitted)
+            max_throttle_retries: How many 429 responses to wait out per request
+            memo: RequestMemo for in-process dedup (one is created if omitted,
+                pass False to disable). Memoized responses are shared between
+                callers, so copy a result before mutating it
+            instrumentation: Instrumentation receiving a trace per request (one
+                is created if omitted; share it to profile several clients)
+            cassette: Optional Cassette; in record mode every response is also
+                written to it, in replay mode it answers instead of the network
+        """
+        if base_url:
+            self.BASE_URL = base_url
         self.headers = {
             "Authorization": f"Bearer {api_token or API_TOKEN}",
             "Content-Type": "application/json",
         }
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = self._build_session(pool_size, max_retries, backoff_factor)
+        self.cache = cache
+        self.limiter = limiter or RateLimiter()
+        self.max_throttle_retries = max_throttle_retries
+        self.memo = RequestMemo() if memo is None else memo or None
+        self.instrumentation = instrumentation or Instrumentation()
+        self.cassette = cassette
+
+    def _build_session(self, pool_size, max_retries, backoff_factor):
+        """Create a pooled keep-alive session that retries transient failures."""
+        retry = _Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        # Same as HTTPAdapter, but new connections report DNS/connect time
+        adapter = InstrumentedAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self.headers)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        return session
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def fetch(self, endpoint: Endpoints, **kwargs):
         """
@@ -24,58 +175,399 @@ class RobotEvents:
             **kwargs: Additional parameters including:
                 - params: Dictionary of query parameters
                 - path_params: Dictionary of path parameters (e.g., {id: 123, div: "blue"})
-        """
-        # Get the endpoint path pattern
-        url_pattern = f"{self.BASE_URL}{endpoint.value}"
 
-        # Replace any path parameters in the URL
+        Returns:
+            The decoded response, or None on error. With the memo enabled the
+            same object may be returned to other callers; treat it as read-only.
+        """
         path_params = kwargs.get("path_params", {})
-        try:
-            url = url_pattern.format(**path_params) if path_params else url_pattern
-        except KeyError as e:
-            # Map specific keys based on endpoint
-            if "team_id" in path_params and str(e) == "'id'":
-                # If team_id is provided but the URL expects 'id'
-                path_params["id"] = path_params["team_id"]
-                url = url_pattern.format(**path_params)
-            else:
-                raise KeyError(f"Missing required path parameter: {e}")
+        url = self._build_url(endpoint, path_params)
 
         # Extract query params if present
         params = kwargs.get("params", None)
 
         # Make the GET request
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            return self._handle_response(response)
+            return self._get(endpoint, path_params, url, params)
         except requests.exceptions.RequestException as e:
             print(f"ERROR querying {url}:\n{e}")
         return
 
-    def _handle_response(self, response):
+    def get(self, endpoint: Endpoints, path_params=None, params=None):
+        """
+        Same request as fetch, but errors are raised instead of printed
+
+        Goes through the memo and response cache like every other call, so
+        the result may be shared and must not be mutated.
+
+        Args:
+            endpoint: Endpoint object from Endpoints enum
+            path_params: Dictionary of path parameters
+            params: Dictionary of query parameters
+
+        Raises:
+            requests.exceptions.RequestException: On HTTP or connection errors
+        """
+        path_params = path_params or {}
+        return self._get(endpoint, path_params, self._build_url(endpoint, path_params), params)
+
+    def iter_all(
+        self, endpoint: Endpoints, path_params=None, params=None, per_page=250, max_workers=4
+    ):
+        """
+        Stream every item from a paginated endpoint, one item at a time
+
+        The first page is fetched to read meta.last_page, then the remaining
+        pages are fetched concurrently. At most max_workers pages are in
+        flight or buffered at once, and items are yielded in page order.
+
+        Args:
+            endpoint: Endpoint object from Endpoints enum
+            path_params: Dictionary of path parameters
+            params: Dictionary of query parameters (page/per_page are managed here)
+            per_page: Page size to request (the API caps this at 250)
+            max_workers: Maximum number of pages fetched concurrently
+
+        Raises:
+            requests.exceptions.RequestException: If any page fails, so that
+                a partial result is never mistaken for a complete one
+        """
+        path_params = path_params or {}
+        url = self._build_url(endpoint, path_params)
+        params = dict(params or {})
+        params["per_page"] = per_page
+
+        first = self._get(endpoint, path_params, url, {**params, "page": 1})
+        if not isinstance(first, dict) or not isinstance(first.get("data"), list):
+            # Not a paginated response (e.g. a single team), yield it as-is
+            if first is not None:
+                yield first
+            return
+        yield from first["data"]
+
+        last_page = (first.get("meta") or {}).get("last_page") or 1
+        pages = iter(range(2, last_page + 1))
+        del first
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pending = deque(
+                pool.submit(
+                    self._get, endpoint, path_params, url, {**params, "page": page}
+                )
+                for page in itertools.islice(pages, max_workers)
+            )
+            try:
+                while pending:
+                    result = pending.popleft().result()
+                    # Keep the window full before handing items to the caller
+                    for page in itertools.islice(pages, 1):
+                        pending.append(
+                            pool.submit(
+                                self._get,
+                                endpoint,
+                                path_params,
+                                url,
+                                {**params, "page": page},
+                            )
+                        )
+                    yield from result.get("data", [])
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iter_records(self, endpoint: Endpoints, path_params=None, params=None, **kwargs):
+        """
+        Same items as iter_all, but as compact typed records (models.records)
+
+        Pages are streamed (see iter_stream) and each row goes from its
+        bytes straight to a record, so at most one row's dict is alive at
+        a time and holding a season of matches costs the records alone.
+
+        Args:
+            endpoint: Endpoint object from Endpoints enum
+            path_params: Dictionary of path parameters
+            params: Dictionary of query parameters
+            **kwargs: per_page / chunk_size, as for iter_stream
+
+        Raises:
+            ValueError: For endpoints without a record type (e.g. SEASONS)
+            requests.exceptions.RequestException: If any page fails
+        """
+        record_type = record_type_for(endpoint)
+        rows = self.iter_stream(
+            endpoint,
+            path_params=path_params,
+            params=params,
+            row=lambda span: decode(span, record_type),
+            **kwargs,
+        )
+        for item in rows:
+            # A single-object response comes back as its decoded fields
+            yield record_type.from_dict(item) if isinstance(item, dict) else item
+
+    def iter_stream(
+        self,
+        endpoint: Endpoints,
+        path_params=None,
+        params=None,
+        per_page=250,
+        chunk_size=64 * 1024,
+        row=loads,
+    ):
+        """
+        Same items as iter_all, but each page is parsed while it downloads
+
+        Rows are decoded one at a time as their bytes arrive (see
+        PageReader) and pages are fetched one after another, so peak
+        memory stays flat however large per_page is. Streamed pages skip
+        the memo and the response cache.
+
+        Args:
+            endpoint: Endpoint object from Endpoints enum
+            path_params: Dictionary of path parameters
+            params: Dictionary of query parameters (page/per_page are managed here)
+            per_page: Page size to request
+            chunk_size: Bytes read from the connection at a time
+            row: Decoder for each row's bytes (default: JSON -> dict)
+
+        Raises:
+            requests.exceptions.RequestException: If any page fails
+        """
+        path_params = path_params or {}
+        url = self._build_url(endpoint, path_params)
+        params = dict(params or {})
+        params["per_page"] = per_page
+
+        page = last_page = 1
+        while page <= last_page:
+            with self._stream(endpoint, url, {**params, "page": page}, chunk_size, row) as reader:
+                yield from reader.items()
+                if not reader.paginated:
+                    # Not a paginated response (e.g. a single team), yield it as-is
+                    yield reader.fields
+                    return
+            last_page = (reader.fields.get("meta") or {}).get("last_page") or 1
+            page += 1
+
+    def fetch_meta(self, endpoint: Endpoints, path_params=None, params=None, per_page=250):
+        """
+        The "meta" object of a page (total, last_page, ...) without decoding its rows
+
+        Raises:
+            requests.exceptions.RequestException: On HTTP or connection errors
+        """
+        path_params = path_params or {}
+        url = self._build_url(endpoint, path_params)
+        params = {**(params or {}), "per_page": per_page}
+        with self._stream(endpoint, url, params) as reader:
+            meta = reader.read_meta()
+            reader.drain()
+        return meta
+
+    @contextmanager
+    def _stream(self, endpoint: Endpoints, url, params, chunk_size=64 * 1024, row=loads):
+        """Send a GET and yield a PageReader over its (decompressed) body."""
+        trace = self.instrumentation.begin(endpoint, url)
+        trace.cache = "bypass"
+        response = None
+        try:
+            # A cassette needs the whole body to record it, so nothing is streamed
+            response = self._send(url, params, None, trace, stream=self.cassette is None)
+            if response.status_code != 200:
+                response.raise_for_status()
+            started = time.monotonic()
+            reader = PageReader(response.iter_content(chunk_size), row)
+            try:
+                yield reader
+            except ValueError as e:
+                # Same contract as _handle_response: a bad body is a failed request
+                raise requests.exceptions.InvalidJSONError(
+                    f"Invalid JSON in response from {response.url}: {e}", response=response
+                ) from e
+            finally:
+                trace.download += time.monotonic() - started
+                if self.cassette is None:
+                    trace.bytes += reader.bytes
+        except Exception as e:
+            trace.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if response is not None:
+                response.close()
+            self.instrumentation.finish(trace)
+
+    def fetch_if_changed(self, endpoint: Endpoints, path_params=None, params=None, validators=None):
+        """
+        Conditional GET for polling, bypassing the memo and response cache
+
+        Args:
+            endpoint: Endpoint object from Endpoints enum
+            path_params: Dictionary of path parameters
+            params: Dictionary of query parameters
+            validators: Headers returned by the previous call for this request
+
+        Returns:
+            (data, validators): data is None if the server answered 304 Not
+            Modified; pass validators back in on the next poll
+
+        Raises:
+            requests.exceptions.RequestException: On HTTP or connection errors
+        """
+        path_params = path_params or {}
+        url = self._build_url(endpoint, path_params)
+        trace = self.instrumentation.begin(endpoint, url)
+        try:
+            response = self._send(url, params, validators, trace)
+            if response.status_code == 304 and validators:
+                trace.cache = "revalidated"
+                return None, validators
+            trace.cache = "bypass"
+            data = self._handle_response(response)
+        except Exception as e:
+            trace.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.instrumentation.finish(trace)
+
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        return data, validators
+
+    def _build_url(self, endpoint: Endpoints, path_params):
+        """Fill the endpoint's path pattern with path_params."""
+        return build_url(self.BASE_URL, endpoint, path_params)
+
+    def _get(self, endpoint: Endpoints, path_params, url, params):
+        """Issue a GET on the pooled session, raising on HTTP errors."""
+        trace = self.instrumentation.begin(endpoint, url)
+        try:
+            if self.memo is None:
+                return self._load(endpoint, path_params, url, params, trace)
+            # Identical concurrent or recent requests share one response
+            return self.memo.get_or_fetch(
+                request_key(url, params),
+                lambda: self._load(endpoint, path_params, url, params, trace),
+            )
+        except Exception as e:
+            trace.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            # Untouched by _load means the memo answered
+            trace.cache = trace.cache or "memo"
+            self.instrumentation.finish(trace)
+
+    def _load(self, endpoint: Endpoints, path_params, url, params, trace):
+        """Serve a GET from the response cache or the network."""
+        # A cassette sees every request, so it must not be hidden behind the cache
+        if self.cache is None or self.cassette is not None:
+            trace.cache = "bypass"
+            return self._handle_response(self._send(url, params, None, trace))
+
+        # Serve fresh entries from the cache without touching the network
+        key = self.cache.key(endpoint, path_params, params)
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            trace.cache = "hit"
+            return loads(entry.body)
+
+        # Stale entries are revalidated; a 304 means the cached body still holds
+        trace.cache = "miss"
+        response = self._send(url, params, self.cache.conditional_headers(entry), trace)
+        if entry is not None and response.status_code == 304:
+            trace.cache = "revalidated"
+            self.cache.revalidated(key, endpoint, path_params, response.headers)
+            return loads(entry.body)
+
+        data = self._handle_response(response)
         if response.status_code == 200:
-            return response.json()
-        else:
-            response.raise_for_status()
+            self.cache.store(
+                key, endpoint, path_params, url, response.content, response.headers, data
+            )
+        return data
+
+    def _send(self, url, params, headers, trace, stream=False):
+        """
+        GET through the shared rate limiter, waiting out 429 responses
+
+        With stream=True the body of a 200 response is left unread for the
+        caller (see _stream); other responses are always read.
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            return self._replay(url, params, trace)
+        attempt = 0
+        while True:
+            with self.limiter.slot() as outcome, self.instrumentation.activate(trace):
+                trace.limiter += outcome["waited"]
+                setup = trace.dns + trace.connect
+                start = time.monotonic()
+                # Streamed so time to headers and body download are measured apart
+                response = self.session.get(
+                    url, params=params, headers=headers, timeout=self.timeout, stream=True
+                )
+                headers_at = time.monotonic()
+                body = b"" if stream and response.status_code == 200 else response.content
+                outcome["latency"] = time.monotonic() - start
+                outcome["status"] = response.status_code
+                trace.exchange(setup, headers_at - start, outcome["latency"] - (headers_at - start))
+                trace.status = response.status_code
+                trace.bytes += len(body)
+                retries = getattr(response.raw, "retries", None)
+                trace.retries += len(retries.history) if retries is not None else 0
+                if response.status_code == 429:
+                    trace.throttled += 1
+                    outcome["retry_after"] = parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+            if response.status_code != 429 or attempt >= self.max_throttle_retries:
+                if self.cassette is not None and not stream:
+                    self.cassette.record(
+                        url, params, response.status_code, body, response.headers
+                    )
+                return response
+            attempt += 1
+
+    def _replay(self, url, params, trace):
+        """Answer from the cassette: no limiter, no network, optional fake latency."""
+        start = time.monotonic()
+        if self.cassette.latency:
+            time.sleep(self.cassette.latency)
+        response = self.cassette.response(url, params)
+        trace.exchange(trace.dns + trace.connect, time.monotonic() - start, 0.0)
+        trace.status = response.status_code
+        trace.bytes += len(response.content)
+        return response
+
+    def _handle_response(self, response):
+        if 200 <= response.status_code < 300:
+            # 204 No Content (or any empty 2xx) is an empty result, not None
+            return _decode(response) if response.content else {}
+        response.raise_for_status()
+        # raise_for_status lets 1xx/3xx through; they are not results either
+        raise requests.exceptions.HTTPError(
+            f"Unexpected status {response.status_code} for url: {response.url}",
+            response=response,
+        )
 
 
 if __name__ == "__main__":
-    controller = RobotEvents()
-
-    # Example of getting data for a single team
-    # Using a specific team ID (e.g. 1234)
-    team_id = 171256
-    per_page = 50
-    team_data = controller.fetch(Endpoints.TEAM, path_params={"team_id": team_id})
-    print(f"Team {team_id} details:")
-    pprint.pprint(team_data)
-
-    # You can also fetch team's events
-    team_events = controller.fetch(
-        Endpoints.TEAM_EVENTS,
-        path_params={"team_id": team_id},
-        params={"per_page": per_page},
-    )
-    print(f"\nEvents for team {team_id}:")
-    pprint.pprint(team_events)
+    with RobotEvents() as controller:
+        # Example of getting data for a single team
+        # Using a specific team ID (e.g. 1234)
+        team_id = 171256
+        per_page = 50
+        team_data = controller.fetch(Endpoints.TEAM, path_params={"team_id": team_id})
+        print(f"Team {team_id} details:")
+        pprint.pprint(team_data)
+
+        # You can also fetch team's events (reuses the same pooled connection)
+        team_events = controller.fetch(
+            Endpoints.TEAM_EVENTS,
+            path_params={"team_id": team_id},
+            params={"per_page": per_page},
+        )
+        print(f"\nEvents for team {team_id}:")
+        pprint.pprint(team_events)
 
@@ -0,0 +1,232 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+from controllers.data import RobotEvents
+from models.endpoints import Endpoints
+
+# Lists of dicts with one of these keys are keyed by its value instead of
+# by position, e.g. alliances -> alliances.red.score / alliances.blue.score
+LIST_DISCRIMINATORS = ("color",)
+
+# Flattened keys that did not appear in the schema sample land here as JSON
+EXTRA_COLUMN = "_extra"
+
+FORMATS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".parquet": "parquet",
+}
+
+
+def flatten(obj, prefix=""):
+    """
+    Flatten a nested API object into a single-level dict with dotted keys
+
+    Nested dicts become "location.city". Lists of dicts become
+    "alliances.red.score" when the items carry a discriminator such as
+    color, otherwise "teams.0.team.name". Lists of scalars are kept as a
+    JSON string so each row still has one value per column.
+    """
+    flat = {}
+    _flatten_into(flat, obj, prefix)
+    return flat
+
+
+def _flatten_into(flat, value, key):
+    if isinstance(value, dict):
+        if not value and key:
+            flat[key] = None
+        for name, child in value.items():
+            _flatten_into(flat, child, f"{key}.{name}" if key else str(name))
+    elif isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
+        discriminator = next(
+            (
+                d
+                for d in LIST_DISCRIMINATORS
+                if len({item.get(d) for item in value}) == len(value)
+                and all(item.get(d) is not None for item in value)
+            ),
+            None,
+        )
+        for index, item in enumerate(value):
+            label = item[discriminator] if discriminator else index
+            _flatten_into(flat, item, f"{key}.{label}")
+    elif isinstance(value, list):
+        flat[key] = json.dumps(value) if value else None
+    else:
+        flat[key] = value
+
+
+class _Schema:
+    """Column order fixed from a sample; unseen keys go to EXTRA_COLUMN."""
+
+    def __init__(self, sample):
+        columns = {}
+        for row in sample:
+            for key in row:
+                columns.setdefault(key, None)
+        self.columns = list(columns)
+        self._known = set(self.columns)
+
+    def project(self, row):
+        extra = {k: v for k, v in row.items() if k not in self._known}
+        projected = {column: row.get(column) for column in self.columns}
+        projected[EXTRA_COLUMN] = json.dumps(extra, default=str) if extra else None
+        return projected
+
+
+def _write_csv(rows, path, sample_size):
+    rows = (flatten(row) for row in rows)
+    sample = list(itertools.islice(rows, sample_size))
+    schema = _Schema(sample)
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=schema.columns + [EXTRA_COLUMN])
+        writer.writeheader()
+        for row in itertools.chain(sample, rows):
+            writer.writerow(schema.project(row))
+            count += 1
+    return count
+
+
+def _write_ndjson(rows, path):
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, separators=(",", ":"), default=str))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def _write_parquet(rows, path, sample_size, batch_size):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    rows = (flatten(row) for row in rows)
+    sample = list(itertools.islice(rows, sample_size))
+    schema = _Schema(sample)
+
+    # Infer column types from the sample; all-null or mixed columns become strings
+    inferred = {}
+    for column in schema.columns:
+        try:
+            arrow_type = pa.array([row.get(column) for row in sample]).type
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrow_type = pa.string()
+        inferred[column] = pa.string() if pa.types.is_null(arrow_type) else arrow_type
+    arrow_schema = pa.schema(
+        [pa.field(column, inferred[column]) for column in schema.columns]
+        + [pa.field(EXTRA_COLUMN, pa.string())]
+    )
+
+    def to_batch(chunk):
+        projected = [schema.project(row) for row in chunk]
+        arrays = []
+        for field in arrow_schema:
+            values = [row[field.name] for row in projected]
+            try:
+                arrays.append(pa.array(values, type=field.type))
+                continue
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                pass
+            # A later row disagreed with the sampled type: move the offending
+            # values into _extra so the column keeps its type and nothing is lost
+            for row in projected:
+                try:
+                    pa.array([row[field.name]], type=field.type)
+                except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                    extra = json.loads(row[EXTRA_COLUMN] or "{}")
+                    extra[field.name] = row[field.name]
+                    row[EXTRA_COLUMN] = json.dumps(extra, default=str)
+                    row[field.name] = None
+            arrays.append(pa.array([row[field.name] for row in projected], type=field.type))
+        # _extra is last in the schema and may have been updated above
+        arrays[-1] = pa.array([row[EXTRA_COLUMN] for row in projected], type=pa.string())
+        return pa.RecordBatch.from_arrays(arrays, schema=arrow_schema)
+
+    count = 0
+    stream = itertools.chain(sample, rows)
+    with pq.ParquetWriter(path, arrow_schema) as writer:
+        while True:
+            chunk = list(itertools.islice(stream, batch_size))
+            if not chunk:
+                break
+            writer.write_batch(to_batch(chunk))
+            count += len(chunk)
+    return count
+
+
+def export_rows(rows, path, format=None, sample_size=1000, batch_size=10000):
+    """
+    Stream API rows to a CSV, NDJSON or Parquet file
+
+    Rows are consumed one at a time, so passing RobotEvents.iter_all(...)
+    exports a whole season without holding it in memory. CSV and Parquet
+    rows are flattened (see flatten) against a column schema taken from
+    the first sample_size rows; keys first seen later are kept as JSON in
+    the _extra column. NDJSON keeps each object as-is.
+
+    Args:
+        rows: Iterable of API objects (dicts)
+        path: Output file
+        format: "csv", "ndjson" or "parquet" (inferred from the extension if omitted)
+        sample_size: Rows buffered to fix the column schema
+        batch_size: Rows per Parquet record batch
+
+    Returns:
+        Number of rows written
+    """
+    if format is None:
+        format = FORMATS.get(os.path.splitext(path)[1].lower())
+    if format == "csv":
+        return _write_csv(rows, path, sample_size)
+    if format == "ndjson":
+        return _write_ndjson(rows, path)
+    if format == "parquet":
+        return _write_parquet(rows, path, sample_size, batch_size)
+    raise ValueError(f"Unsupported export format for {path}: use .csv, .ndjson or .parquet")
+
+
+def _key_value(text):
+    key, _, value = text.partition("=")
+    if not key or not value:
+        raise argparse.ArgumentTypeError(f"Expected key=value, got {text}")
+    return key, value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream a paginated endpoint to a file")
+    parser.add_argument("endpoint", choices=[e.name for e in Endpoints])
+    parser.add_argument("output", help="Output file (.csv, .ndjson or .parquet)")
+    parser.add_argument(
+        "--path-param", type=_key_value, action="append", default=[], metavar="KEY=VALUE"
+    )
+    parser.add_argument(
+        "--param",
+        type=_key_value,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Query parameter; repeat a key for list filters",
+    )
+    args = parser.parse_args()
+
+    params = {}
+    for key, value in args.param:
+        params.setdefault(key, []).append(value)
+
+    with RobotEvents() as controller:
+        count = export_rows(
+            controller.iter_all(
+                Endpoints[args.endpoint], path_params=dict(args.path_param), params=params
+            ),
+            args.output,
+        )
+    print(f"Wrote {count} rows to {args.output}")
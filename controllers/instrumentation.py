@@ -0,0 +1,413 @@
+import json
+import os
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+# Upper bounds (seconds) of the Prometheus latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Request phases, in the order they happen on the wire
+PHASES = ("limiter", "dns", "connect", "ttfb", "download")
+
+# Trace of the request the current thread is sending, read by the connection hooks
+_active = threading.local()
+
+
+@dataclass(slots=True)
+class RequestTrace:
+    """
+    Timing and outcome of one logical request (one fetch/_get call)
+
+    Phase fields are seconds summed over every attempt, so a request that
+    was retried or throttled reports its total time in each phase. ttfb is
+    the wait for response headers once the connection is up.
+
+    cache is "bypass" (no cache configured), "hit", "revalidated", "miss"
+    or "memo" (answered by the in-process RequestMemo).
+    """
+
+    endpoint: str
+    url: str
+    start: float
+    duration: float = 0.0
+    status: Optional[int] = None
+    bytes: int = 0
+    retries: int = 0
+    throttled: int = 0
+    cache: Optional[str] = None
+    limiter: float = 0.0
+    dns: float = 0.0
+    connect: float = 0.0
+    ttfb: float = 0.0
+    download: float = 0.0
+    error: Optional[str] = None
+
+    def exchange(self, setup_before, to_headers, download):
+        """
+        Account one HTTP exchange
+
+        Args:
+            setup_before: dns + connect before the exchange started, so time
+                spent opening a connection is not counted twice
+            to_headers: Seconds from sending the request to its headers
+            download: Seconds spent reading the body
+        """
+        self.ttfb += max(0.0, to_headers - (self.dns + self.connect - setup_before))
+        self.download += download
+
+
+class _EndpointStats:
+    """Running totals for one endpoint, kept for the life of the process."""
+
+    def __init__(self, samples):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.bytes = 0
+        self.retries = 0
+        self.throttled = 0
+        self.outcomes = defaultdict(int)
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.durations = deque(maxlen=samples)
+
+    def add(self, trace):
+        self.count += 1
+        self.errors += trace.error is not None
+        self.total += trace.duration
+        self.max = max(self.max, trace.duration)
+        self.bytes += trace.bytes
+        self.retries += trace.retries
+        self.throttled += trace.throttled
+        self.outcomes[(trace.status, trace.cache)] += 1
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if trace.duration <= bound:
+                self.buckets[i] += 1
+        for phase in PHASES:
+            self.phases[phase] += getattr(trace, phase)
+        self.durations.append(trace.duration)
+
+    def percentile(self, q):
+        values = sorted(self.durations)
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, round(q / 100 * (len(values) - 1)))]
+
+
+class Instrumentation:
+    """
+    Per-request metrics for RobotEvents and AsyncRobotEvents
+
+    Every request produces a RequestTrace that is folded into per-endpoint
+    totals, kept in a bounded ring for trace export and passed to any
+    subscribed hooks, e.g. to log slow calls as they happen:
+
+        instrumentation.subscribe(lambda t: t.duration > 2 and print(t))
+
+    Share one instance between clients to profile a whole run.
+    """
+
+    def __init__(self, max_traces=10000, samples=2048):
+        """
+        Args:
+            max_traces: Most recent traces kept for write_chrome_trace
+            samples: Durations kept per endpoint for percentiles
+        """
+        self.samples = samples
+        self.traces = deque(maxlen=max_traces)
+        self.endpoints = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+        self._epoch = time.perf_counter()
+
+    def subscribe(self, hook):
+        """Call hook(trace) after every finished request."""
+        self._hooks.append(hook)
+        return hook
+
+    def unsubscribe(self, hook):
+        self._hooks.remove(hook)
+
+    def begin(self, endpoint, url):
+        """Start a trace for a request to endpoint (an Endpoints member)."""
+        name = getattr(endpoint, "name", str(endpoint))
+        return RequestTrace(name, url, time.perf_counter())
+
+    def finish(self, trace):
+        """Close a trace, fold it into the totals and notify hooks."""
+        trace.duration = time.perf_counter() - trace.start
+        with self._lock:
+            stats = self.endpoints.get(trace.endpoint)
+            if stats is None:
+                stats = self.endpoints[trace.endpoint] = _EndpointStats(self.samples)
+            stats.add(trace)
+            self.traces.append(trace)
+        for hook in list(self._hooks):
+            try:
+                hook(trace)
+            except Exception as e:
+                print(f"ERROR in instrumentation hook {hook!r}:\n{e}")
+
+    @contextmanager
+    def activate(self, trace):
+        """Attribute connections opened by this thread to trace (see InstrumentedAdapter)."""
+        previous = getattr(_active, "trace", None)
+        _active.trace = trace
+        try:
+            yield trace
+        finally:
+            _active.trace = previous
+
+    def slowest(self, limit=10, by="p95"):
+        """
+        Endpoints ordered slowest first
+
+        Args:
+            limit: Number of endpoints to return
+            by: "p95", "max", "mean" or "total" seconds
+
+        Returns:
+            List of dicts with endpoint, requests, errors, mean, p50, p95,
+            max, total, bytes, retries and per-phase seconds
+        """
+        with self._lock:
+            rows = [
+                {
+                    "endpoint": name,
+                    "requests": stats.count,
+                    "errors": stats.errors,
+                    "mean": stats.total / stats.count,
+                    "p50": stats.percentile(50),
+                    "p95": stats.percentile(95),
+                    "max": stats.max,
+                    "total": stats.total,
+                    "bytes": stats.bytes,
+                    "retries": stats.retries + stats.throttled,
+                    **stats.phases,
+                }
+                for name, stats in self.endpoints.items()
+            ]
+        rows.sort(key=lambda row: row[by], reverse=True)
+        return rows[:limit]
+
+    def prometheus(self):
+        """Snapshot of every counter in the Prometheus text exposition format."""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+                lines.append(f"{name}{suffix}{{{label_text}}} {value:g}")
+
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+            metric(
+                "robotevents_requests_total",
+                "counter",
+                "Requests by endpoint, HTTP status and cache outcome",
+                [
+                    ("", [("endpoint", name), ("status", status or "none"), ("cache", cache)], n)
+                    for name, stats in endpoints
+                    for (status, cache), n in sorted(stats.outcomes.items(), key=str)
+                ],
+            )
+            histogram = []
+            for name, stats in endpoints:
+                for bound, n in zip(LATENCY_BUCKETS, stats.buckets):
+                    histogram.append(("_bucket", [("endpoint", name), ("le", f"{bound:g}")], n))
+                histogram.append(("_bucket", [("endpoint", name), ("le", "+Inf")], stats.count))
+                histogram.append(("_sum", [("endpoint", name)], stats.total))
+                histogram.append(("_count", [("endpoint", name)], stats.count))
+            metric(
+                "robotevents_request_duration_seconds",
+                "histogram",
+                "End-to-end request latency, including cache and limiter",
+                histogram,
+            )
+            metric(
+                "robotevents_request_phase_seconds_total",
+                "counter",
+                "Seconds spent in each request phase",
+                [
+                    ("", [("endpoint", name), ("phase", phase)], stats.phases[phase])
+                    for name, stats in endpoints
+                    for phase in PHASES
+                ],
+            )
+            for name, help_text, field in (
+                ("robotevents_response_bytes_total", "Response body bytes received", "bytes"),
+                ("robotevents_retries_total", "Retried 5xx responses and connection errors", "retries"),
+                ("robotevents_throttled_total", "429 responses waited out", "throttled"),
+                ("robotevents_errors_total", "Requests that raised", "errors"),
+            ):
+                metric(
+                    name,
+                    "counter",
+                    help_text,
+                    [("", [("endpoint", n)], getattr(stats, field)) for n, stats in endpoints],
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Write prometheus() to path, e.g. for a node_exporter textfile collector."""
+        with open(path, "w") as f:
+            f.write(self.prometheus())
+
+    def chrome_trace(self):
+        """
+        Recent traces in the Chrome trace event format
+
+        Each request is a complete ("X") event with its phases nested under
+        it. Overlapping requests are spread over lanes (tids) so concurrent
+        fan-out reads as parallel rows in chrome://tracing or Perfetto.
+        """
+        with self._lock:
+            traces = sorted(self.traces, key=lambda t: t.start)
+
+        pid = os.getpid()
+        events, lanes = [], []
+        for trace in traces:
+            start = (trace.start - self._epoch) * 1e6
+            end = start + trace.duration * 1e6
+            lane = next((i for i, busy in enumerate(lanes) if busy <= start), len(lanes))
+            if lane == len(lanes):
+                lanes.append(end)
+            lanes[lane] = end
+
+            args = {
+                "url": trace.url,
+                "status": trace.status,
+                "bytes": trace.bytes,
+                "cache": trace.cache,
+                "retries": trace.retries,
+                "throttled": trace.throttled,
+            }
+            if trace.error:
+                args["error"] = trace.error
+            events.append(
+                {
+                    "name": trace.endpoint,
+                    "cat": "request",
+                    "ph": "X",
+                    "ts": start,
+                    "dur": trace.duration * 1e6,
+                    "pid": pid,
+                    "tid": lane,
+                    "args": args,
+                }
+            )
+            # Phases are laid end to end; retried attempts appear merged
+            offset = start
+            for phase in PHASES:
+                seconds = getattr(trace, phase)
+                if seconds > 0:
+                    events.append(
+                        {
+                            "name": phase,
+                            "cat": "phase",
+                            "ph": "X",
+                            "ts": offset,
+                            "dur": seconds * 1e6,
+                            "pid": pid,
+                            "tid": lane,
+                        }
+                    )
+                    offset += seconds * 1e6
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """Write chrome_trace() as JSON, loadable in chrome://tracing or ui.perfetto.dev."""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def _record(phase, seconds):
+    trace = getattr(_active, "trace", None)
+    if trace is not None:
+        setattr(trace, phase, getattr(trace, phase) + seconds)
+
+
+class _TimedConnectionMixin:
+    """Split new urllib3 connections into DNS and connect (TCP + TLS) time."""
+
+    def _new_conn(self):
+        host = self._dns_host
+        start = time.perf_counter()
+        try:
+            # Resolve here so the lookup is timed on its own instead of inside
+            # create_connection, then connect to each address in turn
+            family = allowed_gai_family()
+            addresses = list(
+                dict.fromkeys(
+                    info[4][0]
+                    for info in socket.getaddrinfo(host, self.port, family, socket.SOCK_STREAM)
+                )
+            )
+        except OSError:
+            addresses = []  # Let urllib3 raise its usual NameResolutionError
+        _record("dns", time.perf_counter() - start)
+        if not addresses:
+            return super()._new_conn()
+        try:
+            for i, address in enumerate(addresses):
+                # Same fallback as create_connection: an unreachable address
+                # (often the IPv6 one) moves on to the next
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError):
+                    if i == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+
+    def connect(self):
+        start = time.perf_counter()
+        trace = getattr(_active, "trace", None)
+        dns_before = trace.dns if trace is not None else 0.0
+        try:
+            super().connect()
+        finally:
+            if trace is not None:
+                dns = trace.dns - dns_before
+                trace.connect += max(0.0, time.perf_counter() - start - dns)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class InstrumentedAdapter(HTTPAdapter):
+    """HTTPAdapter whose new connections report DNS/connect time to the active trace."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
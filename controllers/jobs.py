@@ -0,0 +1,444 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from controllers.data import RobotEvents, build_url
+from controllers.export import export_rows
+from controllers.memo import request_key
+from models.endpoints import Endpoints
+from models.seasons import Seasons
+from models.teams import Teams
+
+# Endpoints that take a season filter; main.py sends it as {"season": [id]}
+SEASON_FILTERED = {
+    Endpoints.EVENTS,
+    Endpoints.TEAM_EVENTS,
+    Endpoints.TEAM_MATCHES,
+    Endpoints.TEAM_RANKINGS,
+    Endpoints.TEAM_SKILLS,
+    Endpoints.TEAM_AWARDS,
+}
+
+DIVISION_ENDPOINTS = {
+    Endpoints.EVENT_DIVISION_MATCHES,
+    Endpoints.EVENT_DIVISION_RANKINGS,
+    Endpoints.EVENT_DIVISION_FINALIST_RANKINGS,
+}
+
+DEFAULT_FORMAT = "ndjson"
+
+
+def load_job_file(path):
+    """
+    Read a job file; .yaml/.yml needs PyYAML, anything else is parsed as JSON
+
+    Raises:
+        ValueError: If the file is not valid JSON/YAML
+    """
+    with open(path, encoding="utf-8") as f:
+        if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML job files require PyYAML (pip install pyyaml)")
+            try:
+                return yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML in {path}: {e}") from e
+        try:
+            return json.load(f)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON in {path}: {e}") from e
+
+
+def resolve_endpoint(name):
+    """Endpoints member from "TEAM_MATCHES" or main.py's "team_matches"."""
+    try:
+        return Endpoints[str(name).upper()]
+    except KeyError:
+        raise ValueError(f"Unknown endpoint: {name}")
+
+
+def resolve_season(value):
+    """Season ID from an ID or a Seasons name such as VEX2526."""
+    if value is None or str(value).isdigit():
+        return None if value is None else int(value)
+    try:
+        return Seasons[value].value
+    except KeyError:
+        raise ValueError(f"Unknown season: {value}")
+
+
+def resolve_team(value):
+    """Team ID from an ID or a Teams name such as BH_A."""
+    if str(value).isdigit():
+        return int(value)
+    try:
+        return Teams[value].value
+    except KeyError:
+        raise ValueError(f"Unknown team: {value}")
+
+
+def validate_jobs(spec):
+    """
+    Check a parsed job file before anything is compiled or fetched
+
+    Raises:
+        ValueError: Listing every job with a missing or unknown endpoint,
+            season or team, or a non-numeric event
+    """
+    if isinstance(spec, list):
+        spec = {"jobs": spec}
+    if not isinstance(spec, dict) or not isinstance(spec.get("jobs"), list):
+        raise ValueError('A job file must be a list of jobs or an object with a "jobs" list')
+    defaults = {k: v for k, v in spec.items() if k not in ("jobs", "output_dir")}
+    problems = []
+    for i, job in enumerate(spec["jobs"]):
+        label = f"job {i + 1}"
+        if not isinstance(job, dict):
+            problems.append(f"{label}: expected an object, got {job!r}")
+            continue
+        job = {**defaults, **job}
+        if job.get("name"):
+            label += f" ({job['name']})"
+        if "endpoint" not in job:
+            problems.append(f'{label}: missing "endpoint"')
+            continue
+        try:
+            resolve_endpoint(job["endpoint"])
+            resolve_season(job.get("season"))
+            for team in job.get("teams") or []:
+                resolve_team(team)
+            for event_id in job.get("events") or []:
+                if not str(event_id).isdigit():
+                    raise ValueError(f"Event IDs must be numbers, got {event_id!r}")
+        except ValueError as e:
+            problems.append(f"{label}: {e}")
+    if problems:
+        raise ValueError("Invalid job file:\n" + "\n".join(problems))
+
+
+class _Node:
+    """One unit of fetching in the DAG, shared by every job that needs it."""
+
+    def __init__(self, key, fetch, deps=()):
+        self.key = key
+        self.fetch = fetch
+        self.deps = list(deps)
+        self.dependents = []
+        self.jobs = []
+        self.result = None
+        self.error = None
+        self.consumers = 0
+
+
+def _closure_size(node):
+    return 1 + sum(_closure_size(dep) for dep in node.deps)
+
+
+class Job:
+    """A named query from a job file and the nodes whose rows it writes."""
+
+    def __init__(self, name, output, nodes):
+        self.name = name
+        self.output = output
+        # (node, team_id) pairs; team_id is stamped on rows like main.py does
+        self.nodes = nodes
+
+
+class JobRunner:
+    """
+    Run a batch of queries headlessly, deduplicating shared sub-requests
+
+    Jobs are compiled into a DAG of fetch nodes keyed by their canonical
+    request. Any node needed by several jobs (e.g. a team's season event
+    list used by both a matches job and an awards job) is fetched once.
+    Nodes run concurrently as soon as their dependencies finish, and each
+    job is written to disk as soon as all of its nodes are done.
+
+    A job file looks like:
+
+        {
+          "season": "VEX2526",
+          "output_dir": "scouting",
+          "jobs": [
+            {"name": "bh-matches", "endpoint": "team_matches", "teams": ["BH_A", 171256]},
+            {"name": "worlds-rankings", "endpoint": "event_division_rankings",
+             "events": [58000], "output": "rankings.csv"},
+            {"name": "season-events", "endpoint": "season_events"}
+          ]
+        }
+
+    Per job: endpoint (Endpoints name), teams/events (fan out over path
+    IDs), divisions (default: every division of the event), season,
+    params, path_params, output (file name; format from the extension,
+    default <name>.ndjson). Team matches are restricted to the team's
+    events in the season unless "season_events": false.
+    """
+
+    def __init__(self, controller: RobotEvents, output_dir=".", max_workers=8):
+        """
+        Args:
+            controller: RobotEvents (or Warehouse) used for every request
+            output_dir: Directory job outputs are written to
+            max_workers: Number of nodes fetched concurrently
+        """
+        self.controller = controller
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        self.jobs = []
+        self._nodes = {}
+        self.requested = 0
+
+    def add_jobs(self, spec):
+        """
+        Compile a parsed job file (dict with "jobs", or a bare list of jobs)
+
+        Raises:
+            ValueError: If any job is invalid (see validate_jobs); nothing is
+                compiled in that case
+        """
+        validate_jobs(spec)
+        if isinstance(spec, list):
+            spec = {"jobs": spec}
+        self.output_dir = spec.get("output_dir", self.output_dir)
+        defaults = {k: v for k, v in spec.items() if k not in ("jobs", "output_dir")}
+        for i, job in enumerate(spec.get("jobs") or []):
+            self.add_job({**defaults, **job}, default_name=f"job{i + 1}")
+        return self
+
+    def add_job(self, job, default_name="job"):
+        """Compile one job into nodes, reusing nodes already in the DAG."""
+        name = job.get("name", default_name)
+        endpoint = resolve_endpoint(job["endpoint"])
+        season_id = resolve_season(job.get("season"))
+        params = dict(job.get("params") or {})
+        if season_id is not None and endpoint in SEASON_FILTERED:
+            params.setdefault("season", [season_id])
+        output = job.get("output") or f"{name}.{job.get('format', DEFAULT_FORMAT)}"
+
+        nodes = []
+        if job.get("teams"):
+            for team_id in (resolve_team(t) for t in job["teams"]):
+                path_params = {**(job.get("path_params") or {}), "id": team_id}
+                if (
+                    endpoint == Endpoints.TEAM_MATCHES
+                    and season_id is not None
+                    and job.get("season_events", True)
+                ):
+                    node = self._season_matches_node(team_id, season_id, params)
+                else:
+                    node = self._request_node(endpoint, path_params, params)
+                nodes.append((node, team_id))
+        elif job.get("events"):
+            for event_id in job["events"]:
+                path_params = {**(job.get("path_params") or {}), "id": int(event_id)}
+                if endpoint in DIVISION_ENDPOINTS and "div" not in path_params:
+                    node = self._divisions_node(endpoint, path_params, params, job.get("divisions"))
+                else:
+                    node = self._request_node(endpoint, path_params, params)
+                nodes.append((node, None))
+        else:
+            path_params = dict(job.get("path_params") or {})
+            if season_id is not None and endpoint in (Endpoints.SEASON, Endpoints.SEASON_EVENTS):
+                path_params.setdefault("id", season_id)
+            nodes.append((self._request_node(endpoint, path_params, params), None))
+
+        # Fetches this job would cost on its own, dependencies included
+        self.requested += sum(_closure_size(node) for node, _ in nodes)
+        job = Job(name, output, nodes)
+        for node, _ in nodes:
+            if job not in node.jobs:
+                node.jobs.append(job)
+                node.consumers += 1
+        self.jobs.append(job)
+        return job
+
+    def _node(self, key, fetch, deps=()):
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = _Node(key, fetch, deps)
+            for dep in node.deps:
+                dep.dependents.append(node)
+                dep.consumers += 1
+        return node
+
+    def _request_node(self, endpoint: Endpoints, path_params, params):
+        """Every row of one endpoint/params combination."""
+        url = build_url(getattr(self.controller, "BASE_URL", ""), endpoint, dict(path_params))
+        key = request_key(url, params)
+        return self._node(
+            key,
+            lambda deps: list(
+                self.controller.iter_all(endpoint, path_params=dict(path_params), params=params)
+            ),
+        )
+
+    def _season_matches_node(self, team_id, season_id, params):
+        """A team's matches, restricted to the events it attended in the season."""
+        events = self._request_node(
+            Endpoints.TEAM_EVENTS, {"id": team_id}, {"season": [season_id]}
+        )
+
+        def fetch(deps):
+            event_ids = [event["id"] for event in deps[0]]
+            match_params = {**params, "event": event_ids} if event_ids else params
+            return list(
+                self.controller.iter_all(
+                    Endpoints.TEAM_MATCHES, path_params={"id": team_id}, params=match_params
+                )
+            )
+
+        key = ("season_matches", team_id, request_key("", params))
+        return self._node(key, fetch, [events])
+
+    def _divisions_node(self, endpoint: Endpoints, path_params, params, divisions=None):
+        """A division endpoint over several divisions, by default every division of the event."""
+        event_id = path_params["id"]
+
+        def fetch(deps):
+            division_ids = divisions
+            if not division_ids:
+                event = deps[0][0] if deps[0] else {}
+                division_ids = [division["id"] for division in event.get("divisions") or []]
+            rows = []
+            for division_id in division_ids:
+                rows.extend(
+                    self.controller.iter_all(
+                        endpoint, path_params={**path_params, "div": division_id}, params=params
+                    )
+                )
+            return rows
+
+        deps = [] if divisions else [self._request_node(Endpoints.EVENT, {"id": event_id}, None)]
+        key = (endpoint.name, event_id, tuple(divisions or ()), request_key("", params))
+        return self._node(key, fetch, deps)
+
+    def run(self, progress=None):
+        """
+        Fetch every node and write every job
+
+        Args:
+            progress: Optional callable(job, rows, error) called per finished job
+
+        Returns:
+            Dictionary with job/failed counts, the node count before (requested)
+            and after (unique) deduplication, and elapsed seconds
+        """
+        start = time.monotonic()
+        os.makedirs(self.output_dir or ".", exist_ok=True)
+        summary = {
+            "jobs": len(self.jobs),
+            "written": 0,
+            "failed": 0,
+            "requested": self.requested,
+            "unique": len(self._nodes),
+        }
+        waiting = {node: len(node.deps) for node in self._nodes.values()}
+        unfinished = {job: len({id(node) for node, _ in job.nodes}) for job in self.jobs}
+
+        def release(node):
+            # Drop rows once every dependent and job has used them
+            node.consumers -= 1
+            if node.consumers <= 0:
+                node.result = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+
+            def submit(node):
+                failed = next((dep for dep in node.deps if dep.error is not None), None)
+                if failed is not None:
+                    node.error = RuntimeError(f"dependency failed: {failed.error}")
+                    return finish(node)
+                deps = [dep.result for dep in node.deps]
+                for dep in node.deps:
+                    release(dep)
+                running[pool.submit(node.fetch, deps)] = node
+
+            def finish(node):
+                for dependent in node.dependents:
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        submit(dependent)
+                for job in node.jobs:
+                    unfinished[job] -= 1
+                    if unfinished[job] == 0:
+                        self._write(job, summary, progress)
+                        for done in {id(n): n for n, _ in job.nodes}.values():
+                            release(done)
+
+            for node in [n for n, count in waiting.items() if count == 0]:
+                submit(node)
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    try:
+                        node.result = future.result()
+                    except Exception as e:
+                        node.error = e
+                    finish(node)
+
+        summary["seconds"] = time.monotonic() - start
+        return summary
+
+    def _write(self, job, summary, progress):
+        error = next((node.error for node, _ in job.nodes if node.error is not None), None)
+        rows = 0
+        if error is None:
+            try:
+                rows = export_rows(self._rows(job), os.path.join(self.output_dir, job.output))
+            except (ValueError, ImportError, OSError) as e:
+                error = e
+        summary["failed" if error else "written"] += 1
+        if progress:
+            progress(job, rows, error)
+
+    def _rows(self, job):
+        for node, team_id in job.nodes:
+            for row in node.result or []:
+                if team_id is not None and isinstance(row, dict) and "team_id" not in row:
+                    row = {**row, "team_id": team_id}
+                yield row
+
+
+def run_job_file(controller, path, output_dir=None, max_workers=8):
+    """
+    Load, compile and run a job file, printing one line per job
+
+    Raises:
+        OSError, ValueError, ImportError: If the file cannot be read or is
+            invalid; raised before any request is made
+    """
+
+    def report(job, rows, error):
+        status = f"FAILED ({error})" if error else f"{rows} rows"
+        print(f"{job.name}: {status} -> {os.path.join(runner.output_dir, job.output)}")
+
+    runner = JobRunner(controller, max_workers=max_workers).add_jobs(load_job_file(path))
+    if output_dir:
+        runner.output_dir = output_dir
+    summary = runner.run(progress=report)
+    print(
+        f"{summary['written']}/{summary['jobs']} jobs written, {summary['failed']} failed; "
+        f"{summary['unique']} unique fetches for {summary['requested']} requested "
+        f"in {summary['seconds']:.1f}s"
+    )
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a batch of RobotEvents queries")
+    parser.add_argument("job_file", help="JSON or YAML job file")
+    parser.add_argument("--output-dir", help="Override the job file's output_dir")
+    parser.add_argument("--workers", type=int, default=8, help="Fetches run concurrently")
+    args = parser.parse_args()
+
+    with RobotEvents() as controller:
+        try:
+            summary = run_job_file(controller, args.job_file, args.output_dir, args.workers)
+        except (OSError, ValueError, ImportError) as e:
+            raise SystemExit(f"ERROR in job file {args.job_file}:\n{e}")
+    raise SystemExit(1 if summary["failed"] else 0)
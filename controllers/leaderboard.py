@@ -0,0 +1,285 @@
+import argparse
+import heapq
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+import requests
+from rich.console import Console
+from rich.table import Table
+from controllers.data import RobotEvents
+from controllers.export import export_rows
+from controllers.planner import QueryPlanner
+from controllers.registry import DEFAULT_PROGRAM
+from controllers.sync import parse_season
+from models.endpoints import Endpoints
+
+SKILL_TYPES = ("driver", "programming")
+
+
+@dataclass(slots=True)
+class TeamSkills:
+    """
+    A team's best skills results across the season
+
+    combined/driver_at_best/programming_at_best come from the single event
+    with the best combined score (ties broken on programming, then driver,
+    as in the official rankings); best_driver and best_programming are the
+    highest scores at any event.
+    """
+
+    team_id: int
+    number: Optional[str]
+    combined: int = 0
+    programming_at_best: int = 0
+    driver_at_best: int = 0
+    event_id: Optional[int] = None
+    best_programming: int = 0
+    best_driver: int = 0
+    program: Optional[str] = None
+    grade: Optional[str] = None
+    region: Optional[str] = None
+
+    @property
+    def sort_key(self):
+        return (self.combined, self.programming_at_best, self.driver_at_best, -self.team_id)
+
+
+def event_best(rows):
+    """
+    Reduce one event's EVENT_SKILLS rows to each team's best attempt per type
+
+    Returns:
+        Dictionary mapping team ID to (number, driver, programming)
+    """
+    best = {}
+    for row in rows:
+        kind = row.get("type")
+        team = row.get("team") or {}
+        if kind not in SKILL_TYPES or team.get("id") is None:
+            continue
+        number, driver, programming = best.get(team["id"], (team.get("name"), 0, 0))
+        score = row.get("score") or 0
+        if kind == "driver":
+            driver = max(driver, score)
+        else:
+            programming = max(programming, score)
+        best[team["id"]] = (number, driver, programming)
+    return best
+
+
+def _started(event):
+    start = event.get("start")
+    if not start:
+        return True
+    try:
+        start = datetime.fromisoformat(start)
+    except ValueError:
+        return True
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return start <= datetime.now(timezone.utc)
+
+
+class SkillsLeaderboard:
+    """
+    Season-wide skills rankings built from every event's skills results
+
+    Events are crawled with bounded concurrency; each worker reduces its
+    event to per-team bests before handing it back, and those are merged
+    into one TeamSkills per team, so raw skills entries never accumulate.
+    Rankings are then selected with bounded heaps per (program, grade,
+    region) group, plus the grade, region and program-wide rollups.
+    """
+
+    def __init__(self, controller: RobotEvents, top=50, max_workers=8):
+        """
+        Args:
+            controller: RobotEvents (or Warehouse) used for all requests
+            top: Teams kept per leaderboard group
+            max_workers: Number of events fetched concurrently
+        """
+        self.controller = controller
+        self.top = top
+        self.max_workers = max_workers
+        self.teams = {}
+        self._heaps = None
+
+    def add_event(self, event_id, best):
+        """Merge one event's per-team bests (see event_best)."""
+        for team_id, (number, driver, programming) in best.items():
+            team = self.teams.get(team_id)
+            if team is None:
+                team = self.teams[team_id] = TeamSkills(team_id, number)
+            team.best_driver = max(team.best_driver, driver)
+            team.best_programming = max(team.best_programming, programming)
+            if (driver + programming, programming, driver) > (
+                team.combined,
+                team.programming_at_best,
+                team.driver_at_best,
+            ):
+                team.combined = driver + programming
+                team.programming_at_best = programming
+                team.driver_at_best = driver
+                team.event_id = event_id
+        self._heaps = None
+
+    def crawl(self, season_id, progress=None):
+        """
+        Fetch the skills results of every event in a season that has started
+
+        Args:
+            season_id: RobotEvents season ID
+            progress: Optional callable(event, error) called per event
+
+        Returns:
+            Dictionary with counts of events listed, crawled, skipped and failed
+        """
+        events = list(
+            self.controller.iter_all(Endpoints.SEASON_EVENTS, path_params={"id": season_id})
+        )
+        pending = [event for event in events if _started(event)]
+        summary = {
+            "events": len(events),
+            "crawled": 0,
+            "skipped": len(events) - len(pending),
+            "failed": 0,
+        }
+
+        def fetch(event):
+            return event_best(
+                self.controller.iter_all(Endpoints.EVENT_SKILLS, path_params={"id": event["id"]})
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(fetch, event): event for event in pending}
+            for future in as_completed(futures):
+                event = futures[future]
+                try:
+                    best = future.result()
+                except requests.exceptions.RequestException as e:
+                    summary["failed"] += 1
+                    if progress:
+                        progress(event, e)
+                    continue
+                self.add_event(event["id"], best)
+                summary["crawled"] += 1
+                if progress:
+                    progress(event, None)
+
+        self.describe_teams()
+        return summary
+
+    def describe_teams(self):
+        """Fill program/grade/region with chunked TEAMS?id[]= queries, run concurrently."""
+        planner = QueryPlanner(self.controller)
+        unknown = [team_id for team_id, team in self.teams.items() if team.grade is None]
+
+        def fetch(chunk):
+            return list(planner.collect(Endpoints.TEAMS, "id[]", chunk))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for rows in pool.map(fetch, planner.chunks(Endpoints.TEAMS, "id[]", unknown)):
+                for row in rows:
+                    team = self.teams.get(row.get("id"))
+                    if team is None:
+                        continue
+                    team.number = row.get("number") or team.number
+                    team.program = (row.get("program") or {}).get("code")
+                    team.grade = row.get("grade")
+                    team.region = (row.get("location") or {}).get("region")
+        self._heaps = None
+
+    def _groups(self, team):
+        # A team competes in its own group and in the grade, region and program rollups
+        yield (team.program, team.grade, team.region)
+        yield (team.program, team.grade, None)
+        yield (team.program, None, team.region)
+        yield (team.program, None, None)
+
+    def _select(self):
+        heaps = {}
+        for team in self.teams.values():
+            if not team.combined:
+                continue
+            # A missing grade/region makes some rollups the same group; count the team once
+            for group in dict.fromkeys(self._groups(team)):
+                heap = heaps.setdefault(group, [])
+                item = (team.sort_key, team.team_id)
+                if len(heap) < self.top:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+        self._heaps = heaps
+        return heaps
+
+    def groups(self):
+        """Every (program, grade, region) group with a leaderboard; None means all."""
+        return list(self._heaps or self._select())
+
+    def rankings(self, program, grade=None, region=None):
+        """
+        Top teams of one group, best first
+
+        Args:
+            program: Program code such as "V5RC"; programs are never ranked together
+            grade: e.g. "High School" (default: every grade)
+            region: e.g. "Ohio" (default: every region)
+        """
+        heaps = self._heaps or self._select()
+        heap = heaps.get((program, grade, region), [])
+        return [self.teams[team_id] for _, team_id in sorted(heap, reverse=True)]
+
+    def rows(self, program, grade=None, region=None):
+        """rankings() as plain dicts with a rank column, ready for export_rows."""
+        return (
+            {"rank": rank, **{field: getattr(team, field) for field in TeamSkills.__slots__}}
+            for rank, team in enumerate(self.rankings(program, grade, region), 1)
+        )
+
+
+def print_leaderboard(leaderboard, program, grade=None, region=None, console=None):
+    title = " / ".join(str(part) for part in (program, grade, region) if part) or "All teams"
+    table = Table(title=f"Skills leaderboard: {title}")
+    for column in ("Rank", "Team", "Grade", "Region", "Combined", "Programming", "Driver", "Event"):
+        table.add_column(column, justify="left" if column in ("Team", "Grade", "Region") else "right")
+    for row in leaderboard.rows(program, grade, region):
+        table.add_row(
+            str(row["rank"]),
+            str(row["number"]),
+            str(row["grade"] or ""),
+            str(row["region"] or ""),
+            str(row["combined"]),
+            str(row["programming_at_best"]),
+            str(row["driver_at_best"]),
+            str(row["event_id"]),
+        )
+    (console or Console()).print(table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Season-wide skills leaderboard")
+    parser.add_argument("season", type=parse_season, help="Season ID or name (e.g. VEX2526)")
+    parser.add_argument("--top", type=int, default=50, help="Teams per leaderboard")
+    parser.add_argument("--program", default=DEFAULT_PROGRAM, help=f"Program code (default: {DEFAULT_PROGRAM})")
+    parser.add_argument("--grade", help='e.g. "High School"')
+    parser.add_argument("--region", help='e.g. "Ohio"')
+    parser.add_argument("--workers", type=int, default=8, help="Events fetched concurrently")
+    parser.add_argument("--output", help="Also export the leaderboard (.csv, .ndjson or .parquet)")
+    args = parser.parse_args()
+
+    def report(event, error):
+        if error:
+            print(f"{event['id']} {event.get('name', '')}: FAILED ({error})")
+
+    with RobotEvents() as controller:
+        leaderboard = SkillsLeaderboard(controller, args.top, args.workers)
+        summary = leaderboard.crawl(args.season, progress=report)
+    print(
+        f"{summary['crawled']} events crawled, {summary['skipped']} not started, "
+        f"{summary['failed']} failed; {len(leaderboard.teams)} teams"
+    )
+    print_leaderboard(leaderboard, args.program, args.grade, args.region)
+    if args.output:
+        count = export_rows(leaderboard.rows(args.program, args.grade, args.region), args.output)
+        print(f"Wrote {count} rows to {args.output}")
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from urllib.parse import urlencode
+
+
+def request_key(url, params=None):
+    """
+    Canonical key for a GET: the URL plus sorted, flattened query params
+
+    {"season": [197], "per_page": 50} and {"per_page": "50", "season": 197}
+    produce the same key.
+    """
+    pairs = []
+    for name, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        pairs.extend((name, str(v)) for v in values if v is not None)
+    return f"{url}?{urlencode(sorted(pairs))}"
+
+
+class RequestMemo:
+    """
+    In-process request deduplication for RobotEvents
+
+    Identical requests issued while one is already in flight wait for and
+    share its result instead of going to the network. Completed results
+    are kept in a bounded LRU for ttl seconds. Returned objects are shared
+    between callers and should be treated as read-only.
+    """
+
+    def __init__(self, max_entries=512, ttl=60.0):
+        """
+        Args:
+            max_entries: Maximum number of completed responses kept in memory
+            ttl: Seconds a completed response is reused
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def stats(self):
+        """Hit/miss counters; coalesced calls shared an in-flight request."""
+        total = self.hits + self.coalesced + self.misses
+        return {
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "saved": self.hits + self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / total if total else 0.0,
+            "entries": len(self._entries),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _claim(self, key):
+        # Returns ("hit", value), ("wait", future) or ("lead", future)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return "hit", value
+                del self._entries[key]
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return "wait", future
+            self.misses += 1
+            future = self._in_flight[key] = Future()
+            return "lead", future
+
+    def _settle(self, key, future, value=None, error=None):
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if error is None and value is not None and self.ttl > 0:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def get_or_fetch(self, key, fetch):
+        """
+        Return the memoized result for key, or call fetch() exactly once
+
+        Args:
+            key: Key from request_key
+            fetch: Zero-argument callable performing the request
+        """
+        state, value = self._claim(key)
+        if state == "hit":
+            return value
+        if state == "wait":
+            return value.result()
+        try:
+            result = fetch()
+        except BaseException as e:
+            self._settle(key, value, error=e)
+            raise
+        self._settle(key, value, result)
+        return result
+
+    async def get_or_fetch_async(self, key, fetch):
+        """
+        Async version of get_or_fetch
+
+        Args:
+            key: Key from request_key
+            fetch: Zero-argument callable returning a coroutine
+        """
+        state, value = self._claim(key)
+        if state == "hit":
+            return value
+        if state == "wait":
+            return await asyncio.wrap_future(value)
+        try:
+            result = await fetch()
+        except BaseException as e:
+            self._settle(key, value, error=e)
+            raise
+        self._settle(key, value, result)
+        return result
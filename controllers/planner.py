@@ -0,0 +1,99 @@
+from urllib.parse import urlencode
+from controllers.data import RobotEvents, build_url
+from models.endpoints import Endpoints
+
+# Conservative limit that proxies and the RobotEvents front end both accept
+MAX_URL_LENGTH = 2000
+
+
+class QueryPlanner:
+    """
+    Rewrite per-entity requests into chunked collection queries
+
+    Instead of one TEAM request per team, ask TEAMS?id[]=a&id[]=b&... for
+    as many IDs as fit in a URL, then scatter the rows back by ID. Array
+    filters use the "key[]" form; a repeated plain key would only keep
+    its last value on the server.
+    """
+
+    def __init__(self, controller: RobotEvents, max_url_length=MAX_URL_LENGTH, per_page=250):
+        """
+        Args:
+            controller: RobotEvents (or Warehouse) used for the collection calls
+            max_url_length: Upper bound on the length of each request URL
+            per_page: Page size for the collection calls
+        """
+        self.controller = controller
+        self.max_url_length = max_url_length
+        self.per_page = per_page
+
+    def chunks(self, endpoint: Endpoints, key, values, params=None):
+        """
+        Split values into lists that keep each request URL under the limit
+
+        Args:
+            endpoint: Collection endpoint (e.g. Endpoints.TEAMS)
+            key: Array filter name, e.g. "id[]"
+            values: IDs (or numbers/SKUs) to spread over the requests
+            params: Query params shared by every chunk
+        """
+        # The Warehouse has no URL, but chunking the same way keeps SQL params bounded
+        base = build_url(getattr(self.controller, "BASE_URL", ""), endpoint, {})
+        fixed = dict(params or {}, per_page=self.per_page, page=9999)
+        base_length = len(base) + 1 + len(urlencode(fixed, doseq=True))
+
+        chunk, length = [], base_length
+        for value in dict.fromkeys(values):
+            piece = len(urlencode({key: value})) + 1
+            if chunk and length + piece > self.max_url_length:
+                yield chunk
+                chunk, length = [], base_length
+            chunk.append(value)
+            length += piece
+        if chunk:
+            yield chunk
+
+    def collect(self, endpoint: Endpoints, key, values, params=None):
+        """Stream every row matching any of values, one chunk at a time."""
+        for chunk in self.chunks(endpoint, key, values, params):
+            yield from self.controller.iter_all(
+                endpoint, params={**(params or {}), key: chunk}, per_page=self.per_page
+            )
+
+    def scatter(self, endpoint: Endpoints, key, values, field, params=None):
+        """
+        Fetch rows for many values and index them by a field of each row
+
+        Returns:
+            Dictionary mapping each requested value to its row (None if the
+            server returned nothing for it)
+        """
+        found = {value: None for value in values}
+        for row in self.collect(endpoint, key, values, params):
+            value = row.get(field)
+            if value in found:
+                found[value] = row
+        return found
+
+    def teams(self, team_ids):
+        """Team objects by ID, replacing one TEAM request per team."""
+        return self.scatter(Endpoints.TEAMS, "id[]", team_ids, "id")
+
+    def teams_by_number(self, numbers):
+        """Team objects by number (e.g. "2775V"), for any program."""
+        return self.scatter(Endpoints.TEAMS, "number[]", numbers, "number")
+
+    def events(self, event_ids):
+        """Event objects by ID, replacing one EVENT request per event."""
+        return self.scatter(Endpoints.EVENTS, "id[]", event_ids, "id")
+
+    def team_event_ids(self, team_ids, season_id=None):
+        """
+        IDs of every event any of the teams attends
+
+        One chunked EVENTS?team[]= query replaces a TEAM_EVENTS request per
+        team. The union is enough to restrict each team's matches, since a
+        team only has matches at events it attended.
+        """
+        params = {"season[]": [season_id]} if season_id is not None else {}
+        return {event["id"] for event in self.collect(Endpoints.EVENTS, "team[]", team_ids, params)}
@@ -0,0 +1,284 @@
+import argparse
+import hashlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import requests
+from controllers.cache import DEFAULT_CACHE_PATH, ResponseCache
+from controllers.data import RobotEvents
+from controllers.memo import RequestMemo
+from models.endpoints import Endpoints
+from models.records import dumps
+
+# Path prefix the proxy serves under, so clients only swap the host
+API_PREFIX = "/api/v2"
+
+# Endpoints fetched by warm_event, besides the event itself
+EVENT_COLLECTIONS = (Endpoints.EVENT_TEAMS, Endpoints.EVENT_SKILLS, Endpoints.EVENT_AWARDS)
+DIVISION_COLLECTIONS = (
+    Endpoints.EVENT_DIVISION_MATCHES,
+    Endpoints.EVENT_DIVISION_RANKINGS,
+    Endpoints.EVENT_DIVISION_FINALIST_RANKINGS,
+)
+
+
+def _route(endpoint: Endpoints):
+    # "/events/{id}/divisions/{div}/matches" -> ^/events/(?P<id>[^/]+)/divisions/(?P<div>[^/]+)/matches$
+    pattern = re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", re.escape(endpoint.value))
+    return re.compile(f"^{pattern}$"), endpoint
+
+
+ROUTES = [_route(endpoint) for endpoint in Endpoints]
+
+
+def match_endpoint(path):
+    """
+    Endpoint and path params for a request path, e.g. "/events/5/teams" ->
+    (Endpoints.EVENT_TEAMS, {"id": 5}); (None, None) for unknown paths
+    """
+    for pattern, endpoint in ROUTES:
+        match = pattern.match(path)
+        if match:
+            path_params = {
+                name: int(value) if value.isdigit() else value
+                for name, value in match.groupdict().items()
+            }
+            return endpoint, path_params
+    return None, None
+
+
+def parse_query(query):
+    """Query string -> params dict; repeated or "[]" keys stay lists, the rest are scalars."""
+    params = {}
+    for name, values in parse_qs(query).items():
+        params[name] = values if name.endswith("[]") or len(values) > 1 else values[0]
+    return params
+
+
+def warm_event(controller: RobotEvents, event, season_id=None, max_workers=4, progress=None):
+    """
+    Fetch everything about one event so later requests for it are cache hits
+
+    The cache key includes the query params, so requests are warmed exactly
+    as main.py sends them: with its season filter, and collections with
+    iter_all's default page size (main.py's default "Results per page").
+
+    Args:
+        controller: RobotEvents client backed by the cache to fill
+        event: Event ID or SKU (e.g. "RE-V5RC-25-1234")
+        season_id: Season filter clients send (default: the event's season)
+        max_workers: Collections fetched concurrently
+        progress: Optional callable(endpoint, error) called per collection
+
+    Returns:
+        Dictionary with the event, and counts of collections warmed and failed
+    """
+    if str(event).isdigit():
+        event = controller.fetch(Endpoints.EVENT, path_params={"id": int(event)})
+    else:
+        found = controller.fetch(Endpoints.EVENTS, params={"sku[]": [event]})
+        event = ((found or {}).get("data") or [None])[0]
+    summary = {"event": event, "warmed": 0, "failed": 0}
+    if not event:
+        return summary
+
+    if season_id is None:
+        season_id = (event.get("season") or {}).get("id")
+    params = {"season": [season_id]} if season_id is not None else {}
+    # main.py asks for the event itself with the same filter plus per_page
+    controller.fetch(
+        Endpoints.EVENT, path_params={"id": event["id"]}, params={**params, "per_page": 250}
+    )
+
+    collections = [(endpoint, {"id": event["id"]}) for endpoint in EVENT_COLLECTIONS]
+    collections += [
+        (endpoint, {"id": event["id"], "div": division["id"]})
+        for division in event.get("divisions") or []
+        for endpoint in DIVISION_COLLECTIONS
+    ]
+
+    def fetch(endpoint, path_params):
+        # Drain the pages; the cache keeps them
+        for _ in controller.iter_all(endpoint, path_params=path_params, params=params):
+            pass
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(fetch, *request): request[0] for request in collections}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except requests.exceptions.RequestException as e:
+                summary["failed"] += 1
+                if progress:
+                    progress(futures[future], e)
+                continue
+            summary["warmed"] += 1
+            if progress:
+                progress(futures[future], None)
+    return summary
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Several scouts at once; the default backlog of 5 drops connects
+    request_queue_size = 128
+
+
+class CachingProxy:
+    """
+    Shared RobotEvents front end for a scouting team
+
+    Serves the same paths as the API (under /api/v2), so clients only set
+    RobotEvents(base_url=proxy.base_url). Every request goes through one
+    RobotEvents client, so all clients share its on-disk response cache,
+    its in-flight request coalescing and a single rate limiter, and only
+    the proxy's API token is used upstream. Responses carry an ETag, so
+    clients' own caches and watch mode revalidate with 304s. GET /metrics
+    returns the proxy's request metrics in Prometheus format.
+    """
+
+    def __init__(self, controller: RobotEvents, host="127.0.0.1", port=8080):
+        """
+        Args:
+            controller: RobotEvents client (with a ResponseCache) serving every request
+            host: Interface to listen on ("0.0.0.0" to serve the local network)
+            port: Port to listen on (0 picks a free one)
+        """
+        self.controller = controller
+        self.stats = {"requests": 0, "not_modified": 0, "errors": 0}
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self):
+        """Serve from a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def respond(self, path, query):
+        """
+        (status, body bytes, headers) for a proxied request
+
+        Upstream HTTP errors are passed through with their status and body,
+        plus Retry-After when the upstream still throttles after the
+        client's retries; connection failures become a 502.
+        """
+        endpoint = None
+        if path.startswith(API_PREFIX):
+            endpoint, path_params = match_endpoint(path[len(API_PREFIX) :])
+        if endpoint is None:
+            return 404, dumps({"message": f"Unknown path: {path}"}), {}
+        try:
+            return 200, dumps(self.controller.get(endpoint, path_params, parse_query(query))), {}
+        except requests.exceptions.HTTPError as e:
+            headers = {}
+            if e.response.headers.get("Retry-After"):
+                headers["Retry-After"] = e.response.headers["Retry-After"]
+            return e.response.status_code, e.response.content, headers
+        except requests.exceptions.RequestException as e:
+            return 502, dumps({"message": str(e)}), {}
+
+    def _handler(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this,
+            # Nagle + delayed ACK adds ~40ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, content_type="application/json", etag=None, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if etag:
+                    self.send_header("ETag", etag)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                if url.path == "/metrics":
+                    body = proxy.controller.instrumentation.prometheus().encode()
+                    return self._send(200, body, "text/plain; version=0.0.4")
+
+                proxy._count("requests")
+                status, body, headers = proxy.respond(url.path, url.query)
+                if status != 200:
+                    proxy._count("errors")
+                    return self._send(status, body, headers=headers)
+
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    proxy._count("not_modified")
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    return self.end_headers()
+                self._send(200, body, etag=etag)
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shared caching proxy in front of RobotEvents")
+    parser.add_argument("--host", default="127.0.0.1", help='Interface to listen on ("0.0.0.0" for the LAN)')
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="Response cache SQLite file")
+    parser.add_argument("--memo-ttl", type=float, default=10.0, help="Seconds identical requests share a response")
+    parser.add_argument(
+        "--warm", action="append", default=[], metavar="EVENT", help="Event ID or SKU to prefetch (repeatable)"
+    )
+    parser.add_argument("--season", type=int, help="Season filter to warm with (default: each event's season)")
+    args = parser.parse_args()
+
+    cache = ResponseCache(args.cache)
+    controller = RobotEvents(cache=cache, memo=RequestMemo(ttl=args.memo_ttl))
+    proxy = CachingProxy(controller, args.host, args.port)
+    print(f"Serving RobotEvents on {proxy.base_url}", flush=True)
+
+    def warm():
+        # Runs while serving; early client requests coalesce with it
+        for event in args.warm:
+            summary = warm_event(controller, event, args.season)
+            name = (summary["event"] or {}).get("name", "not found")
+            print(f"Warmed {event} ({name}): {summary['warmed']} collections, {summary['failed']} failed")
+
+    threading.Thread(target=warm, daemon=True).start()
+    try:
+        proxy.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        controller.close()
+        cache.close()
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+
+# How often blocked callers re-check for a free in-flight slot
+_POLL_INTERVAL = 0.01
+
+
+def parse_retry_after(value, default=1.0):
+    """
+    Seconds to wait from a Retry-After header
+
+    The header is either a number of seconds or an HTTP date.
+    """
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class RateLimiter:
+    """
+    Shared client-side limiter for RobotEvents requests
+
+    Combines a token bucket (requests per second) with an adaptive cap on
+    in-flight requests. The cap grows additively on each 2xx/304 response,
+    halves on every 429 and shrinks by 10% when latency exceeds
+    latency_target (AIMD). A 429's Retry-After pauses every caller, sync
+    or async.
+    """
+
+    def __init__(
+        self,
+        rate=10.0,
+        burst=10,
+        concurrency=4,
+        min_concurrency=1,
+        max_concurrency=32,
+        latency_target=2.0,
+    ):
+        """
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket size, i.e. requests allowed back-to-back
+            concurrency: Initial in-flight cap
+            min_concurrency: Floor for the in-flight cap
+            max_concurrency: Ceiling for the in-flight cap
+            latency_target: Seconds; slower responses shrink the in-flight cap
+        """
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = float(concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self.throttled_count = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self):
+        """Current whole-number in-flight cap."""
+        return max(self.min_concurrency, int(self.concurrency))
+
+    def _try_acquire(self):
+        # Returns 0 when a token and slot were taken, else seconds to wait
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self.in_flight >= self.limit:
+                return _POLL_INTERVAL
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+            self.in_flight += 1
+            return 0
+
+    def acquire(self):
+        """Block until a request may start; returns seconds spent waiting."""
+        start = time.monotonic()
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return time.monotonic() - start
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Async version of acquire; returns seconds spent waiting."""
+        start = time.monotonic()
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return time.monotonic() - start
+            await asyncio.sleep(wait)
+
+    def release(self, status=None, latency=None, retry_after=None):
+        """
+        Free an in-flight slot and adapt to the outcome
+
+        Args:
+            status: HTTP status of the response (None if the request failed)
+            latency: Seconds the request took
+            retry_after: Parsed Retry-After seconds for a 429
+        """
+        with self._lock:
+            self.in_flight -= 1
+            if status == 429:
+                self.throttled_count += 1
+                self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+                self._tokens = 0.0
+                if retry_after:
+                    self._blocked_until = max(
+                        self._blocked_until, time.monotonic() + retry_after
+                    )
+            elif latency is not None and latency > self.latency_target:
+                self.concurrency = max(self.min_concurrency, self.concurrency * 0.9)
+            elif status is not None and (200 <= status < 300 or status == 304):
+                # Roughly +1 slot per full window of successful requests
+                self.concurrency = min(
+                    self.max_concurrency, self.concurrency + 1 / self.concurrency
+                )
+
+    @contextmanager
+    def slot(self):
+        """
+        Hold a request slot for the duration of the block
+
+        The yielded dict carries the wait time and lets the caller report
+        the outcome (status, latency, retry_after) before the slot is freed.
+        """
+        outcome = {"waited": self.acquire()}
+        try:
+            yield outcome
+        finally:
+            self.release(
+                outcome.get("status"), outcome.get("latency"), outcome.get("retry_after")
+            )
+
+    @asynccontextmanager
+    async def async_slot(self):
+        """Async version of slot."""
+        outcome = {"waited": await self.acquire_async()}
+        try:
+            yield outcome
+        finally:
+            self.release(
+                outcome.get("status"), outcome.get("latency"), outcome.get("retry_after")
+            )
@@ -0,0 +1,391 @@
+import argparse
+import os
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+import requests
+from controllers.data import RobotEvents
+from controllers.sync import parse_season
+from controllers.warehouse import Warehouse
+from models.endpoints import Endpoints
+
+DEFAULT_RATINGS_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "bhm-vex-api", "ratings.sqlite"
+)
+
+PRACTICE_ROUND = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ratings (
+    team_id INTEGER PRIMARY KEY,
+    rating REAL NOT NULL,
+    matches INTEGER NOT NULL,
+    updated_at REAL
+);
+CREATE TABLE IF NOT EXISTS history (
+    team_id INTEGER NOT NULL,
+    match_id INTEGER NOT NULL,
+    event_id INTEGER,
+    played_at REAL,
+    rating REAL NOT NULL,
+    delta REAL NOT NULL,
+    PRIMARY KEY (team_id, match_id)
+);
+CREATE INDEX IF NOT EXISTS history_played_at ON history (team_id, played_at);
+CREATE TABLE IF NOT EXISTS applied (
+    match_id INTEGER PRIMARY KEY
+);
+"""
+
+
+def _id(obj):
+    return obj.get("id") if isinstance(obj, dict) else obj
+
+
+def _timestamp(value):
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def match_tuple(match):
+    """
+    Compact, picklable form of a scored EVENT_DIVISION_MATCHES/TEAM_MATCHES row
+
+    Returns:
+        (played_at, event_id, round, instance, matchnum, match_id,
+        red team IDs, blue team IDs, red score, blue score), or None for
+        practice, unscored or malformed matches
+    """
+    if match.get("round") == PRACTICE_ROUND or match.get("scored") is False:
+        return None
+    alliances = {a.get("color"): a for a in match.get("alliances") or []}
+    red, blue = alliances.get("red"), alliances.get("blue")
+    if not red or not blue or red.get("score") is None or blue.get("score") is None:
+        return None
+    teams = [
+        tuple(_id(e.get("team")) for e in alliance.get("teams") or [] if not e.get("sitting"))
+        for alliance in (red, blue)
+    ]
+    if not all(teams):
+        return None
+    played_at = _timestamp(match.get("started")) or _timestamp(match.get("scheduled")) or 0.0
+    return (
+        played_at,
+        _id(match.get("event")),
+        match.get("round") or 0,
+        match.get("instance") or 0,
+        match.get("matchnum") or 0,
+        match["id"],
+        teams[0],
+        teams[1],
+        red["score"],
+        blue["score"],
+    )
+
+
+def run_elo(ratings, matches, k, scale, initial):
+    """
+    Apply Elo to matches in order; runs in a worker process
+
+    Alliance strength is the mean of its members' ratings and every
+    member moves by k * (result - expected).
+
+    Args:
+        ratings: Dictionary team ID -> (rating, matches played) for the teams involved
+        matches: Sorted match tuples (see match_tuple)
+
+    Returns:
+        (ratings, history) with the updated entries and one
+        (team_id, match_id, event_id, played_at, rating, delta) row per team per match
+    """
+    ratings = dict(ratings)
+    history = []
+    for played_at, event_id, _, _, _, match_id, red, blue, red_score, blue_score in matches:
+        red_rating = sum(ratings.get(t, (initial, 0))[0] for t in red) / len(red)
+        blue_rating = sum(ratings.get(t, (initial, 0))[0] for t in blue) / len(blue)
+        expected = 1.0 / (1.0 + 10 ** ((blue_rating - red_rating) / scale))
+        result = 1.0 if red_score > blue_score else 0.0 if red_score < blue_score else 0.5
+        change = k * (result - expected)
+        for teams, delta in ((red, change), (blue, -change)):
+            for team in teams:
+                rating, played = ratings.get(team, (initial, 0))
+                ratings[team] = (rating + delta, played + 1)
+                history.append((team, match_id, event_id, played_at, rating + delta, delta))
+    return ratings, history
+
+
+def components(events):
+    """
+    Group events that share teams, so each group can be rated independently
+
+    Args:
+        events: Dictionary event ID -> list of match tuples
+
+    Returns:
+        List of event ID lists; no team appears in two groups
+    """
+    parent = {}
+
+    def find(x):
+        while parent.setdefault(x, x) != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for event_id, matches in events.items():
+        root = find(("event", event_id))
+        for match in matches:
+            for team in match[6] + match[7]:
+                parent[find(("team", team))] = root
+                root = find(root)
+
+    groups = defaultdict(list)
+    for event_id in events:
+        groups[find(("event", event_id))].append(event_id)
+    return list(groups.values())
+
+
+class EloRatings:
+    """
+    Incremental team Elo ratings, checkpointed to SQLite
+
+    New matches are grouped into weekly windows by event date and applied
+    window by window. Within a window, events that share no teams form
+    independent components, rated in parallel in a process pool and merged;
+    since a component's updates only touch its own teams, this gives the
+    same ratings as replaying every match in order. Each window is committed
+    with the IDs of the matches it applied, so later runs skip them and only
+    pay for new results. Results posted late are applied on arrival rather
+    than replayed into their original place.
+    """
+
+    def __init__(
+        self,
+        path=DEFAULT_RATINGS_PATH,
+        k=32.0,
+        initial=1500.0,
+        scale=400.0,
+        max_workers=None,
+        min_parallel=5000,
+    ):
+        """
+        Args:
+            path: SQLite checkpoint file
+            k: Rating points at stake per match
+            initial: Rating of a team's first match
+            scale: Rating difference that makes a 10:1 favourite
+            max_workers: Worker processes (defaults to the CPU count)
+            min_parallel: Windows with fewer matches are rated in-process,
+                where the pool's startup/pickling cost would dominate
+        """
+        self.path = path
+        self.k = k
+        self.initial = initial
+        self.scale = scale
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel = min_parallel
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(_SCHEMA)
+        self.ratings = {
+            team_id: (rating, played)
+            for team_id, rating, played in self.db.execute(
+                "SELECT team_id, rating, matches FROM ratings"
+            )
+        }
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def apply(self, matches, progress=None):
+        """
+        Rate matches not applied before
+
+        Args:
+            matches: Iterable of EVENT_DIVISION_MATCHES / TEAM_MATCHES rows, in
+                any order (duplicates, e.g. from several teams, are ignored)
+            progress: Optional callable(window, match_count) per committed window
+
+        Returns:
+            Dictionary with counts of new matches, windows and components
+        """
+        applied = {row[0] for row in self.db.execute("SELECT match_id FROM applied")}
+        events = defaultdict(dict)
+        for match in matches:
+            row = match_tuple(match)
+            if row is not None and row[5] not in applied:
+                events[row[1]][row[5]] = row
+
+        # Weekly windows keyed by the event's first match
+        windows = defaultdict(dict)
+        for event_id, rows in events.items():
+            first = min(row[0] for row in rows.values())
+            windows[datetime.fromtimestamp(first, timezone.utc).isocalendar()[:2]][event_id] = sorted(
+                rows.values()
+            )
+
+        summary = {"matches": sum(len(rows) for rows in events.values()), "windows": 0, "components": 0}
+        pool = None
+        try:
+            for window in sorted(windows):
+                window_events = windows[window]
+                groups = components(window_events)
+                count = sum(len(rows) for rows in window_events.values())
+                if pool is None and count >= self.min_parallel and len(groups) > 1:
+                    pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                self._rate(window_events, groups, pool if count >= self.min_parallel else None)
+                summary["windows"] += 1
+                summary["components"] += len(groups)
+                if progress:
+                    progress(window, count)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return summary
+
+    def _rate(self, events, groups, pool):
+        jobs = []
+        for group in self._bundles(events, groups, pool):
+            matches = sorted(row for event_id in group for row in events[event_id])
+            teams = {team for row in matches for team in row[6] + row[7]}
+            subset = {team: self.ratings[team] for team in teams if team in self.ratings}
+            jobs.append((subset, matches, self.k, self.scale, self.initial))
+
+        if pool is None:
+            results = [run_elo(*job) for job in jobs]
+        else:
+            results = pool.map(run_elo, *zip(*jobs))
+
+        history = []
+        for ratings, rows in results:
+            self.ratings.update(ratings)
+            history.extend(rows)
+        self._checkpoint(history, [row[5] for rows in events.values() for row in rows])
+
+    def _bundles(self, events, groups, pool):
+        # A handful of evenly sized bundles per worker keeps pickling overhead low
+        if pool is None:
+            return [[event_id for group in groups for event_id in group]]
+        count = self.max_workers * 2
+        bundles = [[] for _ in range(count)]
+        sizes = [0] * count
+        for group in sorted(groups, key=lambda g: -sum(len(events[e]) for e in g)):
+            smallest = sizes.index(min(sizes))
+            bundles[smallest].extend(group)
+            sizes[smallest] += sum(len(events[e]) for e in group)
+        return [bundle for bundle in bundles if bundle]
+
+    def _checkpoint(self, history, match_ids):
+        # One transaction per window: ratings, history and applied IDs move together
+        now = datetime.now(timezone.utc).timestamp()
+        touched = {row[0] for row in history}
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO ratings (team_id, rating, matches, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(team, *self.ratings[team], now) for team in touched],
+            )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO history "
+                "(team_id, match_id, event_id, played_at, rating, delta) VALUES (?, ?, ?, ?, ?, ?)",
+                history,
+            )
+            self.db.executemany(
+                "INSERT OR IGNORE INTO applied (match_id) VALUES (?)", [(m,) for m in match_ids]
+            )
+
+    def rating(self, team_id):
+        """Current rating of a team, or None if it has no rated matches."""
+        entry = self.ratings.get(team_id)
+        return entry[0] if entry else None
+
+    def history(self, team_id):
+        """
+        A team's rating after each of its matches, oldest first
+
+        Returns:
+            List of (match_id, event_id, played_at, rating, delta)
+        """
+        return self.db.execute(
+            "SELECT match_id, event_id, played_at, rating, delta FROM history "
+            "WHERE team_id = ? ORDER BY played_at, match_id",
+            (team_id,),
+        ).fetchall()
+
+    def top(self, limit=25, min_matches=5):
+        """Highest rated teams as (team_id, rating, matches)."""
+        rows = [
+            (team_id, rating, played)
+            for team_id, (rating, played) in self.ratings.items()
+            if played >= min_matches
+        ]
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows[:limit]
+
+
+def season_matches(controller, season_id):
+    """Every division match of a season from a RobotEvents client or a Warehouse."""
+    for event in controller.iter_all(Endpoints.SEASON_EVENTS, path_params={"id": season_id}):
+        for division in event.get("divisions") or []:
+            yield from controller.iter_all(
+                Endpoints.EVENT_DIVISION_MATCHES,
+                path_params={"id": event["id"], "div": division["id"]},
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incremental team Elo ratings")
+    parser.add_argument("--db", default=DEFAULT_RATINGS_PATH, help="Ratings checkpoint file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    update = commands.add_parser("update", help="Rate new matches of a season")
+    update.add_argument("season", type=parse_season, help="Season ID or name (e.g. VEX2526)")
+    update.add_argument(
+        "--offline", metavar="WAREHOUSE", help="Read matches from a synced warehouse instead of the API"
+    )
+    update.add_argument("--workers", type=int, help="Worker processes")
+    show = commands.add_parser("show", help="Current rating and history of teams")
+    show.add_argument("team_ids", type=int, nargs="*", help="Team IDs (default: top 25)")
+    args = parser.parse_args()
+
+    with EloRatings(args.db, max_workers=args.workers if args.command == "update" else None) as elo:
+        if args.command == "update":
+
+            def report(window, count):
+                print(f"{window[0]}-W{window[1]:02d}: {count} matches")
+
+            if args.offline:
+                with Warehouse(args.offline) as warehouse:
+                    summary = elo.apply(season_matches(warehouse, args.season), report)
+            else:
+                with RobotEvents() as controller:
+                    try:
+                        summary = elo.apply(season_matches(controller, args.season), report)
+                    except requests.exceptions.RequestException as e:
+                        raise SystemExit(f"ERROR fetching matches:\n{e}")
+            print(
+                f"{summary['matches']} new matches in {summary['windows']} windows "
+                f"({summary['components']} independent components)"
+            )
+        elif args.team_ids:
+            for team_id in args.team_ids:
+                rating = elo.rating(team_id)
+                print(f"Team {team_id}: {'unrated' if rating is None else f'{rating:.1f}'}")
+                for match_id, event_id, played_at, value, delta in elo.history(team_id):
+                    print(f"  event {event_id} match {match_id}: {value:.1f} ({delta:+.1f})")
+        else:
+            for rank, (team_id, rating, played) in enumerate(elo.top(), 1):
+                print(f"{rank:>3} {team_id:>8} {rating:>8.1f} {played:>5}")
@@ -0,0 +1,234 @@
+import argparse
+import json
+import os
+import re
+import time
+from controllers.data import RobotEvents
+from controllers.planner import QueryPlanner
+from models.endpoints import Endpoints
+from models.seasons import Seasons
+from models.teams import Teams
+
+DEFAULT_REGISTRY_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "bhm-vex-api", "registry.json"
+)
+
+# Seasons and programs change about once a year
+DEFAULT_MAX_AGE = 30 * 86400
+
+DEFAULT_PROGRAM = "V5RC"
+
+# Team numbers: digits then letters (2775V), or letters only for VEX U (BLRS)
+TEAM_NUMBER = re.compile(r"^(\d{1,5}[A-Za-z]+|[A-Za-z]{2,6}\d*)$")
+
+
+def _program_code(program):
+    return (program.get("code") or program.get("abbr") or "").upper() if program else ""
+
+
+class Registry:
+    """
+    Seasons, programs and team numbers, persisted between runs
+
+    /seasons and /programs are fetched once and kept on disk with every
+    team number resolved so far, so starting up costs a file read and no
+    network. Unknown team numbers are resolved in batches with chunked
+    TEAMS?number[]= queries (see QueryPlanner) and added to the index.
+    """
+
+    def __init__(self, controller: RobotEvents = None, path=DEFAULT_REGISTRY_PATH, max_age=DEFAULT_MAX_AGE):
+        """
+        Args:
+            controller: RobotEvents (or Warehouse) used to fill gaps; None for
+                a read-only registry
+            path: JSON file the registry is persisted to
+            max_age: Seconds before seasons/programs are fetched again
+        """
+        self.controller = controller
+        self.path = path
+        self.max_age = max_age
+        self.seasons = []
+        self.programs = []
+        # Upper-cased team number -> {"id", "number", "program"}
+        self.teams = {}
+        self.fetched_at = None
+        self._build_indexes()
+
+    def load(self):
+        """Read the registry from disk, if it was saved before."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return self
+        self.seasons = state.get("seasons") or []
+        self.programs = state.get("programs") or []
+        self.teams = state.get("teams") or {}
+        self.fetched_at = state.get("fetched_at")
+        self._build_indexes()
+        return self
+
+    def save(self):
+        """Write the registry atomically, so a crash never leaves half a file."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        state = {
+            "fetched_at": self.fetched_at,
+            "seasons": self.seasons,
+            "programs": self.programs,
+            "teams": self.teams,
+        }
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+
+    @property
+    def stale(self):
+        return self.fetched_at is None or time.time() - self.fetched_at > self.max_age
+
+    def refresh(self, force=False):
+        """
+        Fetch /seasons and /programs if the saved copy is missing or stale
+
+        Returns:
+            True if anything was fetched
+        """
+        if self.controller is None or not (force or self.stale):
+            return False
+        seasons = list(self.controller.iter_all(Endpoints.SEASONS))
+        programs = list(self.controller.iter_all(Endpoints.PROGRAMS))
+        if not seasons:
+            return False
+        self.seasons, self.programs = seasons, programs
+        self.fetched_at = time.time()
+        self._build_indexes()
+        self.save()
+        return True
+
+    def _build_indexes(self):
+        self._programs_by_code = {_program_code(p): p for p in self.programs}
+        self._programs_by_id = {p["id"]: p for p in self.programs}
+        self._seasons_by_id = {s["id"]: s for s in self.seasons}
+        self._seasons_by_name = {s.get("name"): s for s in self.seasons}
+        # (program code, year) -> season, for both the start and end year;
+        # iterated oldest first so a start year wins over an end year
+        self._seasons_by_year = {}
+        for season in sorted(self.seasons, key=lambda s: s.get("years_start") or 0):
+            program = season.get("program") or {}
+            code = _program_code(program) or _program_code(self._programs_by_id.get(program.get("id")))
+            for year in (season.get("years_end"), season.get("years_start")):
+                if year is not None:
+                    self._seasons_by_year[(code, int(year))] = season
+
+    def season(self, year=None, program=DEFAULT_PROGRAM):
+        """
+        Season object for a program and year, e.g. 2025 -> the 2025-2026 season
+
+        Args:
+            year: Start (or end) year; the latest season when omitted
+            program: Program code such as "V5RC" or "VIQRC"
+        """
+        code = program.upper()
+        if year is not None:
+            return self._seasons_by_year.get((code, int(year)))
+        seasons = [s for (c, _), s in self._seasons_by_year.items() if c == code]
+        return max(seasons, key=lambda s: s.get("years_start") or 0, default=None)
+
+    def season_id(self, value, program=DEFAULT_PROGRAM):
+        """
+        Season ID from a year, a Seasons enum name, a season name or an ID
+
+        Returns:
+            The ID, or None if value matches nothing
+        """
+        text = str(value).strip()
+        if text.isdigit() and len(text) == 4:
+            # A year, never an ID
+            season = self.season(int(text), program)
+            return season["id"] if season else None
+        if text.isdigit():
+            return int(text)
+        if text in Seasons.__members__:
+            return Seasons[text].value
+        season = self._seasons_by_name.get(text)
+        return season["id"] if season else None
+
+    def season_names(self):
+        """Names for a season completer: enum names, years and full season names."""
+        names = list(Seasons.__members__)
+        names += sorted({str(year) for _, year in self._seasons_by_year}, reverse=True)
+        names += [s["name"] for s in self.seasons if s.get("name")]
+        return list(dict.fromkeys(names))
+
+    def team_names(self):
+        """Names for a team completer: enum names and every known team number."""
+        return list(Teams.__members__) + sorted(entry["number"] for entry in self.teams.values())
+
+    def remember_teams(self, teams):
+        """Add team objects (e.g. from TEAMS or EVENT_TEAMS) to the number index."""
+        for team in teams:
+            if team and team.get("number"):
+                self.teams[team["number"].upper()] = {
+                    "id": team["id"],
+                    "number": team["number"],
+                    "program": _program_code(team.get("program")),
+                }
+
+    def resolve_teams(self, values, program=DEFAULT_PROGRAM):
+        """
+        Team IDs for a mix of IDs, Teams enum names and team numbers
+
+        Numbers missing from the index are resolved together with chunked
+        TEAMS?number[]= queries, and the index is saved if it grew.
+
+        Args:
+            values: e.g. ["2775V", "BH_A", 171256]
+            program: Program code preferred when a number exists in several
+
+        Returns:
+            Dictionary mapping each value to its team ID (None if unknown)
+        """
+        resolved, missing = {}, []
+        for value in values:
+            text = str(value).strip()
+            resolved[value] = None
+            if text.isdigit():
+                resolved[value] = int(text)
+            elif text in Teams.__members__:
+                resolved[value] = Teams[text].value
+            elif text.upper() in self.teams:
+                resolved[value] = self.teams[text.upper()]["id"]
+            elif TEAM_NUMBER.match(text):
+                missing.append(text.upper())
+
+        if missing and self.controller is not None:
+            planner = QueryPlanner(self.controller)
+            found = list(planner.collect(Endpoints.TEAMS, "number[]", missing))
+            # Index the requested program last, so it wins when a number is reused
+            found.sort(key=lambda t: _program_code(t.get("program")) == program.upper())
+            self.remember_teams(found)
+            if found:
+                self.save()
+            for value in resolved:
+                entry = self.teams.get(str(value).strip().upper())
+                if resolved[value] is None and entry:
+                    resolved[value] = entry["id"]
+        return resolved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the season/team registry")
+    parser.add_argument("teams", nargs="*", help="Team numbers to resolve, e.g. 2775V")
+    parser.add_argument("--path", default=DEFAULT_REGISTRY_PATH, help="Registry JSON file")
+    parser.add_argument("--force", action="store_true", help="Re-fetch seasons and programs")
+    args = parser.parse_args()
+
+    with RobotEvents() as controller:
+        registry = Registry(controller, args.path).load()
+        registry.refresh(force=args.force)
+        season = registry.season()
+        print(f"{len(registry.seasons)} seasons, {len(registry.programs)} programs")
+        if season:
+            print(f"Current {DEFAULT_PROGRAM} season: {season['name']} (ID: {season['id']})")
+        for value, team_id in registry.resolve_teams(args.teams).items():
+            print(f"{value}: {team_id if team_id is not None else 'not found'}")
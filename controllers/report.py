@@ -0,0 +1,332 @@
+import argparse
+import html
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Optional
+from rich.console import Console
+from rich.table import Table
+from controllers.analytics import _id, alliance_rows
+from controllers.cache import ResponseCache
+from controllers.data import RobotEvents
+from controllers.leaderboard import event_best
+from models.endpoints import Endpoints
+
+# Per-team data prefetched for every team at the event
+TEAM_ENDPOINTS = (
+    Endpoints.TEAM_MATCHES,
+    Endpoints.TEAM_RANKINGS,
+    Endpoints.TEAM_SKILLS,
+    Endpoints.TEAM_AWARDS,
+)
+
+# (key, column title, cell) for every report column, in display order
+COLUMNS = (
+    ("number", "Team", lambda t: t.number or str(t.team_id)),
+    ("organization", "Organization", lambda t: t.organization or ""),
+    ("event_rank", "Rank here", lambda t: str(t.event_rank or "")),
+    ("record", "W-L-T", lambda t: f"{t.wins}-{t.losses}-{t.ties}"),
+    ("win_rate", "Win %", lambda t: f"{100 * t.win_rate:.0f}" if t.played else ""),
+    ("avg_score", "Avg score", lambda t: f"{t.avg_score:.1f}" if t.played else ""),
+    ("avg_margin", "Avg margin", lambda t: f"{t.avg_margin:+.1f}" if t.played else ""),
+    ("high_score", "High", lambda t: str(t.high_score) if t.played else ""),
+    ("skills", "Skills", lambda t: str(t.skills_combined or "")),
+    (
+        "skills_split",
+        "Drv/Prog",
+        lambda t: f"{t.skills_driver}/{t.skills_programming}" if t.skills_combined else "",
+    ),
+    ("ranks", "Ranks this season", lambda t: ", ".join(str(rank) for _, _, rank in t.ranks)),
+    ("awards", "Awards", lambda t: "; ".join(t.awards)),
+)
+
+TEXT_COLUMNS = ("number", "organization", "ranks", "awards")
+
+# File extensions render() can write
+REPORT_FORMATS = (".html", ".htm", ".md")
+
+SORT_KEYS = {
+    "rank": lambda t: (t.event_rank is None, t.event_rank or 0),
+    "record": lambda t: (-t.win_rate, -t.played),
+    "skills": lambda t: (-t.skills_combined, -t.skills_programming),
+    "score": lambda t: (-t.avg_score, -t.avg_margin),
+    "number": lambda t: (t.number or "",),
+}
+
+
+def _award_title(title):
+    # "Excellence Award (VRC/VEXU/VAIRC)" -> "Excellence Award"
+    return re.sub(r"\s*\([^)]*\)\s*$", "", title or "")
+
+
+@dataclass(slots=True)
+class TeamReport:
+    """Season aggregates for one team, built from its TEAM_* results."""
+
+    team_id: int
+    number: Optional[str] = None
+    organization: Optional[str] = None
+    region: Optional[str] = None
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    points_for: int = 0
+    points_against: int = 0
+    high_score: int = 0
+    skills_combined: int = 0
+    skills_driver: int = 0
+    skills_programming: int = 0
+    event_rank: Optional[int] = None
+    # (event ID, event name, rank) per event, in event order
+    ranks: list = field(default_factory=list)
+    awards: list = field(default_factory=list)
+
+    @property
+    def played(self):
+        return self.wins + self.losses + self.ties
+
+    @property
+    def win_rate(self):
+        return (self.wins + 0.5 * self.ties) / self.played if self.played else 0.0
+
+    @property
+    def avg_score(self):
+        return self.points_for / self.played if self.played else 0.0
+
+    @property
+    def avg_margin(self):
+        return (self.points_for - self.points_against) / self.played if self.played else 0.0
+
+
+def check_paths(paths):
+    """
+    Raise ValueError for an output path render() cannot write, so callers
+    can reject it before spending a crawl on collect()
+    """
+    for path in paths:
+        if os.path.splitext(path)[1].lower() not in REPORT_FORMATS:
+            raise ValueError(f"Unsupported report format: {path} (use .html or .md)")
+
+
+def reduce_matches(team_id, rows):
+    """TEAM_MATCHES rows -> (wins, losses, ties, points for, points against, high score)."""
+    wins = losses = ties = points_for = points_against = high = 0
+    for _, teams, own, opponent in alliance_rows(rows, rounds=None):
+        if team_id not in teams:
+            continue
+        wins += own > opponent
+        losses += own < opponent
+        ties += own == opponent
+        points_for += own
+        points_against += opponent
+        high = max(high, own)
+    return wins, losses, ties, points_for, points_against, high
+
+
+def reduce_skills(team_id, rows):
+    """TEAM_SKILLS rows -> (combined, driver, programming) of the best single event."""
+    by_event = defaultdict(list)
+    for row in rows:
+        by_event[_id(row.get("event"))].append(row)
+    best = (0, 0, 0)
+    for event_rows in by_event.values():
+        _, driver, programming = event_best(event_rows).get(team_id, (None, 0, 0))
+        best = max(best, (driver + programming, driver, programming), key=lambda b: (b[0], b[2], b[1]))
+    return best
+
+
+class ScoutingReport:
+    """
+    Per-event scouting report: every attending team's season at a glance
+
+    The event's team list is fetched first, then each team's season
+    matches, rankings, skills and awards are prefetched concurrently
+    (through the controller's cache and memo, so a second run is served
+    locally). Each worker reduces its rows to a few numbers before handing
+    them back, and the report is rendered from that per-team index.
+    """
+
+    def __init__(self, controller: RobotEvents, event_id, season_id=None, max_workers=8):
+        """
+        Args:
+            controller: RobotEvents client used for all requests
+            event_id: RobotEvents event ID
+            season_id: Season to summarize (default: the event's season)
+            max_workers: Team requests in flight at once
+        """
+        self.controller = controller
+        self.event_id = event_id
+        self.season_id = season_id
+        self.max_workers = max_workers
+        self.event = None
+        self.teams = {}
+
+    def collect(self, progress=None):
+        """
+        Fetch the event, its teams and every team's season results
+
+        Args:
+            progress: Optional callable(team, endpoint, error) per request
+
+        Returns:
+            Dictionary with counts of teams, requests made and failed
+        """
+        self.event = self.controller.fetch(Endpoints.EVENT, path_params={"id": self.event_id}) or {}
+        if self.season_id is None:
+            self.season_id = (self.event.get("season") or {}).get("id")
+        for team in self.controller.iter_all(Endpoints.EVENT_TEAMS, path_params={"id": self.event_id}):
+            self.teams[team["id"]] = TeamReport(
+                team["id"],
+                team.get("number"),
+                team.get("organization"),
+                (team.get("location") or {}).get("region"),
+            )
+
+        # Same season filter main.py and the warehouse use
+        params = {"season": [self.season_id]} if self.season_id is not None else {}
+        summary = {"teams": len(self.teams), "requests": 0, "failed": 0}
+
+        def fetch(team_id, endpoint):
+            rows = self.controller.iter_all(endpoint, path_params={"id": team_id}, params=params)
+            if endpoint == Endpoints.TEAM_MATCHES:
+                return reduce_matches(team_id, rows)
+            if endpoint == Endpoints.TEAM_SKILLS:
+                return reduce_skills(team_id, rows)
+            if endpoint == Endpoints.TEAM_RANKINGS:
+                return [
+                    (_id(row.get("event")), (row.get("event") or {}).get("name"), row.get("rank"))
+                    for row in rows
+                ]
+            return [_award_title(row.get("title")) for row in rows]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(fetch, team_id, endpoint): (team_id, endpoint)
+                for team_id in self.teams
+                for endpoint in TEAM_ENDPOINTS
+            }
+            for future in as_completed(futures):
+                team_id, endpoint = futures[future]
+                summary["requests"] += 1
+                try:
+                    self._merge(self.teams[team_id], endpoint, future.result())
+                except Exception as e:
+                    # Any failure (HTTP, bad body, unexpected rows) loses one
+                    # team's column, not the whole report
+                    summary["failed"] += 1
+                    if progress:
+                        progress(self.teams[team_id], endpoint, e)
+                    continue
+                if progress:
+                    progress(self.teams[team_id], endpoint, None)
+        return summary
+
+    def _merge(self, team, endpoint, result):
+        if endpoint == Endpoints.TEAM_MATCHES:
+            (
+                team.wins,
+                team.losses,
+                team.ties,
+                team.points_for,
+                team.points_against,
+                team.high_score,
+            ) = result
+        elif endpoint == Endpoints.TEAM_SKILLS:
+            team.skills_combined, team.skills_driver, team.skills_programming = result
+        elif endpoint == Endpoints.TEAM_RANKINGS:
+            team.ranks = sorted((r for r in result if r[2] is not None), key=lambda r: r[0] or 0)
+            team.event_rank = next(
+                (rank for event_id, _, rank in team.ranks if event_id == self.event_id), None
+            )
+        else:
+            team.awards = result
+
+    def ordered(self, sort="rank"):
+        """Teams sorted for display; see SORT_KEYS."""
+        return sorted(self.teams.values(), key=SORT_KEYS[sort])
+
+    @property
+    def title(self):
+        name = (self.event or {}).get("name") or f"Event {self.event_id}"
+        return f"Scouting report: {name}"
+
+    def rows(self, sort="rank"):
+        """One list of formatted cells per team, in display order."""
+        return [[cell(team) for _, _, cell in COLUMNS] for team in self.ordered(sort)]
+
+    def table(self, rows):
+        table = Table(title=self.title)
+        for key, column, _ in COLUMNS:
+            justify = "left" if key in TEXT_COLUMNS else "right"
+            table.add_column(column, overflow="fold", justify=justify)
+        for row in rows:
+            table.add_row(*row)
+        return table
+
+    def markdown(self, rows):
+        lines = [f"# {self.title}", "", "| " + " | ".join(column for _, column, _ in COLUMNS) + " |"]
+        lines.append("|" + "---|" * len(COLUMNS))
+        for row in rows:
+            lines.append("| " + " | ".join(cell.replace("|", "\\|") for cell in row) + " |")
+        return "\n".join(lines) + "\n"
+
+    def html(self, rows):
+        header = "".join(f"<th>{html.escape(column)}</th>" for _, column, _ in COLUMNS)
+        body = "\n".join(
+            "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>" for row in rows
+        )
+        return (
+            f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{html.escape(self.title)}</title>\n"
+            "<style>body{font-family:sans-serif}table{border-collapse:collapse}"
+            "th,td{border:1px solid #ccc;padding:4px 8px}tr:nth-child(even){background:#f4f4f4}</style>\n"
+            f"</head><body>\n<h1>{html.escape(self.title)}</h1>\n"
+            f"<table>\n<tr>{header}</tr>\n{body}\n</table>\n</body></html>\n"
+        )
+
+    def render(self, sort="rank", console=None, paths=()):
+        """
+        Print the report and write it to each path (.html or .md), formatting
+        every cell once for all outputs
+
+        Raises:
+            ValueError: For an output path with an unsupported extension
+        """
+        check_paths(paths)
+        renderers = {".html": self.html, ".htm": self.html, ".md": self.markdown}
+        rows = self.rows(sort)
+        (console or Console()).print(self.table(rows))
+        for path in paths:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(renderers[os.path.splitext(path)[1].lower()](rows))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scouting report for every team at an event")
+    parser.add_argument("event_id", type=int)
+    parser.add_argument("--season", type=int, help="Season ID to summarize (default: the event's)")
+    parser.add_argument("--sort", choices=sorted(SORT_KEYS), default="rank")
+    parser.add_argument("--output", action="append", default=[], help="Also write .html or .md (repeatable)")
+    parser.add_argument("--workers", type=int, default=8, help="Team requests in flight at once")
+    args = parser.parse_args()
+    try:
+        check_paths(args.output)
+    except ValueError as e:
+        parser.error(str(e))
+
+    def report(team, endpoint, error):
+        if error:
+            print(f"{team.number} {endpoint.name}: FAILED ({error})")
+
+    cache = ResponseCache()
+    try:
+        with RobotEvents(cache=cache) as controller:
+            scouting = ScoutingReport(controller, args.event_id, args.season, args.workers)
+            summary = scouting.collect(progress=report)
+        print(f"{summary['teams']} teams, {summary['requests']} team queries, {summary['failed']} failed")
+        scouting.render(args.sort, paths=args.output)
+        for path in args.output:
+            print(f"Wrote {path}")
+    finally:
+        cache.close()
@@ -0,0 +1,104 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules main.py must only import once the feature that needs them runs
+LAZY_MODULES = ("aiohttp", "asyncio", "prompt_toolkit", "rich", "yaml", "pyarrow", "numpy")
+
+# Cold `import main` budget, in milliseconds
+DEFAULT_BUDGET_MS = 150
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def build_index():
+    """
+    Completion index for main.py, derived from the enums
+
+    Built on every start: it costs microseconds, and a prebuilt copy on
+    disk could only go stale.
+
+    Returns:
+        Dictionary with "endpoints" (prompt choice -> Endpoints name) and
+        "seasons" (Seasons name -> ID); team completion comes from the
+        Registry, which already includes the Teams names
+    """
+    from models.endpoints import Endpoints
+    from models.seasons import Seasons
+
+    return {
+        "endpoints": {endpoint.name.lower(): endpoint.name for endpoint in Endpoints},
+        "seasons": {name: season.value for name, season in Seasons.__members__.items()},
+    }
+
+
+def import_times(module="main"):
+    """
+    Cold-import a module in a fresh interpreter with -X importtime
+
+    Returns:
+        (total_ms, rows): rows are (name, self_ms, cumulative_ms, depth)
+        for every module imported by ``module`` (depth 1 = imported
+        directly), in import order
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            own, cumulative, indent, name = match.groups()
+            rows.append((name, int(own) / 1000, int(cumulative) / 1000, len(indent) // 2))
+
+    # A module is reported after everything it imported, so its subtree is
+    # the run of deeper rows just before it (interpreter startup comes first)
+    end = next(i for i, row in enumerate(rows) if row[0] == module and row[3] == 0)
+    start = end
+    while start > 0 and rows[start - 1][3] > 0:
+        start -= 1
+    return rows[end][2], rows[start:end]
+
+
+def check_budget(module="main", budget_ms=DEFAULT_BUDGET_MS, top=15):
+    """
+    Print the cold-start time of ``module`` broken down by the modules it
+    imports directly, and flag heavy modules that were imported eagerly
+
+    Returns:
+        True if the import stayed within budget with nothing eager
+    """
+    total, rows = import_times(module)
+    direct = sorted(
+        ((name, cumulative) for name, _, cumulative, depth in rows if depth == 1),
+        key=lambda row: row[1],
+        reverse=True,
+    )
+    print(f"import {module}: {total:.1f} ms (budget {budget_ms} ms)")
+    for name, cumulative in direct[:top]:
+        print(f"  {cumulative:8.1f} ms  {name}")
+
+    loaded = {name.split(".")[0] for name, _, _, _ in rows}
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    for name in eager:
+        print(f"  eager import of {name}; import it where it is used instead")
+    return total <= budget_ms and not eager
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CLI startup tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    check = commands.add_parser("check", help="Report cold-start import time by module")
+    check.add_argument("--module", default="main", help="Module to import (default: main)")
+    check.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS, help="Budget in milliseconds")
+    args = parser.parse_args()
+
+    sys.exit(0 if check_budget(args.module, args.budget) else 1)
@@ -0,0 +1,182 @@
+import re
+from models.records import loads
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+# From an opening quote to its closing quote, skipping escapes
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+# Characters that open/close containers or start a string
+_STRUCTURE = re.compile(rb'[\[\]{}"]')
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+
+# Buffered bytes already parsed are dropped once they exceed this
+_COMPACT_AT = 64 * 1024
+
+
+class _NeedMore(Exception):
+    """The value being scanned runs past the end of the buffer."""
+
+
+class PageReader:
+    """
+    Incremental parser for a {"meta": {...}, "data": [...]} response body
+
+    Bytes are pulled from ``chunks`` only as parsing needs them. Each
+    element of the top-level "data" array is cut out of the buffer and
+    decoded on its own, so the memory used is about one chunk plus one
+    row whatever the page size. Other top-level keys ("meta", ...) are
+    decoded whole into ``fields``.
+    """
+
+    def __init__(self, chunks, row=loads):
+        """
+        Args:
+            chunks: Iterable of (already decompressed) body bytes, e.g.
+                response.iter_content(65536)
+            row: Decoder for each row's bytes (default: JSON -> dict; see
+                models.records.decode for rows straight to records)
+        """
+        self.row = row
+        self.fields = {}
+        self.bytes = 0
+        self.paginated = False
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+        self._pos = 0
+        self._eof = False
+        self._decode = True
+        self._parser = self._parse()
+
+    def items(self):
+        """Yield each row of "data" as it is parsed; fields are complete afterwards."""
+        self._decode = True
+        for key, value in self._parser:
+            if key is None:
+                yield value
+
+    def read_meta(self):
+        """
+        Parse up to the top-level "meta" object and return it, skipping
+        (not decoding) any rows that come before it
+
+        Rows skipped this way are not yielded by items() later.
+        """
+        self._decode = False
+        while "meta" not in self.fields:
+            if next(self._parser, StopIteration) is StopIteration:
+                break
+        return self.fields.get("meta")
+
+    def drain(self):
+        """Read the rest of the body without parsing it (keeps the connection reusable)."""
+        for chunk in self._chunks:
+            self.bytes += len(chunk)
+
+    def _fill(self):
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            if self._eof:
+                raise ValueError("Truncated JSON response")
+            self._eof = True
+            return
+        self.bytes += len(chunk)
+        self._buffer += chunk
+
+    def _scan(self, scanner, start):
+        # Retry from the same start with more bytes until the value is complete
+        while True:
+            try:
+                return scanner(start)
+            except _NeedMore:
+                self._fill()
+
+    def _skip_whitespace(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or self._eof:
+                return
+            self._fill()
+
+    def _peek(self):
+        self._skip_whitespace()
+        if self._pos >= len(self._buffer):
+            raise ValueError("Truncated JSON response")
+        return self._buffer[self._pos : self._pos + 1]
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} at byte {self._pos} of the response")
+        self._pos += 1
+
+    def _value_end(self, start):
+        buffer = self._buffer
+        char = buffer[start : start + 1]
+        if char == b'"':
+            match = _STRING.match(buffer, start)
+            if match is None:
+                raise _NeedMore
+            return match.end()
+        if char in (b"{", b"["):
+            depth, i = 0, start
+            while True:
+                match = _STRUCTURE.search(buffer, i)
+                if match is None:
+                    raise _NeedMore
+                token = match.group()
+                if token == b'"':
+                    string = _STRING.match(buffer, match.start())
+                    if string is None:
+                        raise _NeedMore
+                    i = string.end()
+                    continue
+                depth += 1 if token in (b"{", b"[") else -1
+                i = match.end()
+                if depth == 0:
+                    return i
+        match = _SCALAR.match(buffer, start)
+        if match is None or (match.end() == len(buffer) and not self._eof):
+            raise _NeedMore
+        return match.end()
+
+    def _value(self):
+        end = self._scan(self._value_end, self._pos)
+        span = self._buffer[self._pos : end]
+        self._pos = end
+        return span
+
+    def _compact(self):
+        if self._pos > _COMPACT_AT:
+            del self._buffer[: self._pos]
+            self._pos = 0
+
+    def _parse(self):
+        # Yields (None, row) for rows of "data" and (key, value) for other fields
+        self._expect(b"{")
+        while True:
+            char = self._peek()
+            if char == b"}":
+                self._pos += 1
+                return
+            if char == b",":
+                self._pos += 1
+                continue
+            key = loads(self._value())
+            self._expect(b":")
+            if key == "data" and self._peek() == b"[":
+                self.paginated = True
+                self._pos += 1
+                while True:
+                    char = self._peek()
+                    if char == b"]":
+                        self._pos += 1
+                        break
+                    if char == b",":
+                        self._pos += 1
+                        continue
+                    span = self._value()
+                    if self._decode:
+                        yield None, self.row(span)
+                    self._compact()
+            else:
+                self._skip_whitespace()
+                self.fields[key] = loads(self._value())
+                yield key, self.fields[key]
@@ -0,0 +1,185 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+import requests
+from controllers.cache import FINISHED_GRACE
+from controllers.data import RobotEvents
+from controllers.warehouse import DEFAULT_WAREHOUSE_PATH, Warehouse
+from models.endpoints import Endpoints
+from models.seasons import Seasons
+
+
+def is_finished(event):
+    """True once an event ended long enough ago that its results are final."""
+    end = event.get("end") if isinstance(event, dict) else event
+    if not end:
+        return False
+    try:
+        end = datetime.fromisoformat(end)
+    except (TypeError, ValueError):
+        return False
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return end < datetime.now(timezone.utc) - FINISHED_GRACE
+
+
+class SeasonSync:
+    """
+    Mirror a season from RobotEvents into a local Warehouse
+
+    The season, its program and its event list are refreshed on every run,
+    but per-event data (teams, division matches, rankings, finalist
+    rankings, skills, awards) is only fetched for events that were never
+    synced or are upcoming/in progress. Finished events are synced once
+    and then left alone.
+    """
+
+    def __init__(self, controller: RobotEvents, warehouse: Warehouse, max_workers=4):
+        """
+        Args:
+            controller: RobotEvents client used for all requests
+            warehouse: Destination Warehouse
+            max_workers: Number of events fetched concurrently
+        """
+        self.controller = controller
+        self.warehouse = warehouse
+        self.max_workers = max_workers
+
+    def sync(self, season_id, force=False, progress=None):
+        """
+        Sync one season
+
+        Args:
+            season_id: RobotEvents season ID
+            force: Re-fetch every event, including finished ones
+            progress: Optional callable(event, error) called per synced event
+
+        Returns:
+            Dictionary with counts of listed, synced, skipped and failed events
+        """
+        previous = {
+            event_id: synced_at
+            for event_id, _, synced_at in self.warehouse.events(season_id)
+        }
+        # The season and its program are tiny; refresh them so offline
+        # season/program queries have something to answer with
+        seasons = list(self.controller.iter_all(Endpoints.SEASON, path_params={"id": season_id}))
+        self.warehouse.store_seasons(seasons)
+        program_ids = {(season.get("program") or {}).get("id") for season in seasons} - {None}
+        self.warehouse.store_programs(
+            program
+            for program_id in program_ids
+            for program in self.controller.iter_all(
+                Endpoints.PROGRAM, path_params={"id": program_id}
+            )
+        )
+
+        events = list(
+            self.controller.iter_all(Endpoints.SEASON_EVENTS, path_params={"id": season_id})
+        )
+        self.warehouse.store_events(events)
+
+        pending = [
+            event
+            for event in events
+            if force or previous.get(event["id"]) is None or not is_finished(event)
+        ]
+        summary = {
+            "events": len(events),
+            "synced": 0,
+            "skipped": len(events) - len(pending),
+            "failed": 0,
+        }
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self._fetch_event, event): event for event in pending}
+            for future in as_completed(futures):
+                event = futures[future]
+                try:
+                    payload = future.result()
+                except requests.exceptions.RequestException as e:
+                    summary["failed"] += 1
+                    if progress:
+                        progress(event, e)
+                    continue
+                # All writes happen on this thread, one event per transaction
+                self._store_event(event["id"], payload)
+                summary["synced"] += 1
+                if progress:
+                    progress(event, None)
+        return summary
+
+    def _fetch_event(self, event):
+        event_id = event["id"]
+        path_params = {"id": event_id}
+        payload = {
+            "teams": list(self.controller.iter_all(Endpoints.EVENT_TEAMS, path_params=path_params)),
+            "skills": list(self.controller.iter_all(Endpoints.EVENT_SKILLS, path_params=path_params)),
+            "awards": list(self.controller.iter_all(Endpoints.EVENT_AWARDS, path_params=path_params)),
+            "divisions": {},
+        }
+        for division in event.get("divisions") or []:
+            division_params = {"id": event_id, "div": division["id"]}
+            payload["divisions"][division["id"]] = {
+                "matches": list(
+                    self.controller.iter_all(
+                        Endpoints.EVENT_DIVISION_MATCHES, path_params=division_params
+                    )
+                ),
+                "rankings": list(
+                    self.controller.iter_all(
+                        Endpoints.EVENT_DIVISION_RANKINGS, path_params=division_params
+                    )
+                ),
+                "finalist_rankings": list(
+                    self.controller.iter_all(
+                        Endpoints.EVENT_DIVISION_FINALIST_RANKINGS, path_params=division_params
+                    )
+                ),
+            }
+        return payload
+
+    def _store_event(self, event_id, payload):
+        self.warehouse.store_event_teams(event_id, payload["teams"])
+        self.warehouse.store_skills(event_id, payload["skills"])
+        self.warehouse.store_awards(event_id, payload["awards"])
+        for division_id, division in payload["divisions"].items():
+            self.warehouse.store_matches(event_id, division_id, division["matches"])
+            self.warehouse.store_rankings(event_id, division_id, division["rankings"])
+            self.warehouse.store_rankings(
+                event_id, division_id, division["finalist_rankings"], finalist=True
+            )
+        self.warehouse.mark_synced(event_id, time.time())
+
+
+def parse_season(value):
+    """Accept a numeric season ID or a Seasons name such as VEX2526."""
+    if str(value).isdigit():
+        return int(value)
+    try:
+        return Seasons[value].value
+    except KeyError:
+        raise argparse.ArgumentTypeError(f"Unknown season: {value}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mirror a season into a local warehouse")
+    parser.add_argument("season", type=parse_season, help="Season ID or name (e.g. VEX2526)")
+    parser.add_argument("--db", default=DEFAULT_WAREHOUSE_PATH, help="Warehouse SQLite file")
+    parser.add_argument("--force", action="store_true", help="Re-sync finished events too")
+    parser.add_argument("--workers", type=int, default=4, help="Events fetched concurrently")
+    args = parser.parse_args()
+
+    def report(event, error):
+        status = f"FAILED ({error})" if error else "ok"
+        print(f"{event['id']} {event.get('name', '')}: {status}")
+
+    with RobotEvents() as controller, Warehouse(args.db) as warehouse:
+        summary = SeasonSync(controller, warehouse, args.workers).sync(
+            args.season, force=args.force, progress=report
+        )
+    print(
+        f"{summary['events']} events: {summary['synced']} synced, "
+        f"{summary['skipped']} unchanged, {summary['failed']} failed"
+    )
@@ -0,0 +1,335 @@
+import argparse
+import json
+import shlex
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+from rich.text import Text
+from controllers.export import export_rows
+
+# Keys used to label a nested object in a single cell, in order of preference
+LABEL_KEYS = ("name", "number", "title", "code", "id")
+
+# Longest text shown in one cell
+MAX_CELL = 80
+
+HELP = (
+    "n/p: next/previous page, g N: go to page N, sort COL [desc], filter [COL] TEXT, filter COL=TEXT, "
+    "filter: clear filters, cols COL,COL.../all, export PATH, q: quit"
+)
+
+
+def lookup(row, column):
+    """Value of a column; dotted columns ("event.name") reach into nested objects."""
+    if column in row:
+        return row[column]
+    value = row
+    for part in column.split("."):
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return None
+    return value
+
+
+def format_cell(value, depth=0):
+    """
+    Short text for one cell
+
+    Nested objects are shown by their label (team -> its number, event ->
+    its name), lists by their formatted items, and anything else falls
+    back to key: value pairs, truncated to MAX_CELL characters.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        label = next((value[key] for key in LABEL_KEYS if value.get(key) is not None), None)
+        if label is not None:
+            text = str(label)
+        elif depth >= 2:
+            text = "{...}"
+        else:
+            text = ", ".join(
+                f"{key}: {format_cell(child, depth + 1)}" for key, child in value.items()
+            )
+    elif isinstance(value, list):
+        text = ", ".join(format_cell(item, depth + 1) for item in value) if depth < 2 else "[...]"
+    else:
+        text = str(value)
+    return text if len(text) <= MAX_CELL else text[: MAX_CELL - 3] + "..."
+
+
+def _sort_key(value):
+    # Numbers before text, missing values last, so mixed columns still sort
+    if value is None:
+        return (2, "")
+    if isinstance(value, (int, float)):
+        return (0, value)
+    if isinstance(value, (dict, list)):
+        return (1, format_cell(value).lower())
+    return (1, str(value).lower())
+
+
+class ColumnStore:
+    """
+    Rows held once, with per-column values extracted on demand
+
+    Columns are the union of every row's keys in first-seen order, so rows
+    with different keys line up. A column's raw values, formatted text and
+    sort order are each computed the first time a sort or filter needs
+    them and then reused.
+    """
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows: Iterable of dicts (other values are wrapped as {"value": ...})
+        """
+        self.rows = []
+        self.columns = {}
+        for row in rows:
+            if not isinstance(row, dict):
+                row = {"value": row}
+            self.rows.append(row)
+            for key in row:
+                if key not in self.columns:
+                    self.columns[key] = None
+        self._values = {}
+        self._text = {}
+        self._order = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def values(self, column):
+        if column not in self._values:
+            self._values[column] = [lookup(row, column) for row in self.rows]
+        return self._values[column]
+
+    def text(self, column):
+        """Lower-cased formatted text of a column, for filtering."""
+        if column not in self._text:
+            self._text[column] = [format_cell(value).lower() for value in self.values(column)]
+        return self._text[column]
+
+    def order(self, column):
+        """Row indices in ascending order of a column."""
+        if column not in self._order:
+            values = self.values(column)
+            self._order[column] = sorted(range(len(values)), key=lambda i: _sort_key(values[i]))
+        return self._order[column]
+
+
+class ResultViewer:
+    """
+    Paged table over any number of result rows
+
+    Only the rows on the current page are formatted. Sorting and filtering
+    work on row indices over a ColumnStore, so browsing tens of thousands
+    of rows never rebuilds or re-renders the whole result.
+    """
+
+    def __init__(self, rows, title="Results", page_size=20, columns=None):
+        """
+        Args:
+            rows: Iterable of result rows (dicts)
+            title: Table title
+            page_size: Rows shown per page
+            columns: Columns to show (default: every key, in first-seen order)
+        """
+        self.store = ColumnStore(rows)
+        self.title = title
+        self.page_size = page_size
+        self.columns = list(columns or self.store.columns)
+        self.page = 0
+        self.sort_column = None
+        self.descending = False
+        # Column (None = any shown column) -> lower-cased text to look for
+        self.filters = {}
+        self._view = None
+
+    @property
+    def view(self):
+        """Indices of the rows that pass the filters, in display order."""
+        if self._view is None:
+            if self.sort_column is None:
+                view = range(len(self.store))
+            else:
+                view = self.store.order(self.sort_column)
+                if self.descending:
+                    # Missing values sort last either way
+                    present = sum(value is not None for value in self.store.values(self.sort_column))
+                    view = view[present - 1 :: -1] + view[present:] if present else view
+            for column, text in self.filters.items():
+                if column is None:
+                    columns = [self.store.text(c) for c in self.columns]
+                    view = [i for i in view if any(text in values[i] for values in columns)]
+                else:
+                    values = self.store.text(column)
+                    view = [i for i in view if text in values[i]]
+            self._view = view
+        return self._view
+
+    @property
+    def pages(self):
+        return max(1, -(-len(self.view) // self.page_size))
+
+    def go(self, page):
+        self.page = min(max(0, page), self.pages - 1)
+
+    def sort(self, column, descending=False):
+        self.sort_column = column
+        self.descending = descending
+        self._view = None
+        self.page = 0
+
+    def filter(self, text, column=None):
+        """Keep rows whose column (any shown column if None) contains text; empty text clears all."""
+        if text:
+            self.filters[column] = text.lower()
+        else:
+            self.filters.clear()
+        self._view = None
+        self.page = 0
+
+    def has_column(self, column):
+        """True for a known column, or a dotted path into one (e.g. "event.name")."""
+        return column in self.store.columns or column.split(".")[0] in self.store.columns
+
+    def select(self, columns):
+        """Show these columns (dotted paths allowed); None or empty shows every column."""
+        self.columns = list(columns or self.store.columns)
+        if None in self.filters:
+            self._view = None
+
+    def page_rows(self):
+        start = self.page * self.page_size
+        return [self.store.rows[i] for i in self.view[start : start + self.page_size]]
+
+    def rows(self):
+        """Every row of the current view, in display order (e.g. for export_rows)."""
+        return (self.store.rows[i] for i in self.view)
+
+    def render(self):
+        """Rich table of the current page; cells are formatted here, and only here."""
+        table = Table(title=self.title)
+        for column in self.columns:
+            marker = ""
+            if column == self.sort_column:
+                marker = " ▼" if self.descending else " ▲"
+            table.add_column(str(column).replace("_", " ").title() + marker, overflow="fold")
+        for row in self.page_rows():
+            table.add_row(*(Text(format_cell(lookup(row, column))) for column in self.columns))
+        table.caption = self.status()
+        return table
+
+    def status(self):
+        shown = len(self.view)
+        start = self.page * self.page_size
+        if shown:
+            text = f"Rows {start + 1}-{min(start + self.page_size, shown)} of {shown}"
+        else:
+            text = "No matching rows"
+        if shown != len(self.store):
+            text += f" (filtered from {len(self.store)})"
+        text += f", page {self.page + 1}/{self.pages}"
+        if self.sort_column:
+            text += f", sorted by {self.sort_column}{' desc' if self.descending else ''}"
+        return text
+
+    def command(self, line, console):
+        """
+        Apply one viewer command (see HELP)
+
+        Returns:
+            False when the viewer should close
+        """
+        try:
+            words = shlex.split(line)
+        except ValueError:
+            words = line.split()
+        if not words:
+            words = ["n"]
+        name, args = words[0].lower(), words[1:]
+        if name in ("q", "quit", "exit"):
+            return False
+        if name in ("n", "next"):
+            self.go(self.page + 1)
+        elif name in ("p", "prev"):
+            self.go(self.page - 1)
+        elif name in ("g", "go") and args and args[0].isdigit():
+            self.go(int(args[0]) - 1)
+        elif name == "sort" and args:
+            if not self.has_column(args[0]):
+                console.print(f"[red]Unknown column: {escape(args[0])}[/red]")
+                return True
+            self.sort(args[0], descending=len(args) > 1 and args[1].lower() == "desc")
+        elif name == "filter":
+            column = None
+            if args and "=" in args[0] and not args[0].startswith("="):
+                # Explicit COL=TEXT always names a column
+                column, first = args[0].split("=", 1)
+                if not self.has_column(column):
+                    console.print(f"[red]Unknown column: {escape(column)}[/red]")
+                    return True
+                args = ([first] if first else []) + args[1:]
+                if not args:
+                    console.print(f"[yellow]{escape(HELP)}[/yellow]")
+                    return True
+            elif len(args) > 1 and self.has_column(args[0]):
+                column, args = args[0], args[1:]
+            # Anything else is text to look for in every shown column
+            self.filter(" ".join(args), column=column)
+        elif name == "cols":
+            columns = [] if not args or args[0] == "all" else " ".join(args).split(",")
+            self.select([column.strip() for column in columns if column.strip()])
+        elif name == "export" and args:
+            try:
+                count = export_rows(self.rows(), args[0])
+            except (ValueError, ImportError, OSError) as e:
+                console.print(f"[red]Export failed: {escape(str(e))}[/red]")
+            else:
+                console.print(f"[green]Wrote {count} rows to {args[0]}[/green]")
+            return True
+        else:
+            console.print(f"[yellow]{escape(HELP)}[/yellow]")
+            return True
+        console.print(self.render())
+        return True
+
+    def run(self, console=None):
+        """Show the first page, then read commands until the user quits."""
+        from prompt_toolkit import prompt
+        from prompt_toolkit.completion import WordCompleter
+
+        console = console or Console()
+        console.print(self.render())
+        if self.pages == 1 and len(self.store) <= self.page_size and not self.filters:
+            # Everything is already on screen; only offer an export
+            path = prompt("Export results to file (.csv, .ndjson or .parquet, leave empty to skip): ").strip()
+            if path:
+                self.command(f"export {shlex.quote(path)}", console)
+            return
+        console.print(f"[dim]{escape(HELP)}[/dim]")
+        words = ["next", "prev", "go", "sort", "filter", "cols", "export", "quit", "desc", "all"]
+        completer = WordCompleter(words + [str(column) for column in self.store.columns])
+        while True:
+            try:
+                line = prompt("view> ", completer=completer)
+            except (EOFError, KeyboardInterrupt):
+                return
+            if not self.command(line, console):
+                return
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Browse an NDJSON file of API rows")
+    parser.add_argument("path", help="NDJSON file, e.g. written by controllers/export.py")
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(args.path, encoding="utf-8") as f:
+        viewer = ResultViewer((json.loads(line) for line in f if line.strip()), args.path, args.page_size)
+    viewer.run()
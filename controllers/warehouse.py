@@ -0,0 +1,586 @@
+import json
+import os
+import sqlite3
+import threading
+from models.endpoints import Endpoints
+
+DEFAULT_WAREHOUSE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "bhm-vex-api", "warehouse.sqlite"
+)
+
+# Every table keeps the raw API object in `data` so queries can hand back
+# exactly what RobotEvents would; the other columns exist to be indexed.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    sku TEXT,
+    name TEXT,
+    season_id INTEGER,
+    program_id INTEGER,
+    start TEXT,
+    "end" TEXT,
+    region TEXT,
+    country TEXT,
+    synced_at REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_season ON events (season_id, start);
+CREATE INDEX IF NOT EXISTS events_sku ON events (sku);
+
+CREATE TABLE IF NOT EXISTS divisions (
+    event_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT,
+    "order" INTEGER,
+    PRIMARY KEY (event_id, id)
+);
+
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    number TEXT,
+    team_name TEXT,
+    organization TEXT,
+    program_id INTEGER,
+    grade TEXT,
+    region TEXT,
+    country TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS teams_number ON teams (number);
+
+CREATE TABLE IF NOT EXISTS event_teams (
+    event_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    PRIMARY KEY (event_id, team_id)
+);
+CREATE INDEX IF NOT EXISTS event_teams_team ON event_teams (team_id);
+
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    event_id INTEGER NOT NULL,
+    division_id INTEGER NOT NULL,
+    round INTEGER,
+    instance INTEGER,
+    matchnum INTEGER,
+    scheduled TEXT,
+    started TEXT,
+    scored INTEGER,
+    red_score INTEGER,
+    blue_score INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_event_division_round
+    ON matches (event_id, division_id, round, instance, matchnum);
+
+CREATE TABLE IF NOT EXISTS match_teams (
+    match_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    color TEXT NOT NULL,
+    sitting INTEGER,
+    PRIMARY KEY (match_id, team_id)
+);
+CREATE INDEX IF NOT EXISTS match_teams_team ON match_teams (team_id);
+
+-- Finalist rankings are a separate list on the API, so IDs may repeat across the two
+CREATE TABLE IF NOT EXISTS rankings (
+    id INTEGER NOT NULL,
+    event_id INTEGER NOT NULL,
+    division_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    finalist INTEGER NOT NULL DEFAULT 0,
+    rank INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (id, finalist)
+);
+CREATE INDEX IF NOT EXISTS rankings_event_division ON rankings (event_id, division_id, rank);
+CREATE INDEX IF NOT EXISTS rankings_team ON rankings (team_id);
+
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    event_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    type TEXT,
+    score INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS skills_event ON skills (event_id, type);
+CREATE INDEX IF NOT EXISTS skills_team ON skills (team_id);
+
+CREATE TABLE IF NOT EXISTS awards (
+    id INTEGER PRIMARY KEY,
+    event_id INTEGER NOT NULL,
+    title TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS awards_event ON awards (event_id);
+
+CREATE TABLE IF NOT EXISTS award_winners (
+    award_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    PRIMARY KEY (award_id, team_id)
+);
+CREATE INDEX IF NOT EXISTS award_winners_team ON award_winners (team_id);
+
+CREATE TABLE IF NOT EXISTS seasons (
+    id INTEGER PRIMARY KEY,
+    program_id INTEGER,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS programs (
+    id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+def _id(obj):
+    """Id of a nested reference such as match["event"] or ranking["team"]."""
+    return obj.get("id") if isinstance(obj, dict) else obj
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+class Warehouse:
+    """
+    Normalized local SQLite mirror of a season
+
+    Filled by controllers.sync.SeasonSync. Exposes fetch/iter_all with the
+    same signature as RobotEvents for the endpoints it mirrors, so main.py
+    can run entirely offline against it.
+    """
+
+    def __init__(self, path=DEFAULT_WAREHOUSE_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # Writes
+
+    def store_events(self, events):
+        rows = []
+        divisions = []
+        for event in events:
+            location = event.get("location") or {}
+            rows.append(
+                (
+                    event["id"],
+                    event.get("sku"),
+                    event.get("name"),
+                    _id(event.get("season")),
+                    _id(event.get("program")),
+                    event.get("start"),
+                    event.get("end"),
+                    location.get("region"),
+                    location.get("country"),
+                    json.dumps(event),
+                )
+            )
+            for division in event.get("divisions") or []:
+                divisions.append(
+                    (event["id"], division["id"], division.get("name"), division.get("order"))
+                )
+        with self._lock, self._conn:
+            # Keep synced_at when an event is re-listed
+            self._conn.executemany(
+                'INSERT INTO events (id, sku, name, season_id, program_id, start, "end", '
+                "region, country, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET sku = excluded.sku, name = excluded.name, "
+                "season_id = excluded.season_id, program_id = excluded.program_id, "
+                'start = excluded.start, "end" = excluded."end", region = excluded.region, '
+                "country = excluded.country, data = excluded.data",
+                rows,
+            )
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO divisions (event_id, id, name, "order") '
+                "VALUES (?, ?, ?, ?)",
+                divisions,
+            )
+
+    def store_event_teams(self, event_id, teams):
+        rows = []
+        for team in teams:
+            location = team.get("location") or {}
+            rows.append(
+                (
+                    team["id"],
+                    team.get("number"),
+                    team.get("team_name"),
+                    team.get("organization"),
+                    _id(team.get("program")),
+                    team.get("grade"),
+                    location.get("region"),
+                    location.get("country"),
+                    json.dumps(team),
+                )
+            )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO teams (id, number, team_name, organization, "
+                "program_id, grade, region, country, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute("DELETE FROM event_teams WHERE event_id = ?", (event_id,))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO event_teams (event_id, team_id) VALUES (?, ?)",
+                [(event_id, row[0]) for row in rows],
+            )
+
+    def store_matches(self, event_id, division_id, matches):
+        rows = []
+        members = []
+        for match in matches:
+            scores = {}
+            for alliance in match.get("alliances") or []:
+                scores[alliance.get("color")] = alliance.get("score")
+                for entry in alliance.get("teams") or []:
+                    members.append(
+                        (
+                            match["id"],
+                            _id(entry.get("team")),
+                            alliance.get("color"),
+                            int(bool(entry.get("sitting"))),
+                        )
+                    )
+            rows.append(
+                (
+                    match["id"],
+                    event_id,
+                    division_id,
+                    match.get("round"),
+                    match.get("instance"),
+                    match.get("matchnum"),
+                    match.get("scheduled"),
+                    match.get("started"),
+                    int(bool(match.get("scored"))),
+                    scores.get("red"),
+                    scores.get("blue"),
+                    json.dumps(match),
+                )
+            )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM match_teams WHERE match_id IN "
+                "(SELECT id FROM matches WHERE event_id = ? AND division_id = ?)",
+                (event_id, division_id),
+            )
+            self._conn.execute(
+                "DELETE FROM matches WHERE event_id = ? AND division_id = ?",
+                (event_id, division_id),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO matches (id, event_id, division_id, round, instance, "
+                "matchnum, scheduled, started, scored, red_score, blue_score, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO match_teams (match_id, team_id, color, sitting) "
+                "VALUES (?, ?, ?, ?)",
+                members,
+            )
+
+    def store_rankings(self, event_id, division_id, rankings, finalist=False):
+        rows = [
+            (
+                ranking["id"],
+                event_id,
+                division_id,
+                _id(ranking.get("team")),
+                int(finalist),
+                ranking.get("rank"),
+                json.dumps(ranking),
+            )
+            for ranking in rankings
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM rankings WHERE event_id = ? AND division_id = ? AND finalist = ?",
+                (event_id, division_id, int(finalist)),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO rankings (id, event_id, division_id, team_id, "
+                "finalist, rank, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def store_skills(self, event_id, skills):
+        rows = [
+            (
+                skill["id"],
+                event_id,
+                _id(skill.get("team")),
+                skill.get("type"),
+                skill.get("score"),
+                json.dumps(skill),
+            )
+            for skill in skills
+        ]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM skills WHERE event_id = ?", (event_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO skills (id, event_id, team_id, type, score, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def store_awards(self, event_id, awards):
+        rows = []
+        winners = []
+        for award in awards:
+            rows.append((award["id"], event_id, award.get("title"), json.dumps(award)))
+            for winner in award.get("teamWinners") or []:
+                team_id = _id(winner.get("team"))
+                if team_id is not None:
+                    winners.append((award["id"], team_id))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM award_winners WHERE award_id IN "
+                "(SELECT id FROM awards WHERE event_id = ?)",
+                (event_id,),
+            )
+            self._conn.execute("DELETE FROM awards WHERE event_id = ?", (event_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO awards (id, event_id, title, data) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO award_winners (award_id, team_id) VALUES (?, ?)",
+                winners,
+            )
+
+    def store_seasons(self, seasons):
+        rows = [
+            (season["id"], _id(season.get("program")), json.dumps(season)) for season in seasons
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seasons (id, program_id, data) VALUES (?, ?, ?)", rows
+            )
+
+    def store_programs(self, programs):
+        rows = [(program["id"], json.dumps(program)) for program in programs]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO programs (id, data) VALUES (?, ?)", rows
+            )
+
+    def mark_synced(self, event_id, synced_at):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE events SET synced_at = ? WHERE id = ?", (synced_at, event_id)
+            )
+
+    # Reads
+
+    def events(self, season_id=None):
+        """Rows of (id, end, synced_at) for a season's events."""
+        query = 'SELECT id, "end", synced_at FROM events'
+        args = ()
+        if season_id is not None:
+            query += " WHERE season_id = ?"
+            args = (season_id,)
+        with self._lock:
+            return self._conn.execute(query, args).fetchall()
+
+    def divisions(self, event_id):
+        with self._lock:
+            return [
+                row[0]
+                for row in self._conn.execute(
+                    'SELECT id FROM divisions WHERE event_id = ? ORDER BY "order", id',
+                    (event_id,),
+                )
+            ]
+
+    def _select(self, query, args=()):
+        with self._lock:
+            return [json.loads(row[0]) for row in self._conn.execute(query, args)]
+
+    def _in(self, column, values, clauses, args):
+        values = _as_list(values)
+        if values:
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            args.extend(values)
+
+    def _where(self, clauses):
+        return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    def _query(self, endpoint, path_params, params):
+        # Returns a list of API-shaped objects, a single object, or None
+        # Array filters may be spelled "id[]" (as sent to the API) or "id"
+        params = {key.removesuffix("[]"): value for key, value in params.items()}
+        item_id = path_params.get("id", path_params.get("team_id"))
+        division = path_params.get("div")
+        clauses, args = [], []
+
+        if endpoint in (Endpoints.EVENTS, Endpoints.SEASON_EVENTS, Endpoints.TEAM_EVENTS):
+            if endpoint == Endpoints.SEASON_EVENTS:
+                clauses.append("e.season_id = ?")
+                args.append(item_id)
+            else:
+                self._in("e.season_id", params.get("season"), clauses, args)
+            if endpoint == Endpoints.TEAM_EVENTS:
+                clauses.append("e.id IN (SELECT event_id FROM event_teams WHERE team_id = ?)")
+                args.append(item_id)
+            self._in("e.id", params.get("id"), clauses, args)
+            self._in("e.sku", params.get("sku"), clauses, args)
+            if params.get("team"):
+                values = _as_list(params["team"])
+                clauses.append(
+                    "e.id IN (SELECT event_id FROM event_teams WHERE team_id IN "
+                    f"({', '.join('?' * len(values))}))"
+                )
+                args.extend(values)
+            return self._select(
+                f"SELECT e.data FROM events e{self._where(clauses)} ORDER BY e.start, e.id",
+                args,
+            )
+        if endpoint == Endpoints.EVENT:
+            rows = self._select("SELECT data FROM events WHERE id = ?", (item_id,))
+            return rows[0] if rows else None
+        if endpoint == Endpoints.TEAM:
+            rows = self._select("SELECT data FROM teams WHERE id = ?", (item_id,))
+            return rows[0] if rows else None
+        if endpoint == Endpoints.TEAMS:
+            self._in("id", params.get("id"), clauses, args)
+            self._in("number", params.get("number"), clauses, args)
+            if params.get("event"):
+                values = _as_list(params["event"])
+                clauses.append(
+                    "id IN (SELECT team_id FROM event_teams WHERE event_id IN "
+                    f"({', '.join('?' * len(values))}))"
+                )
+                args.extend(values)
+            return self._select(f"SELECT data FROM teams{self._where(clauses)} ORDER BY id", args)
+        if endpoint == Endpoints.EVENT_TEAMS:
+            return self._select(
+                "SELECT t.data FROM teams t JOIN event_teams et ON et.team_id = t.id "
+                "WHERE et.event_id = ? ORDER BY t.id",
+                (item_id,),
+            )
+        if endpoint == Endpoints.EVENT_DIVISION_MATCHES:
+            clauses = ["event_id = ?", "division_id = ?"]
+            args = [item_id, division]
+            self._in("round", params.get("round"), clauses, args)
+            return self._select(
+                f"SELECT data FROM matches{self._where(clauses)} "
+                "ORDER BY round, instance, matchnum",
+                args,
+            )
+        if endpoint == Endpoints.TEAM_MATCHES:
+            clauses = ["id IN (SELECT match_id FROM match_teams WHERE team_id = ?)"]
+            args = [item_id]
+            self._in("event_id", params.get("event"), clauses, args)
+            self._in("round", params.get("round"), clauses, args)
+            if params.get("season"):
+                values = _as_list(params["season"])
+                clauses.append(
+                    f"event_id IN (SELECT id FROM events WHERE season_id IN "
+                    f"({', '.join('?' * len(values))}))"
+                )
+                args.extend(values)
+            return self._select(
+                f"SELECT data FROM matches{self._where(clauses)} "
+                "ORDER BY event_id, round, instance, matchnum",
+                args,
+            )
+        if endpoint in (
+            Endpoints.EVENT_DIVISION_RANKINGS,
+            Endpoints.EVENT_DIVISION_FINALIST_RANKINGS,
+        ):
+            finalist = int(endpoint == Endpoints.EVENT_DIVISION_FINALIST_RANKINGS)
+            return self._select(
+                "SELECT data FROM rankings WHERE event_id = ? AND division_id = ? "
+                "AND finalist = ? ORDER BY rank",
+                (item_id, division, finalist),
+            )
+        if endpoint == Endpoints.TEAM_RANKINGS:
+            clauses = ["team_id = ?", "finalist = 0"]
+            args = [item_id]
+            self._in("event_id", params.get("event"), clauses, args)
+            return self._select(
+                f"SELECT data FROM rankings{self._where(clauses)} ORDER BY event_id", args
+            )
+        if endpoint in (Endpoints.EVENT_SKILLS, Endpoints.TEAM_SKILLS):
+            column = "event_id" if endpoint == Endpoints.EVENT_SKILLS else "team_id"
+            clauses = [f"{column} = ?"]
+            args = [item_id]
+            self._in("type", params.get("type"), clauses, args)
+            if endpoint == Endpoints.TEAM_SKILLS:
+                self._in("event_id", params.get("event"), clauses, args)
+            return self._select(
+                f"SELECT data FROM skills{self._where(clauses)} ORDER BY event_id, type", args
+            )
+        if endpoint == Endpoints.EVENT_AWARDS:
+            return self._select(
+                "SELECT data FROM awards WHERE event_id = ? ORDER BY id", (item_id,)
+            )
+        if endpoint == Endpoints.TEAM_AWARDS:
+            return self._select(
+                "SELECT a.data FROM awards a JOIN award_winners w ON w.award_id = a.id "
+                "WHERE w.team_id = ? ORDER BY a.event_id, a.id",
+                (item_id,),
+            )
+        if endpoint == Endpoints.SEASON:
+            rows = self._select("SELECT data FROM seasons WHERE id = ?", (item_id,))
+            return rows[0] if rows else None
+        if endpoint == Endpoints.SEASONS:
+            self._in("id", params.get("id"), clauses, args)
+            self._in("program_id", params.get("program"), clauses, args)
+            return self._select(
+                f"SELECT data FROM seasons{self._where(clauses)} ORDER BY id DESC", args
+            )
+        if endpoint == Endpoints.PROGRAM:
+            rows = self._select("SELECT data FROM programs WHERE id = ?", (item_id,))
+            return rows[0] if rows else None
+        if endpoint == Endpoints.PROGRAMS:
+            self._in("id", params.get("id"), clauses, args)
+            return self._select(f"SELECT data FROM programs{self._where(clauses)} ORDER BY id", args)
+        raise KeyError(f"{endpoint.name} is not mirrored by the warehouse")
+
+    def fetch(self, endpoint: Endpoints, **kwargs):
+        """
+        Answer a RobotEvents query from the warehouse
+
+        Same arguments and response shape as RobotEvents.fetch. Pagination
+        params are ignored: every matching row is returned on one page.
+        """
+        try:
+            result = self._query(
+                endpoint, kwargs.get("path_params") or {}, kwargs.get("params") or {}
+            )
+        except KeyError as e:
+            print(f"ERROR querying warehouse:\n{e}")
+            return
+        if isinstance(result, list):
+            meta = {"current_page": 1, "last_page": 1, "total": len(result)}
+            return {"meta": meta, "data": result}
+        return result
+
+    def iter_all(self, endpoint: Endpoints, path_params=None, params=None, **kwargs):
+        """Same as RobotEvents.iter_all, served from the warehouse."""
+        result = self._query(endpoint, path_params or {}, params or {})
+        if isinstance(result, list):
+            yield from result
+        elif result is not None:
+            yield result
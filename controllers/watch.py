@@ -0,0 +1,333 @@
+import argparse
+import time
+from datetime import datetime
+import requests
+from rich.console import Console, Group
+from rich.table import Table
+from controllers.data import RobotEvents
+from models.endpoints import Endpoints
+
+
+def diff(previous, rows, key="id"):
+    """
+    Compare a fresh result against the previous snapshot by ID
+
+    Args:
+        previous: Dictionary of ID -> row from the last poll
+        rows: Iterable of rows from this poll
+
+    Returns:
+        (snapshot, changed, removed): the new ID -> row dictionary, the IDs
+        that are new or differ from the previous snapshot, and the IDs that
+        disappeared
+    """
+    snapshot = {row[key]: row for row in rows}
+    changed = {row_id for row_id, row in snapshot.items() if previous.get(row_id) != row}
+    removed = previous.keys() - snapshot.keys()
+    return snapshot, changed, removed
+
+
+class PolledCollection:
+    """
+    Every page of one endpoint, kept current with conditional requests
+
+    Each page remembers its ETag/Last-Modified, so a poll where nothing
+    changed costs one 304 per page and no decoding or diffing.
+    """
+
+    def __init__(self, controller: RobotEvents, endpoint: Endpoints, path_params, per_page=250):
+        self.controller = controller
+        self.endpoint = endpoint
+        self.path_params = path_params
+        self.per_page = per_page
+        self.rows = {}
+        self._pages = {}
+        self._validators = {}
+        self._last_page = 1
+
+    def poll(self):
+        """
+        Refresh every page; returns (changed IDs, removed IDs)
+
+        New pages and validators are only kept once every page succeeded,
+        so a failed poll is retried in full instead of getting 304s for
+        pages whose changes were never diffed.
+        """
+        pages, validators = {}, {}
+        last_page = self._last_page
+        page = 1
+        while page <= last_page:
+            data, validators[page] = self.controller.fetch_if_changed(
+                self.endpoint,
+                path_params=self.path_params,
+                params={"per_page": self.per_page, "page": page},
+                validators=self._validators.get(page),
+            )
+            if data is not None:
+                pages[page] = data.get("data") or []
+                if page == 1:
+                    last_page = (data.get("meta") or {}).get("last_page") or 1
+            page += 1
+
+        self._validators.update(validators)
+        self._pages.update(pages)
+        self._last_page = last_page
+        for stale in [p for p in self._pages if p > last_page]:
+            del self._pages[stale], self._validators[stale]
+
+        if not pages:
+            return set(), set()
+        self.rows, changed, removed = diff(
+            self.rows, (row for p in sorted(self._pages) for row in self._pages[p])
+        )
+        return changed, removed
+
+
+class LineDiffDisplay:
+    """
+    Terminal output that rewrites only the lines that changed
+
+    Each frame is rendered off-screen and compared line by line with the
+    one on screen; the cursor is moved to each changed line and only that
+    line is rewritten (rich.live would redraw the whole frame). Output
+    that is not a terminal just gets every changed frame printed.
+    """
+
+    def __init__(self, console: Console):
+        self.console = console
+        self.lines = []
+
+    def _render(self, renderable):
+        with self.console.capture() as capture:
+            self.console.print(renderable)
+        lines = capture.get().splitlines()
+        # Cursor movement cannot reach lines scrolled off the top
+        return lines[: max(1, self.console.height - 1)]
+
+    def draw(self, renderable):
+        """Show renderable; returns the number of lines written."""
+        lines = self._render(renderable)
+        if not self.console.is_terminal:
+            if lines != self.lines:
+                self.console.file.write("\n".join(lines) + "\n")
+                self.console.file.flush()
+            written = len(lines) if lines != self.lines else 0
+            self.lines = lines
+            return written
+
+        # Shorter frames are padded with blank lines so the frame never moves
+        height = len(self.lines)
+        lines += [""] * (height - len(lines))
+        out = []
+        written = 0
+        for i, line in enumerate(lines[:height]):
+            if line != self.lines[i]:
+                up = height - i
+                # Up to line i, rewrite it, clear what is left, back down below the frame
+                out.append(f"\x1b[{up}F{line}\x1b[K\x1b[{up}E")
+                written += 1
+        for line in lines[height:]:
+            out.append(f"{line}\n")
+            written += 1
+        self.console.file.write("".join(out))
+        self.console.file.flush()
+        self.lines = lines
+        return written
+
+
+def _teams(alliance):
+    return " ".join(
+        (entry.get("team") or {}).get("name") or "" for entry in alliance.get("teams") or []
+    )
+
+
+def match_cells(match):
+    alliances = {a.get("color"): a for a in match.get("alliances") or []}
+    red, blue = alliances.get("red", {}), alliances.get("blue", {})
+    scored = match.get("scored")
+    return (
+        str(match.get("name", "")),
+        str(match.get("field") or ""),
+        _teams(red),
+        str(red.get("score", "")) if scored else "",
+        str(blue.get("score", "")) if scored else "",
+        _teams(blue),
+    )
+
+
+def ranking_cells(ranking):
+    return (
+        str(ranking.get("rank", "")),
+        (ranking.get("team") or {}).get("name") or "",
+        f"{ranking.get('wins', 0)}-{ranking.get('losses', 0)}-{ranking.get('ties', 0)}",
+        str(ranking.get("wp", "")),
+        str(ranking.get("ap", "")),
+        str(ranking.get("sp", "")),
+    )
+
+
+class EventWatcher:
+    """
+    Live view of a division's matches and rankings
+
+    Both endpoints are polled with conditional requests and diffed by ID.
+    Only rows that changed are re-formatted, the display is only redrawn
+    when something changed and then only its changed lines are rewritten
+    (see LineDiffDisplay), and it shows a bounded window of matches
+    around the latest scored one. The poll interval drops to
+    min_interval while scores are coming in and backs off towards
+    max_interval while nothing changes.
+    """
+
+    MATCH_COLUMNS = ("Match", "Field", "Red", "Red", "Blue", "Blue")
+    RANKING_COLUMNS = ("Rank", "Team", "W-L-T", "WP", "AP", "SP")
+
+    def __init__(
+        self,
+        controller: RobotEvents,
+        event_id,
+        division_id=1,
+        min_interval=15.0,
+        max_interval=120.0,
+        backoff=1.5,
+        window=20,
+    ):
+        """
+        Args:
+            controller: RobotEvents client used for polling
+            event_id: RobotEvents event ID
+            division_id: Division within the event
+            min_interval: Seconds between polls while matches are being scored
+            max_interval: Longest wait between polls while nothing changes
+            backoff: Factor the interval grows by after a poll with no changes
+            window: Number of matches and rankings shown
+        """
+        path_params = {"id": event_id, "div": division_id}
+        self.event_id = event_id
+        self.division_id = division_id
+        self.matches = PolledCollection(controller, Endpoints.EVENT_DIVISION_MATCHES, path_params)
+        self.rankings = PolledCollection(controller, Endpoints.EVENT_DIVISION_RANKINGS, path_params)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.window = window
+        self.interval = min_interval
+        self.polls = 0
+        self.updated_at = None
+        self.error = None
+        # Formatted cells per ID, rebuilt only for rows that changed
+        self._match_cells = {}
+        self._ranking_cells = {}
+        self._highlight = {"matches": set(), "rankings": set()}
+
+    def poll(self):
+        """Poll both endpoints, update the formatted rows and the interval; True if anything changed."""
+        self.polls += 1
+        try:
+            match_changes = self._refresh(self.matches, self._match_cells, match_cells)
+            ranking_changes = self._refresh(self.rankings, self._ranking_cells, ranking_cells)
+            self.error = None
+        except requests.exceptions.RequestException as e:
+            self.error = str(e)
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+            return False
+
+        updated = match_changes is not None or ranking_changes is not None
+        if updated:
+            self.updated_at = datetime.now()
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        # The first poll loads everything; only later changes are highlighted
+        if self.polls > 1:
+            self._highlight = {
+                "matches": match_changes or set(),
+                "rankings": ranking_changes or set(),
+            }
+        return updated
+
+    @staticmethod
+    def _refresh(collection, cells, formatter):
+        # Re-format only the rows that changed; None when nothing did
+        changed, removed = collection.poll()
+        if not changed and not removed:
+            return None
+        for row_id in removed:
+            cells.pop(row_id, None)
+        for row_id in changed:
+            cells[row_id] = formatter(collection.rows[row_id])
+        return changed
+
+    def _match_window(self):
+        ordered = sorted(
+            self.matches.rows.values(),
+            key=lambda m: (m.get("round") or 0, m.get("instance") or 0, m.get("matchnum") or 0),
+        )
+        scored = [i for i, match in enumerate(ordered) if match.get("scored")]
+        # Center the window on the latest scored match, showing what is next
+        anchor = scored[-1] + 1 if scored else 0
+        start = max(0, min(anchor - self.window // 2, len(ordered) - self.window))
+        return ordered[start : start + self.window]
+
+    def render(self):
+        """Renderable for LineDiffDisplay: matches, rankings and a status line."""
+        matches = Table(title=f"Event {self.event_id} division {self.division_id} matches")
+        for column in self.MATCH_COLUMNS:
+            matches.add_column(column, style="red" if column == "Red" else "blue" if column == "Blue" else None)
+        for match in self._match_window():
+            style = "bold yellow" if match["id"] in self._highlight["matches"] else None
+            matches.add_row(*self._match_cells[match["id"]], style=style)
+
+        rankings = Table(title="Rankings")
+        for column in self.RANKING_COLUMNS:
+            rankings.add_column(column)
+        top = sorted(self.rankings.rows.values(), key=lambda r: r.get("rank") or 0)
+        for ranking in top[: self.window]:
+            style = "bold yellow" if ranking["id"] in self._highlight["rankings"] else None
+            rankings.add_row(*self._ranking_cells[ranking["id"]], style=style)
+
+        grid = Table.grid(padding=(0, 2))
+        grid.add_row(matches, rankings)
+        updated = self.updated_at.strftime("%H:%M:%S") if self.updated_at else "never"
+        status = f"[dim]Last change {updated}, polling every {self.interval:.0f}s (Ctrl+C to stop)[/dim]"
+        if self.error:
+            status += f"\n[red]Last poll failed: {self.error}[/red]"
+        return Group(grid, status)
+
+    def run(self, console=None):
+        """Poll and redraw until interrupted."""
+        console = console or Console()
+        display = LineDiffDisplay(console)
+        console.show_cursor(False)
+        shown_error = None
+        try:
+            while True:
+                updated = self.poll()
+                # Redraw only when the view changed (or to show/clear an error);
+                # even then only the lines that differ are rewritten
+                if updated or self.error != shown_error or self.polls == 1:
+                    display.draw(self.render())
+                    shown_error = self.error
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            console.show_cursor(True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch an event division's matches and rankings")
+    parser.add_argument("event_id", type=int)
+    parser.add_argument("--division", type=int, default=1, help="Division ID")
+    parser.add_argument("--min-interval", type=float, default=15.0, help="Seconds between polls while scoring")
+    parser.add_argument("--max-interval", type=float, default=120.0, help="Longest wait while idle")
+    args = parser.parse_args()
+
+    with RobotEvents() as controller:
+        EventWatcher(
+            controller,
+            args.event_id,
+            args.division,
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+        ).run()
@@ -1,87 +1,266 @@
-from controllers.data import RobotEvents
+# Only light modules are imported up front; requests, rich, prompt_toolkit
+# and aiohttp load when the feature that needs them first runs, so --help,
+# --jobs and --watch start quickly (see `python -m controllers.startup check`)
+from controllers.startup import build_index
+from controllers.warehouse import DEFAULT_WAREHOUSE_PATH, Warehouse
 from models.endpoints import Endpoints
-from models.teams import Teams
-from models.seasons import Seasons
-from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
-from rich.panel import Panel
-from rich.console import Console
-from rich.table import Table
-import csv
-import io
+import argparse
 
 
 def main():
-    controller = RobotEvents()
+    parser = argparse.ArgumentParser(description="Query the RobotEvents API")
+    parser.add_argument(
+        "--offline",
+        nargs="?",
+        const=DEFAULT_WAREHOUSE_PATH,
+        metavar="DB",
+        help="answer queries from a local season warehouse (see controllers/sync.py)",
+    )
+    parser.add_argument(
+        "--jobs",
+        metavar="FILE",
+        help="run the queries in a JSON/YAML job file without prompting (see controllers/jobs.py)",
+    )
+    parser.add_argument(
+        "--watch",
+        type=int,
+        metavar="EVENT_ID",
+        help="live view of an event division's matches and rankings, updated as they change",
+    )
+    parser.add_argument(
+        "--division", type=int, default=1, help="division to --watch (default: 1)"
+    )
+    parser.add_argument(
+        "--report",
+        type=int,
+        metavar="EVENT_ID",
+        help="scouting report on every team at an event (see controllers/report.py)",
+    )
+    parser.add_argument(
+        "--report-file",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="also write the --report to an .html or .md file (repeatable)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print the slowest endpoints and where their time went after the run",
+    )
+    parser.add_argument(
+        "--trace", metavar="FILE", help="write a Chrome trace of every request (chrome://tracing)"
+    )
+    parser.add_argument(
+        "--metrics", metavar="FILE", help="write a Prometheus text snapshot of request metrics"
+    )
+    parser.add_argument(
+        "--proxy",
+        metavar="URL",
+        help="send requests through a shared caching proxy, e.g. http://host:8080/api/v2 "
+        "(see controllers/proxy.py)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="also write every API response to a cassette archive for --replay",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="answer every request from a recorded cassette, with no network access",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="simulated latency per replayed request (default: 0)",
+    )
+    args = parser.parse_args()
+
+    # Headless batch runs skip the prompts entirely
+    def start(controller):
+        if args.watch:
+            from controllers.watch import EventWatcher
+
+            EventWatcher(controller, args.watch, args.division).run()
+        elif args.report:
+            from controllers.report import ScoutingReport
+
+            scouting = ScoutingReport(controller, args.report)
+            summary = scouting.collect()
+            print(f"{summary['teams']} teams, {summary['failed']} of {summary['requests']} team queries failed")
+            scouting.render(paths=args.report_file)
+        elif args.jobs:
+            from rich.console import Console
+            from rich.markup import escape
+            from controllers.jobs import run_job_file
+
+            try:
+                run_job_file(controller, args.jobs)
+            except (OSError, ValueError, ImportError) as e:
+                Console().print(f"[red]ERROR in job file {escape(args.jobs)}:\n{escape(str(e))}[/red]")
+        else:
+            run(controller)
+
+    if args.report_file:
+        # Reject a bad extension now rather than after the whole crawl
+        from controllers.report import check_paths
+
+        try:
+            check_paths(args.report_file)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.offline and args.watch:
+        parser.error("--watch polls the live API and cannot be used with --offline")
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be combined")
+    if args.offline and (args.record or args.replay or args.proxy):
+        parser.error("--offline makes no API requests, so it cannot be combined with --proxy, --record or --replay")
+    if args.offline:
+        with Warehouse(args.offline) as warehouse:
+            start(warehouse)
+        return
+
+    from rich.console import Console
+    from controllers.cache import ResponseCache
+    from controllers.cassette import Cassette
+    from controllers.data import RobotEvents
+
+    cassette = None
+    if args.record:
+        cassette = Cassette(args.record, "record")
+    elif args.replay:
+        cassette = Cassette(args.replay, "replay", latency=args.replay_latency)
+
+    # One pooled session and on-disk cache for the whole run, closed on exit
+    cache = ResponseCache()
+    try:
+        with RobotEvents(base_url=args.proxy, cache=cache, cassette=cassette) as controller:
+            start(controller)
+
+            # Show how many requests the in-process memo saved this run
+            stats = controller.memo.stats()
+            Console().print(
+                f"[dim]Request memo: {stats['hits']} hits, "
+                f"{stats['coalesced']} coalesced, {stats['misses']} misses[/dim]"
+            )
+
+            instrumentation = controller.instrumentation
+            if args.profile:
+                print_profile(instrumentation)
+            if args.trace:
+                instrumentation.write_chrome_trace(args.trace)
+            if args.metrics:
+                instrumentation.write_prometheus(args.metrics)
+    finally:
+        cache.close()
+        if cassette is not None:
+            cassette.close()
+            Console().print(f"[dim]Cassette {cassette.path}: {len(cassette)} recorded requests[/dim]")
+
+
+def print_profile(instrumentation, limit=10):
+    """Table of the slowest endpoints, with time split by request phase."""
+    from rich.console import Console
+    from rich.table import Table
+
+    rows = instrumentation.slowest(limit)
+    if not rows:
+        return
+    table = Table(title="Slowest endpoints (seconds)")
+    for column in (
+        "Endpoint", "Requests", "p50", "p95", "Max", "Total",
+        "Limiter", "DNS", "Connect", "TTFB", "Download", "KB", "Retries", "Errors",
+    ):
+        table.add_column(column, justify="left" if column == "Endpoint" else "right")
+    for row in rows:
+        table.add_row(
+            row["endpoint"],
+            str(row["requests"]),
+            *(
+                f"{row[key]:.3f}"
+                for key in ("p50", "p95", "max", "total", "limiter", "dns", "connect", "ttfb", "download")
+            ),
+            f"{row['bytes'] / 1024:.0f}",
+            str(row["retries"]),
+            str(row["errors"]),
+        )
+    Console().print(table)
+
+
+def run(controller):
+    from prompt_toolkit import prompt
+    from prompt_toolkit.completion import WordCompleter
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    import requests
+    from controllers.planner import QueryPlanner
+    from controllers.registry import Registry
+    from controllers.viewer import ResultViewer
+
     console = Console()
 
-    # Define available endpoints for the user to select
-    available_endpoints = {
-        "team": Endpoints.TEAM,
-        "team_events": Endpoints.TEAM_EVENTS,
-        "team_matches": Endpoints.TEAM_MATCHES,
-        "team_rankings": Endpoints.TEAM_RANKINGS,
-        "team_skills": Endpoints.TEAM_SKILLS,
-        "team_awards": Endpoints.TEAM_AWARDS,
-        "events": Endpoints.EVENTS,
-        "event": Endpoints.EVENT,
-        "event_teams": Endpoints.EVENT_TEAMS,
-        "event_skills": Endpoints.EVENT_SKILLS,
-        "event_awards": Endpoints.EVENT_AWARDS,
-        "event_division_matches": Endpoints.EVENT_DIVISION_MATCHES,
-        "event_division_finalist_rankings": Endpoints.EVENT_DIVISION_FINALIST_RANKINGS,
-        "event_division_rankings": Endpoints.EVENT_DIVISION_RANKINGS,
-        "teams": Endpoints.TEAMS,
-        "programs": Endpoints.PROGRAMS,
-        "program": Endpoints.PROGRAM,
-        "seasons": Endpoints.SEASONS,
-        "season": Endpoints.SEASON,
-        "season_events": Endpoints.SEASON_EVENTS,
-    }
-
-    # Create completers for the prompt
-    endpoint_completer = WordCompleter(list(available_endpoints.keys()))
-    team_completer = WordCompleter([t.name for t in Teams])
-    season_completer = WordCompleter([s.name for s in Seasons])
+    # Endpoint choices and enum names: prompt choice -> Endpoints name
+    index = build_index()
+    available_endpoints = index["endpoints"]
+
+    # Seasons, programs and known team numbers come from the on-disk registry;
+    # only the first run (or a stale registry) touches the network
+    registry = Registry(controller).load()
+    if not isinstance(controller, Warehouse):
+        try:
+            registry.refresh()
+        except requests.exceptions.RequestException as e:
+            console.print(f"[yellow]Could not refresh seasons:\n{e}[/yellow]")
+
 
     # Find the 2025 season ID
     current_season_id = None
     console.print("[bold]Filtering for 2025 season data only[/bold]")
     
-    # Try to find the 2025 season in the Seasons enum
-    try:
-        # First look for a season specifically named "2025"
-        current_season_id = Seasons["2025"].value
-        console.print(f"Using 2025 season (ID: {current_season_id})")
-    except KeyError:
-        # Try to find a season that contains "2025" in its name
-        for season in Seasons:
-            if "2025" in season.name:
-                current_season_id = season.value
-                console.print(f"Using {season.name} season (ID: {current_season_id})")
-                break
-        
+    season = registry.season(2025)
+    if season is not None:
+        current_season_id = season["id"]
+        console.print(f"Using {season.get('name')} (ID: {current_season_id})")
+    else:
+        # No registry yet (e.g. offline): fall back to the Seasons enum
+        seasons = index["seasons"]
+        if "2025" in seasons:
+            # First look for a season specifically named "2025"
+            current_season_id = seasons["2025"]
+            console.print(f"Using 2025 season (ID: {current_season_id})")
+        else:
+            # Try to find a season that contains "2025" in its name
+            for name, season_id in seasons.items():
+                if "2025" in name:
+                    current_season_id = season_id
+                    console.print(f"Using {name} season (ID: {current_season_id})")
+                    break
+
+    if current_season_id is None:
+        # If we still don't have a 2025 season, prompt the user
+        console.print("[yellow]Could not automatically identify the 2025 season. Please select it manually.[/yellow]")
+        season_name = prompt(
+            "Enter the 2025 season name (use tab for suggestions): ",
+            completer=WordCompleter(registry.season_names()),
+        )
+        current_season_id = registry.season_id(season_name)
         if current_season_id is None:
-            # If we still don't have a 2025 season, prompt the user
-            console.print("[yellow]Could not automatically identify the 2025 season. Please select it manually.[/yellow]")
-            season_name = prompt(
-                "Enter the 2025 season name (use tab for suggestions): ",
-                completer=season_completer,
-            )
-            try:
-                current_season_id = Seasons[season_name].value
-            except KeyError:
-                console.print(f"[red]Invalid season: {season_name}[/red]")
-                return
+            console.print(f"[red]Invalid season: {season_name}[/red]")
+            return
 
     # Ask user what to query
     endpoint_choice = prompt(
-        "What would you like to query?: ", completer=endpoint_completer
+        "What would you like to query?: ", completer=WordCompleter(list(available_endpoints))
     )
 
     if endpoint_choice not in available_endpoints:
         console.print(f"[red]Invalid endpoint: {endpoint_choice}[/red]")
         return
+    selected_endpoint = Endpoints[available_endpoints[endpoint_choice]]
 
     # Get team ID if needed
     team_ids = []
@@ -97,24 +276,29 @@ def main():
         ]
     ):
         team_input_method = prompt(
-            "Enter 'names' for team names or 'ids' for direct IDs: "
+            "Enter 'names' for team names/numbers or 'ids' for direct IDs: "
         )
         
         if team_input_method.lower() == 'names':
             team_names_input = prompt(
-                "Enter team(s) (comma-separated, use tab for suggestions, or leave empty for none): ",
-                completer=team_completer,
+                "Enter team name(s) or number(s) like 2775V (comma-separated, use tab for suggestions, or leave empty for none): ",
+                completer=WordCompleter(registry.team_names(), ignore_case=True),
             )
             
             if team_names_input:
                 team_names = [name.strip() for name in team_names_input.split(',')]
-                
+
+                # Unknown numbers are looked up together in one batched query
+                try:
+                    resolved = registry.resolve_teams(team_names)
+                except requests.exceptions.RequestException as e:
+                    console.print(f"[red]ERROR looking up teams:\n{e}[/red]")
+                    return
                 for team_name in team_names:
-                    try:
-                        team_ids.append(Teams[team_name].value)
-                    except KeyError:
+                    if resolved[team_name] is None:
                         console.print(f"[red]Invalid team: {team_name}[/red]")
                         return
+                    team_ids.append(resolved[team_name])
         
         elif team_input_method.lower() == 'ids':
             team_ids_input = prompt(
@@ -186,11 +370,53 @@ def main():
     # Additional parameters based on endpoint
     params = {"season": [current_season_id]}  # Always include the 2025 season filter
 
-    per_page = int(prompt("Results per page: ", default="50"))
+    per_page = int(prompt("Results per page: ", default="250"))
     params["per_page"] = per_page
+    fetch_all_pages = prompt("Fetch all pages? (y/n): ", default="y").lower() == "y"
+
+    # Function to fetch a result, following pagination when requested
+    def fetch_result(endpoint, path_params, endpoint_params):
+        # Single-object endpoints (e.g. /teams/{id}) have no pages to follow
+        if not fetch_all_pages or endpoint.value.endswith("}"):
+            return controller.fetch(
+                endpoint, path_params=path_params, params=endpoint_params
+            )
+
+        query_params = {k: v for k, v in endpoint_params.items() if k != "per_page"}
+        try:
+            items = list(
+                controller.iter_all(
+                    endpoint,
+                    path_params=path_params,
+                    params=query_params,
+                    per_page=per_page,
+                )
+            )
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]ERROR querying {endpoint.value}:\n{e}[/red]")
+            return None
+        return {"data": items, "meta": {"total": len(items)}}
     
-    # Function to fetch data for a single team
-    def fetch_team_data(team_id):
+    # Function to stream every page of a result into a CSV/NDJSON/Parquet file
+    def export_result(endpoint, path_params, endpoint_params, path):
+        from controllers.export import export_rows
+
+        query_params = {k: v for k, v in endpoint_params.items() if k != "per_page"}
+        rows = controller.iter_all(
+            endpoint, path_params=path_params, params=query_params, per_page=per_page
+        )
+        try:
+            count = export_rows(rows, path)
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]ERROR querying {endpoint.value}:\n{e}[/red]")
+            return
+        except (ValueError, ImportError, OSError) as e:
+            console.print(f"[red]Export failed: {e}[/red]")
+            return
+        console.print(f"[green]Wrote {count} rows to {path}[/green]")
+
+    # Function to build the path and query params for a single team
+    def team_query(team_id):
         # Initialize path_params for this team
         team_path_params = {}
         if team_id is not None and "team" in endpoint_choice:
@@ -207,44 +433,169 @@ def main():
         if endpoint_choice == "team_events":
             # For team_events, we can directly filter by season
             endpoint_params["season"] = [current_season_id]
-        elif endpoint_choice == "team_matches":
+        return team_path_params, endpoint_params
+
+    # Function to keep only matches played at the given events
+    # (builds a new result: responses from the request memo are shared)
+    def keep_events(result, event_ids):
+        if isinstance(result, dict) and isinstance(result.get("data"), list):
+            result = {
+                **result,
+                "data": [
+                    item
+                    for item in result["data"]
+                    if (item.get("event") or {}).get("id") in event_ids
+                ],
+            }
+        return result
+
+    # Function to fetch data for a single team
+    # season_event_ids: precomputed 2025 event IDs shared by every team (see QueryPlanner)
+    def fetch_team_data(team_id, season_event_ids=None):
+        team_path_params, endpoint_params = team_query(team_id)
+
+        if endpoint_choice == "team_matches" and season_event_ids is not None:
+            return keep_events(
+                fetch_result(
+                    selected_endpoint, team_path_params, endpoint_params
+                ),
+                season_event_ids,
+            )
+
+        if endpoint_choice == "team_matches":
             # For team_matches, we need to get events from the 2025 season first
             # and then filter the matches based on those events
             if "season_events" not in endpoint_params:
-                # First get all 2025 events for this team
-                events_result = controller.fetch(
-                    Endpoints.TEAM_EVENTS,
-                    path_params={"id": team_id},
-                    params={"season": [current_season_id], "per_page": 100}
-                )
-                
-                if isinstance(events_result, dict) and "data" in events_result:
-                    event_data = events_result["data"]
-                    if event_data:
-                        # Get event IDs
-                        event_ids = [event["id"] for event in event_data]
-                        endpoint_params["event"] = event_ids
+                # First get all 2025 events for this team (every page)
+                try:
+                    event_ids = [
+                        event["id"]
+                        for event in controller.iter_all(
+                            Endpoints.TEAM_EVENTS,
+                            path_params={"id": team_id},
+                            params={"season": [current_season_id]},
+                        )
+                    ]
+                except requests.exceptions.RequestException as e:
+                    console.print(f"[red]ERROR querying team events:\n{e}[/red]")
+                    event_ids = []
+
+                if event_ids:
+                    endpoint_params["event"] = event_ids
         
         # Fetch the data for this team with appropriate filtering
-        return controller.fetch(
-            available_endpoints[endpoint_choice],
-            path_params=team_path_params,
-            params=endpoint_params,
+        return fetch_result(
+            selected_endpoint, team_path_params, endpoint_params
         )
+
+    # Async counterpart of fetch_team_data, used to fan out over many teams
+    async def fetch_team_data_async(client, team_id, season_event_ids=None):
+        import aiohttp
+        import asyncio
+        from controllers.cassette import CassetteMiss
+
+        team_path_params, endpoint_params = team_query(team_id)
+        endpoint = selected_endpoint
+
+        try:
+            if (
+                endpoint_choice == "team_matches"
+                and season_event_ids is None
+                and "season_events" not in endpoint_params
+            ):
+                event_ids = [
+                    event["id"]
+                    async for event in client.iter_all(
+                        Endpoints.TEAM_EVENTS,
+                        path_params={"id": team_id},
+                        params={"season": [current_season_id]},
+                    )
+                ]
+                if event_ids:
+                    endpoint_params["event"] = event_ids
+
+            # Single-object endpoints (e.g. /teams/{id}) have no pages to follow
+            if not fetch_all_pages or endpoint.value.endswith("}"):
+                result = await client.fetch(
+                    endpoint, path_params=team_path_params, params=endpoint_params
+                )
+                if season_event_ids is not None:
+                    result = keep_events(result, season_event_ids)
+                return result
+
+            query_params = {k: v for k, v in endpoint_params.items() if k != "per_page"}
+            items = [
+                item
+                async for item in client.iter_all(
+                    endpoint,
+                    path_params=team_path_params,
+                    params=query_params,
+                    per_page=per_page,
+                )
+            ]
+        except (aiohttp.ClientError, asyncio.TimeoutError, CassetteMiss) as e:
+            console.print(f"[red]ERROR querying team {team_id}:\n{e}[/red]")
+            return None
+        result = {"data": items, "meta": {"total": len(items)}}
+        if season_event_ids is not None:
+            result = keep_events(result, season_event_ids)
+        return result
+
+    # Fetch every team concurrently; results come back in team_ids order
+    async def fetch_many_teams(ids, season_event_ids=None):
+        from controllers.async_data import AsyncRobotEvents
+
+        async with AsyncRobotEvents(
+            base_url=controller.BASE_URL,
+            cache=controller.cache,
+            limiter=controller.limiter,
+            memo=controller.memo or False,
+            instrumentation=controller.instrumentation,
+            cassette=controller.cassette,
+        ) as client:
+            return await client.gather_many(
+                fetch_team_data_async(client, team_id, season_event_ids)
+                for team_id in ids
+            )
     
     # If we have team IDs, fetch data for each team and concatenate the results
     if team_ids and "team" in endpoint_choice:
         console.print(f"\n[bold]Fetching 2025 season data for {len(team_ids)} teams...[/bold]")
+        planner = QueryPlanner(controller)
+        season_event_ids = None
+
+        try:
+            if endpoint_choice == "team":
+                # One chunked TEAMS?id[]= query instead of a request per team
+                teams_by_id = planner.teams(team_ids)
+                team_results = [
+                    {"data": teams_by_id[team_id]} if teams_by_id[team_id] else None
+                    for team_id in team_ids
+                ]
+            elif endpoint_choice == "team_matches" and len(team_ids) > 1:
+                # One chunked EVENTS?team[]= query replaces a TEAM_EVENTS call per team
+                season_event_ids = planner.team_event_ids(team_ids, current_season_id)
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]ERROR querying teams:\n{e}[/red]")
+            return
+
+        if endpoint_choice != "team":
+            if isinstance(controller, Warehouse):
+                # Offline lookups are local and fast, no need to fan out
+                team_results = [
+                    fetch_team_data(team_id, season_event_ids) for team_id in team_ids
+                ]
+            else:
+                import asyncio
+
+                team_results = asyncio.run(fetch_many_teams(team_ids, season_event_ids))
         
         # Initialize the combined result
         combined_result = None
         
-        # Process each team ID
-        for i, team_id in enumerate(team_ids):
-            console.print(f"Processing team ID {team_id} ({i+1}/{len(team_ids)})...")
-            
-            # Fetch data for this team
-            result = fetch_team_data(team_id)
+        # Merge each team's result in the order the teams were entered
+        for i, (team_id, result) in enumerate(zip(team_ids, team_results)):
+            console.print(f"Merging team ID {team_id} ({i+1}/{len(team_ids)})...")
             
             # Initialize combined_result with the structure of the first result
             if combined_result is None:
@@ -253,26 +604,27 @@ def main():
                 else:
                     combined_result = []
             
-            # Add this team's data to the combined result
+            # Add this team's data to the combined result. Items are copied
+            # before tagging: the request memo hands out shared objects
             if isinstance(result, dict) and "data" in result:
                 if isinstance(result["data"], list):
                     # For list data, merge all items together
                     for item in result["data"]:
                         # Ensure each item has a team_id field if not already present
                         if "team_id" not in item and endpoint_choice != "team":
-                            item["team_id"] = team_id
+                            item = {**item, "team_id": team_id}
                         combined_result["data"].append(item)
                 else:
                     # For non-list data, add as a single item with team_id
                     item = result["data"]
                     if "team_id" not in item:
-                        item["team_id"] = team_id
+                        item = {**item, "team_id": team_id}
                     combined_result["data"].append(item)
             elif isinstance(result, list):
                 # For list results, merge all items
                 for item in result:
                     if isinstance(item, dict) and "team_id" not in item:
-                        item["team_id"] = team_id
+                        item = {**item, "team_id": team_id}
                     combined_result.append(item)
             else:
                 # If it's neither a dict with data nor a list, print a warning
@@ -294,154 +646,52 @@ def main():
             if event_id is not None and "event" in endpoint_choice:
                 path_params["id"] = event_id
                 
-            result = controller.fetch(
-                available_endpoints[endpoint_choice],
-                path_params=path_params,
-                params=params,
+            # Collections can go straight to disk, one page at a time,
+            # without holding every row for the viewer
+            export_path = ""
+            if fetch_all_pages and not selected_endpoint.value.endswith("}"):
+                export_path = prompt(
+                    "Stream all results to a file instead of viewing them "
+                    "(.csv, .ndjson or .parquet, leave empty to view): "
+                ).strip()
+            if export_path:
+                export_result(selected_endpoint, path_params, params, export_path)
+                return
+
+            result = fetch_result(
+                selected_endpoint, path_params, params
             )
 
-    # Display results in a formatted panel
+    # Display results: single objects in a panel, lists in the paged viewer
     console.print(f"\n[bold green]Results for {endpoint_choice} (2025 season only):[/bold green]")
+    title = f"{endpoint_choice.replace('_', ' ').title()} (2025 Season)"
+
+    def show_object(obj):
+        panel_content = ""
+        for key, value in obj.items():
+            if key == "meta":  # Skip meta information in the panel
+                continue
+            if isinstance(value, (dict, list)):
+                panel_content += f"[bold]{key}[/bold]: {len(value)} items\n"
+            else:
+                panel_content += f"[bold]{key}[/bold]: {value}\n"
+        console.print(Panel(panel_content, title=f"[bold blue]{title}[/bold blue]"))
 
     # Check if result has a data field (common API response format)
     if isinstance(result, dict) and "data" in result:
-        data = result["data"]
-
-        if isinstance(data, dict):
-            # For single object responses within data field
-            panel_content = ""
-            for key, value in data.items():
-                if isinstance(value, (dict, list)):
-                    panel_content += f"[bold]{key}[/bold]: {len(value)} items\n"
-                else:
-                    panel_content += f"[bold]{key}[/bold]: {value}\n"
-            console.print(
-                Panel(
-                    panel_content,
-                    title=f"[bold blue]{endpoint_choice.replace('_', ' ').title()} (2025 Season)[/bold blue]",
-                )
-            )
-
-        elif isinstance(data, list):
-            # For list responses within data field
-            if data:
-                console.print(f"[green]Found {len(data)} results for 2025 season[/green]")
-                
-                if isinstance(data[0], dict):
-                    # Create a table with columns based on the first item's keys
-                    table = Table(title=f"{endpoint_choice.replace('_', ' ').title()} (2025 Season)")
-
-                    # Use all available keys
-                    all_keys = list(data[0].keys())
-
-                    for key in all_keys:
-                        table.add_column(
-                            str(key).replace("_", " ").title(), overflow="fold"
-                        )
-
-                    # Add rows (limit to 20 for display)
-                    display_count = min(20, len(data))
-                    for item in data[:display_count]:
-                        table.add_row(*[str(item.get(key, "")) for key in all_keys])
-
-                    console.print(table)
-                    if len(data) > 20:
-                        console.print(f"[italic](Showing 20 of {len(data)} results)[/italic]")
-
-                    # Convert data to CSV format
-                    output = io.StringIO()
-                    csv_writer = csv.writer(output)
-                    if data:
-                        # Write header
-                        csv_writer.writerow(data[0].keys())
-                        # Write rows
-                        for row in data:
-                            csv_writer.writerow(row.values())
-
-                    console.print("\n[bold]CSV Output (2025 Season):[/bold]")
-                    console.print(output.getvalue())
-                    output.close()
-                else:
-                    # Simple list display if not dict items
-                    console.print(
-                        Panel(
-                            str(data),
-                            title=f"[bold blue]{endpoint_choice.replace('_', ' ').title()} (2025 Season)[/bold blue]",
-                        )
-                    )
-            else:
-                console.print("[yellow]No data found for the 2025 season with these parameters.[/yellow]")
-    elif isinstance(result, dict):
-        # For single object responses (without data field)
-        panel_content = ""
-        for key, value in result.items():
-            if key != "meta":  # Skip meta information in the panel
-                if isinstance(value, (dict, list)):
-                    panel_content += f"[bold]{key}[/bold]: {len(value)} items\n"
-                else:
-                    panel_content += f"[bold]{key}[/bold]: {value}\n"
-        console.print(
-            Panel(
-                panel_content,
-                title=f"[bold blue]{endpoint_choice.replace('_', ' ').title()} (2025 Season)[/bold blue]",
-            )
-        )
+        result = result["data"]
 
+    if isinstance(result, dict):
+        show_object(result)
     elif isinstance(result, list):
-        # For list responses
         if result:
             console.print(f"[green]Found {len(result)} results for 2025 season[/green]")
-            
-            if isinstance(result[0], dict):
-                # Create a table with columns based on the first item's keys
-                table = Table(title=f"{endpoint_choice.replace('_', ' ').title()} (2025 Season)")
-
-                # Use all available keys
-                all_keys = list(result[0].keys())
-
-                for key in all_keys:
-                    table.add_column(str(key).replace("_", " ").title(), overflow="fold")
-
-                # Add rows (limit to 20 for display)
-                display_count = min(20, len(result))
-                for item in result[:display_count]:
-                    table.add_row(*[str(item.get(key, "")) for key in all_keys])
-
-                console.print(table)
-                if len(result) > 20:
-                    console.print(f"[italic](Showing 20 of {len(result)} results)[/italic]")
-                
-                # Convert data to CSV format
-                output = io.StringIO()
-                csv_writer = csv.writer(output)
-                if result:
-                    # Write header
-                    csv_writer.writerow(result[0].keys())
-                    # Write rows
-                    for row in result:
-                        csv_writer.writerow(row.values())
-
-                console.print("\n[bold]CSV Output (2025 Season):[/bold]")
-                console.print(output.getvalue())
-            else:
-                # Simple list display if not dict items
-                console.print(
-                    Panel(
-                        str(result),
-                        title=f"[bold blue]{endpoint_choice.replace('_', ' ').title()} (2025 Season)[/bold blue]",
-                    )
-                )
+            ResultViewer(result, title).run(console)
         else:
             console.print("[yellow]No data found for the 2025 season with these parameters.[/yellow]")
     else:
         # Fallback for other types
-        console.print(
-            Panel(
-                str(result),
-                title=f"[bold blue]{endpoint_choice.replace('_', ' ').title()} (2025 Season)[/bold blue]",
-            )
-        )
-
+        console.print(Panel(str(result), title=f"[bold blue]{title}[/bold blue]"))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,306 @@
+import json
+import sys
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from models.endpoints import Endpoints
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(body):
+    """Decode JSON bytes/str with orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def dumps(data):
+    """Encode to JSON bytes with orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _intern(value):
+    # Team numbers, event names, colors etc. repeat across thousands of rows
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _id(obj):
+    return obj.get("id") if isinstance(obj, dict) else obj
+
+
+def _name(obj):
+    return _intern(obj.get("name")) if isinstance(obj, dict) else None
+
+
+@dataclass(frozen=True, slots=True)
+class Division:
+    id: int
+    name: Optional[str]
+    order: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["id"], _intern(data.get("name")), data.get("order"))
+
+
+@dataclass(frozen=True, slots=True)
+class Team:
+    id: int
+    number: Optional[str]
+    team_name: Optional[str]
+    organization: Optional[str]
+    grade: Optional[str]
+    program_id: Optional[int]
+    city: Optional[str]
+    region: Optional[str]
+    country: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data):
+        location = data.get("location") or {}
+        return cls(
+            data["id"],
+            _intern(data.get("number")),
+            data.get("team_name"),
+            data.get("organization"),
+            _intern(data.get("grade")),
+            _id(data.get("program")),
+            _intern(location.get("city")),
+            _intern(location.get("region")),
+            _intern(location.get("country")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    id: int
+    sku: Optional[str]
+    name: Optional[str]
+    start: Optional[str]
+    end: Optional[str]
+    season_id: Optional[int]
+    program_id: Optional[int]
+    level: Optional[str]
+    city: Optional[str]
+    region: Optional[str]
+    country: Optional[str]
+    divisions: Tuple[Division, ...]
+
+    @classmethod
+    def from_dict(cls, data):
+        location = data.get("location") or {}
+        return cls(
+            data["id"],
+            _intern(data.get("sku")),
+            _intern(data.get("name")),
+            _intern(data.get("start")),
+            _intern(data.get("end")),
+            _id(data.get("season")),
+            _id(data.get("program")),
+            _intern(data.get("level")),
+            _intern(location.get("city")),
+            _intern(location.get("region")),
+            _intern(location.get("country")),
+            tuple(Division.from_dict(d) for d in data.get("divisions") or ()),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Alliance:
+    color: str
+    score: Optional[int]
+    team_ids: Tuple[int, ...]
+    team_numbers: Tuple[str, ...]
+    sitting: Tuple[bool, ...]
+
+    @classmethod
+    def from_dict(cls, data):
+        teams = data.get("teams") or ()
+        return cls(
+            _intern(data.get("color")),
+            data.get("score"),
+            tuple(_id(t.get("team")) for t in teams),
+            tuple(_name(t.get("team")) for t in teams),
+            tuple(bool(t.get("sitting")) for t in teams),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Match:
+    id: int
+    event_id: Optional[int]
+    division_id: Optional[int]
+    round: Optional[int]
+    instance: Optional[int]
+    matchnum: Optional[int]
+    name: Optional[str]
+    scheduled: Optional[str]
+    started: Optional[str]
+    field: Optional[str]
+    scored: bool
+    alliances: Tuple[Alliance, ...]
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["id"],
+            _id(data.get("event")),
+            _id(data.get("division")),
+            data.get("round"),
+            data.get("instance"),
+            data.get("matchnum"),
+            _intern(data.get("name")),
+            data.get("scheduled"),
+            data.get("started"),
+            _intern(data.get("field")),
+            bool(data.get("scored")),
+            tuple(Alliance.from_dict(a) for a in data.get("alliances") or ()),
+        )
+
+    def alliance(self, color):
+        """The alliance with the given color ("red"/"blue"), or None."""
+        return next((a for a in self.alliances if a.color == color), None)
+
+
+@dataclass(frozen=True, slots=True)
+class Ranking:
+    id: int
+    event_id: Optional[int]
+    division_id: Optional[int]
+    team_id: Optional[int]
+    team_number: Optional[str]
+    rank: Optional[int]
+    wins: Optional[int]
+    losses: Optional[int]
+    ties: Optional[int]
+    wp: Optional[int]
+    ap: Optional[int]
+    sp: Optional[int]
+    high_score: Optional[int]
+    average_points: Optional[float]
+    total_points: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["id"],
+            _id(data.get("event")),
+            _id(data.get("division")),
+            _id(data.get("team")),
+            _name(data.get("team")),
+            data.get("rank"),
+            data.get("wins"),
+            data.get("losses"),
+            data.get("ties"),
+            data.get("wp"),
+            data.get("ap"),
+            data.get("sp"),
+            data.get("high_score"),
+            data.get("average_points"),
+            data.get("total_points"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Skill:
+    id: int
+    event_id: Optional[int]
+    team_id: Optional[int]
+    team_number: Optional[str]
+    type: Optional[str]
+    season_id: Optional[int]
+    rank: Optional[int]
+    score: Optional[int]
+    attempts: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["id"],
+            _id(data.get("event")),
+            _id(data.get("team")),
+            _name(data.get("team")),
+            _intern(data.get("type")),
+            _id(data.get("season")),
+            data.get("rank"),
+            data.get("score"),
+            data.get("attempts"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Award:
+    id: int
+    event_id: Optional[int]
+    title: Optional[str]
+    order: Optional[int]
+    qualifications: Tuple[str, ...]
+    team_ids: Tuple[int, ...]
+    team_numbers: Tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, data):
+        winners = [w.get("team") for w in data.get("teamWinners") or ()]
+        return cls(
+            data["id"],
+            _id(data.get("event")),
+            _intern(data.get("title")),
+            data.get("order"),
+            tuple(_intern(q) for q in data.get("qualifications") or ()),
+            tuple(_id(t) for t in winners if t),
+            tuple(_name(t) for t in winners if t),
+        )
+
+
+# Record type produced by each endpoint
+RECORD_TYPES = {
+    Endpoints.TEAMS: Team,
+    Endpoints.TEAM: Team,
+    Endpoints.EVENT_TEAMS: Team,
+    Endpoints.EVENTS: Event,
+    Endpoints.EVENT: Event,
+    Endpoints.TEAM_EVENTS: Event,
+    Endpoints.SEASON_EVENTS: Event,
+    Endpoints.EVENT_DIVISION_MATCHES: Match,
+    Endpoints.TEAM_MATCHES: Match,
+    Endpoints.EVENT_DIVISION_RANKINGS: Ranking,
+    Endpoints.EVENT_DIVISION_FINALIST_RANKINGS: Ranking,
+    Endpoints.TEAM_RANKINGS: Ranking,
+    Endpoints.EVENT_SKILLS: Skill,
+    Endpoints.TEAM_SKILLS: Skill,
+    Endpoints.EVENT_AWARDS: Award,
+    Endpoints.TEAM_AWARDS: Award,
+}
+
+
+def record_type_for(endpoint: Endpoints):
+    """
+    Record class for an endpoint's rows
+
+    Raises:
+        ValueError: For endpoints without a record type (e.g. SEASONS, PROGRAMS)
+    """
+    try:
+        return RECORD_TYPES[endpoint]
+    except KeyError:
+        raise ValueError(f"No record type for {endpoint.name}; use iter_all instead") from None
+
+
+def decode(body, record_type):
+    """
+    Decode one JSON object's bytes straight into a record
+
+    Used per row by the streaming page parser, so the intermediate dict
+    is dropped as soon as its record exists instead of living as long as
+    its page.
+
+    Args:
+        body: Raw JSON bytes of one object (a row, or a single-object response)
+        record_type: One of the record classes, e.g. Match
+    """
+    return record_type.from_dict(loads(body))
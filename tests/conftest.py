@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+# Tests import the controllers/models packages the same way main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.mock_server import MockConfig, MockRobotEvents  # noqa: E402
+from controllers.ratelimit import RateLimiter  # noqa: E402
+
+
+@pytest.fixture
+def mock_server():
+    """Start a MockRobotEvents with the given MockConfig knobs; stopped after the test."""
+    servers = []
+
+    def start(**config):
+        server = MockRobotEvents(MockConfig(**config)).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def fast_limiter():
+    """A limiter that never holds tests back on the request rate."""
+    return RateLimiter(rate=1000, burst=1000, concurrency=8)
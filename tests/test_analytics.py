@@ -0,0 +1,33 @@
+import random
+
+import numpy as np
+
+from controllers.analytics import solve
+
+
+def dense_solution(alliance_teams, own_scores, opponent_scores, team_ids):
+    index = {team: i for i, team in enumerate(team_ids)}
+    design = np.zeros((len(alliance_teams), len(team_ids)))
+    for row, teams in enumerate(alliance_teams):
+        for team in teams:
+            design[row, index[team]] = 1.0
+    scores = np.column_stack((own_scores, opponent_scores)).astype(float)
+    return np.linalg.lstsq(design, scores, rcond=None)[0]
+
+
+def test_normal_equations_match_the_dense_least_squares_solution():
+    rng = random.Random(0)
+    for _ in range(20):
+        teams = rng.randint(4, 60)
+        alliance_teams = [
+            rng.sample(range(1000, 1000 + teams), rng.choice([1, 2, 3]))
+            for _ in range(rng.randint(2, 200))
+        ]
+        own = [rng.randint(0, 100) for _ in alliance_teams]
+        opponent = [rng.randint(0, 100) for _ in alliance_teams]
+
+        ratings = solve(alliance_teams, own, opponent)
+        expected = dense_solution(alliance_teams, own, opponent, ratings.team_ids)
+        assert np.allclose(ratings.opr, expected[:, 0], atol=1e-6)
+        assert np.allclose(ratings.dpr, expected[:, 1], atol=1e-6)
+        assert np.allclose(ratings.ccwm, ratings.opr - ratings.dpr)
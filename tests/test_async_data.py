@@ -0,0 +1,70 @@
+import asyncio
+
+from controllers.async_data import AsyncRobotEvents
+from models.endpoints import Endpoints
+
+
+def client(server, limiter, **kwargs):
+    return AsyncRobotEvents(
+        api_token="test",
+        base_url=server.base_url,
+        limiter=limiter,
+        backoff_factor=0.01,
+        memo=False,
+        **kwargs,
+    )
+
+
+async def collect(agen):
+    return [item async for item in agen]
+
+
+def test_iter_all_yields_every_page_in_order(mock_server, fast_limiter):
+    server = mock_server(items=1000)
+
+    async def run():
+        async with client(server, fast_limiter) as api:
+            return await collect(api.iter_all(Endpoints.TEAMS, per_page=50, max_workers=4))
+
+    teams = asyncio.run(run())
+    assert [team["id"] for team in teams] == [100000 + i for i in range(1000)]
+    assert server.stats["requests"] == 20
+
+
+def test_gather_many_keeps_input_order(mock_server, fast_limiter):
+    server = mock_server(latency=0.005)
+    team_ids = list(range(100030, 100000, -1))
+
+    async def run():
+        async with client(server, fast_limiter, concurrency=4) as api:
+            return await api.gather_many(
+                api.fetch(Endpoints.TEAM, path_params={"id": team_id}) for team_id in team_ids
+            )
+
+    teams = asyncio.run(run())
+    assert [team["id"] for team in teams] == team_ids
+
+
+def test_retries_5xx_responses(mock_server, fast_limiter):
+    server = mock_server(items=500, error_rate=0.3, seed=3)
+
+    async def run():
+        async with client(server, fast_limiter, max_retries=6) as api:
+            return await collect(api.iter_all(Endpoints.TEAMS, per_page=25))
+
+    teams = asyncio.run(run())
+    assert len(teams) == 500
+    assert server.stats["errors"] > 0
+
+
+def test_waits_out_429_responses(mock_server, fast_limiter):
+    server = mock_server(items=500, throttle_rate=0.3, retry_after=0, seed=5)
+
+    async def run():
+        async with client(server, fast_limiter, max_throttle_retries=10) as api:
+            return await collect(api.iter_all(Endpoints.TEAMS, per_page=25))
+
+    teams = asyncio.run(run())
+    assert len(teams) == 500
+    assert server.stats["throttled"] > 0
+    assert fast_limiter.throttled_count == server.stats["throttled"]
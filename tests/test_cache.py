@@ -0,0 +1,31 @@
+from controllers.cache import ResponseCache
+from controllers.data import RobotEvents
+from models.endpoints import Endpoints
+
+
+def test_key_ignores_param_order_and_scalar_vs_list():
+    a = ResponseCache.key(Endpoints.TEAMS, {}, {"id": [2, 1], "grade": "High School"})
+    b = ResponseCache.key(Endpoints.TEAMS, {}, {"grade": ["High School"], "id": [1, 2]})
+    assert a == b
+    assert a != ResponseCache.key(Endpoints.TEAMS, {}, {"id": [1, 3]})
+
+
+def test_fresh_entries_skip_the_network(mock_server, fast_limiter):
+    server = mock_server()
+    cache = ResponseCache(":memory:")
+    with RobotEvents("test", base_url=server.base_url, cache=cache, limiter=fast_limiter, memo=False) as api:
+        first = api.fetch(Endpoints.TEAM, path_params={"id": 100007})
+        second = api.fetch(Endpoints.TEAM, path_params={"id": 100007})
+    assert first == second
+    assert server.stats["requests"] == 1
+
+
+def test_stale_entries_are_revalidated_with_304(mock_server, fast_limiter):
+    server = mock_server()
+    cache = ResponseCache(":memory:", ttls={Endpoints.TEAM: 0})
+    with RobotEvents("test", base_url=server.base_url, cache=cache, limiter=fast_limiter, memo=False) as api:
+        first = api.fetch(Endpoints.TEAM, path_params={"id": 100007})
+        second = api.fetch(Endpoints.TEAM, path_params={"id": 100007})
+    assert first == second
+    assert server.stats["requests"] == 2
+    assert server.stats["not_modified"] == 1
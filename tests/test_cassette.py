@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+import requests
+
+from controllers.async_data import AsyncRobotEvents
+from controllers.cache import ResponseCache
+from controllers.cassette import Cassette, CassetteMiss
+from controllers.data import RobotEvents
+from models.endpoints import Endpoints
+
+URL = "https://www.robotevents.com/api/v2/teams/7"
+
+
+def test_record_then_replay_round_trip(tmp_path):
+    path = str(tmp_path / "cassette.zip")
+    with Cassette(path, "record") as cassette:
+        cassette.record(URL, {"season": [197]}, 200, b'{"id": 7}', {"ETag": '"a"', "Date": "now"})
+        cassette.record(URL, {"season": [190]}, 304, b"", {"ETag": '"a"'})
+        cassette.record(URL, {"season": [181]}, 404, b'{"message": "Not found"}')
+        # The first response for a request wins
+        cassette.record(URL, {"season": [197]}, 500, b"")
+
+    with Cassette(path, "replay") as cassette:
+        assert len(cassette) == 3
+        # The host is not part of the key, and params are order-insensitive
+        status, body, headers = cassette.play("http://127.0.0.1:1/api/v2/teams/7", {"season": 197})
+        assert (status, body, headers) == (200, b'{"id": 7}', {"ETag": '"a"'})
+        assert cassette.play(URL, {"season": [190]})[:2] == (304, b"")
+
+        response = cassette.response(URL, {"season": [181]})
+        assert response.status_code == 404
+        with pytest.raises(requests.exceptions.HTTPError):
+            response.raise_for_status()
+
+        with pytest.raises(CassetteMiss):
+            cassette.play(URL, {"season": [1]})
+        assert (cassette.hits, cassette.misses) == (3, 1)
+
+
+def test_non_utf8_body_survives(tmp_path):
+    path = str(tmp_path / "cassette.zip")
+    body = b"\xff\xfe\x00broken"
+    with Cassette(path, "record") as cassette:
+        cassette.record(URL, None, 502, body)
+    with Cassette(path, "replay") as cassette:
+        assert cassette.play(URL) == (502, body, {})
+
+
+def test_client_replays_without_the_network(tmp_path, mock_server, fast_limiter):
+    path = str(tmp_path / "cassette.zip")
+    server = mock_server(items=30)
+    with Cassette(path, "record") as cassette:
+        with RobotEvents("test", base_url=server.base_url, limiter=fast_limiter, cassette=cassette) as api:
+            recorded = list(api.iter_all(Endpoints.TEAMS, per_page=10))
+    requests_made = server.stats["requests"]
+
+    with Cassette(path, "replay") as cassette:
+        with RobotEvents("test", base_url="http://127.0.0.1:9/api/v2", cassette=cassette) as api:
+            assert list(api.iter_all(Endpoints.TEAMS, per_page=10)) == recorded
+            assert api.fetch(Endpoints.TEAM, path_params={"id": 100001}) is None
+    assert server.stats["requests"] == requests_made
+
+
+def test_async_recording_leaves_the_cache_alone(tmp_path, mock_server, fast_limiter):
+    server = mock_server()
+    cache = ResponseCache(":memory:")
+
+    async def run():
+        with Cassette(str(tmp_path / "cassette.zip"), "record") as cassette:
+            async with AsyncRobotEvents(
+                "test", base_url=server.base_url, limiter=fast_limiter, cache=cache, cassette=cassette, memo=False
+            ) as api:
+                for team_id in (100001, 100002, 100003):
+                    await api.fetch(Endpoints.TEAM, path_params={"id": team_id})
+            return len(cassette)
+
+    assert asyncio.run(run()) == 3
+    assert cache._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 0
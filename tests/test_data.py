@@ -0,0 +1,52 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from controllers.async_data import AsyncRobotEvents
+from controllers.data import RobotEvents
+from models.endpoints import Endpoints
+
+
+class HtmlHandler(BaseHTTPRequestHandler):
+    # A gateway error page served with 200, as some proxies do
+    def do_GET(self):
+        body = b"<html><body>Bad gateway</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def html_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), HtmlHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/v2"
+    server.shutdown()
+    server.server_close()
+
+
+def test_malformed_body_is_a_request_error(html_server, fast_limiter, capsys):
+    with RobotEvents("test", base_url=html_server, limiter=fast_limiter) as api:
+        assert api.fetch(Endpoints.TEAM, path_params={"id": 1}) is None
+        assert "Invalid JSON" in capsys.readouterr().out
+        with pytest.raises(requests.exceptions.RequestException):
+            list(api.iter_all(Endpoints.TEAMS))
+        with pytest.raises(requests.exceptions.RequestException):
+            list(api.iter_stream(Endpoints.TEAMS))
+
+
+def test_malformed_body_is_a_client_error_async(html_server, fast_limiter, capsys):
+    async def run():
+        async with AsyncRobotEvents("test", base_url=html_server, limiter=fast_limiter) as api:
+            return await api.fetch(Endpoints.TEAM, path_params={"id": 1})
+
+    assert asyncio.run(run()) is None
+    assert "Invalid JSON" in capsys.readouterr().out
@@ -0,0 +1,104 @@
+import csv
+import json
+
+import pytest
+
+from controllers.export import EXTRA_COLUMN, export_rows, flatten
+
+MATCH = {
+    "id": 1,
+    "event": {"id": 5, "name": "Worlds"},
+    "alliances": [
+        {"color": "red", "score": 40, "teams": [{"team": {"id": 7, "name": "7A"}}]},
+        {"color": "blue", "score": 35, "teams": [{"team": {"id": 8, "name": "8B"}}]},
+    ],
+    "qualifications": ["Signature Event", "Worlds"],
+    "location": {},
+    "notes": [],
+}
+
+
+def test_flatten_nested_keys():
+    assert flatten(MATCH) == {
+        "id": 1,
+        "event.id": 5,
+        "event.name": "Worlds",
+        # Keyed by color, then by position where items have no discriminator
+        "alliances.red.color": "red",
+        "alliances.red.score": 40,
+        "alliances.red.teams.0.team.id": 7,
+        "alliances.red.teams.0.team.name": "7A",
+        "alliances.blue.color": "blue",
+        "alliances.blue.score": 35,
+        "alliances.blue.teams.0.team.id": 8,
+        "alliances.blue.teams.0.team.name": "8B",
+        "qualifications": '["Signature Event", "Worlds"]',
+        "location": None,
+        "notes": None,
+    }
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def test_keys_after_the_schema_sample_spill_into_extra(tmp_path):
+    rows = [{"id": i, "team": {"number": f"{i}A"}} for i in range(1000)]
+    rows.append({"id": 1000, "team": {"number": "1000A", "grade": "High School"}, "late": True})
+    path = str(tmp_path / "teams.csv")
+
+    assert export_rows(rows, path) == 1001
+    written = read_csv(path)
+    assert list(written[0]) == ["id", "team.number", EXTRA_COLUMN]
+    assert written[0][EXTRA_COLUMN] == ""
+    assert json.loads(written[-1][EXTRA_COLUMN]) == {"team.grade": "High School", "late": True}
+
+
+def failing_rows(count, fail_at):
+    for i in range(count):
+        if i == fail_at:
+            raise RuntimeError("source failed")
+        yield {"id": i}
+
+
+@pytest.mark.parametrize("name", ["rows.csv", "rows.ndjson"])
+def test_rows_are_written_as_they_arrive(tmp_path, name):
+    # Rows before a failure deep into the source are already on disk, so
+    # the export never waited for (or held) the whole iterable
+    path = str(tmp_path / name)
+    with pytest.raises(RuntimeError):
+        export_rows(failing_rows(5000, fail_at=1500), path, sample_size=100)
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 1500 + name.endswith(".csv")
+
+
+def test_ndjson_keeps_objects_whole(tmp_path):
+    path = str(tmp_path / "matches.ndjson")
+    assert export_rows(iter([MATCH, {"id": 2}]), path) == 2
+    with open(path, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == [MATCH, {"id": 2}]
+
+
+def test_unknown_extension_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_rows([{"id": 1}], str(tmp_path / "rows.xlsx"))
+
+
+def test_parquet_moves_values_of_the_wrong_type_to_extra(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [{"id": i, "score": i * 10, "empty": None} for i in range(5)]
+    rows.append({"id": 5, "score": "DQ", "empty": "late text"})
+    path = str(tmp_path / "scores.parquet")
+
+    assert export_rows(rows, path, sample_size=5, batch_size=4) == 6
+    table = pq.read_table(path)
+    assert str(table.schema.field("score").type) == "int64"
+    # All-null sample columns become strings rather than the null type
+    assert str(table.schema.field("empty").type) == "string"
+    written = table.to_pylist()
+    assert written[3]["score"] == 30
+    assert written[5]["score"] is None
+    assert json.loads(written[5][EXTRA_COLUMN]) == {"score": "DQ"}
+    assert written[5]["empty"] == "late text"
@@ -0,0 +1,28 @@
+import socket
+
+from controllers.data import RobotEvents
+from models.endpoints import Endpoints
+
+
+def test_new_connections_fall_back_to_the_next_resolved_address(mock_server, fast_limiter, monkeypatch):
+    server = mock_server()
+    port = int(server.base_url.split(":")[2].split("/")[0])
+    getaddrinfo = socket.getaddrinfo
+
+    def resolve(host, *args, **kwargs):
+        if host == "dual-stack.test":
+            # Nothing listens on 127.0.0.2, as with an unreachable IPv6 address
+            return [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.2", port)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port)),
+            ]
+        return getaddrinfo(host, *args, **kwargs)
+
+    monkeypatch.setattr(socket, "getaddrinfo", resolve)
+    base_url = f"http://dual-stack.test:{port}/api/v2"
+    with RobotEvents("test", base_url=base_url, limiter=fast_limiter, max_retries=0) as api:
+        team = api.fetch(Endpoints.TEAM, path_params={"id": 100001})
+        traces = list(api.instrumentation.traces)
+
+    assert team["id"] == 100001
+    assert traces[-1].dns > 0
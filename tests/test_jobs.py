@@ -0,0 +1,109 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from controllers.data import RobotEvents
+from controllers.jobs import JobRunner, load_job_file, validate_jobs
+from models.endpoints import Endpoints
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_overlapping_jobs_fetch_each_request_once(tmp_path, mock_server, fast_limiter):
+    server = mock_server(items=20)
+    spec = {
+        "season": 197,
+        "jobs": [
+            {"name": "matches", "endpoint": "team_matches", "teams": [100001, 100002]},
+            {"name": "more-matches", "endpoint": "team_matches", "teams": [100002, 100003]},
+            {"name": "events", "endpoint": "team_events", "teams": [100001, 100003]},
+            {"name": "awards", "endpoint": "team_awards", "teams": [100001]},
+        ],
+    }
+    with RobotEvents("test", base_url=server.base_url, limiter=fast_limiter, memo=False) as api:
+        runner = JobRunner(api, output_dir=str(tmp_path)).add_jobs(spec)
+        summary = runner.run()
+
+    # 3 event lists + 3 match lists + 1 awards list, each one page
+    assert summary["written"] == 4 and summary["failed"] == 0
+    assert summary["unique"] == 7 and summary["requested"] == 11
+    assert server.stats["requests"] == summary["unique"]
+    with open(tmp_path / "matches.ndjson", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert {row["team_id"] for row in rows} == {100001, 100002}
+
+
+class FailingEvents:
+    """TEAM_EVENTS always fails; everything else returns one row."""
+
+    BASE_URL = "https://example.invalid/api/v2"
+
+    def __init__(self):
+        self.calls = []
+
+    def iter_all(self, endpoint, path_params=None, params=None):
+        self.calls.append(endpoint)
+        if endpoint == Endpoints.TEAM_EVENTS:
+            raise ConnectionError("events unavailable")
+        return iter([{"id": 1}])
+
+
+def test_failed_dependency_fails_its_dependents(tmp_path):
+    controller = FailingEvents()
+    results = {}
+    runner = JobRunner(controller, output_dir=str(tmp_path)).add_jobs(
+        {
+            "season": 197,
+            "jobs": [
+                {"name": "matches", "endpoint": "team_matches", "teams": [100001]},
+                {"name": "awards", "endpoint": "team_awards", "teams": [100001]},
+            ],
+        }
+    )
+    summary = runner.run(progress=lambda job, rows, error: results.update({job.name: error}))
+
+    assert summary["written"] == 1 and summary["failed"] == 1
+    assert "dependency failed" in str(results["matches"])
+    assert results["awards"] is None
+    # The matches request itself was never sent
+    assert Endpoints.TEAM_MATCHES not in controller.calls
+    assert not os.path.exists(tmp_path / "matches.ndjson")
+
+
+def test_invalid_specs_are_rejected_up_front():
+    with pytest.raises(ValueError) as raised:
+        validate_jobs(
+            [
+                {"name": "a", "teams": [1]},
+                {"name": "b", "endpoint": "nope"},
+                {"name": "c", "endpoint": "team_matches", "season": "VEX1999"},
+                {"name": "d", "endpoint": "event_teams", "events": ["x"]},
+                "not a job",
+                {"name": "ok", "endpoint": "teams"},
+            ]
+        )
+    message = str(raised.value)
+    for expected in ('(a): missing "endpoint"', "(b): Unknown endpoint", "(c): Unknown season", "(d): Event IDs", "job 5"):
+        assert expected in message
+    assert "(ok)" not in message
+    with pytest.raises(ValueError):
+        validate_jobs({"jobs": "teams"})
+
+
+def test_malformed_job_file_prints_an_error(tmp_path):
+    path = tmp_path / "jobs.json"
+    path.write_text('{"jobs": [', encoding="utf-8")
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        load_job_file(str(path))
+
+    result = subprocess.run(
+        [sys.executable, "main.py", "--offline", str(tmp_path / "warehouse.sqlite"), "--jobs", str(path)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert "ERROR in job file" in result.stdout
+    assert "Traceback" not in result.stderr
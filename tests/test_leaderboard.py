@@ -0,0 +1,58 @@
+from controllers.data import RobotEvents
+from controllers.leaderboard import SkillsLeaderboard, event_best
+
+
+def skill(team_id, kind, score):
+    return {"team": {"id": team_id, "name": f"{team_id}A"}, "type": kind, "score": score}
+
+
+def test_event_best_keeps_each_teams_best_attempt_per_type():
+    rows = [
+        skill(1, "driver", 50),
+        skill(1, "driver", 70),
+        skill(1, "programming", 20),
+        skill(2, "programming", 30),
+        {"team": {"id": 3}, "type": "package_delivery_time", "score": 99},
+    ]
+    assert event_best(rows) == {1: ("1A", 70, 20), 2: ("2A", 0, 30)}
+
+
+def test_best_combined_comes_from_a_single_event():
+    board = SkillsLeaderboard(None)
+    board.add_event(10, {1: ("1A", 100, 10)})
+    board.add_event(11, {1: ("1A", 40, 80)})
+    board.add_event(12, {1: ("1A", 30, 20)})
+    team = board.teams[1]
+
+    assert (team.combined, team.driver_at_best, team.programming_at_best, team.event_id) == (120, 40, 80, 11)
+    assert (team.best_driver, team.best_programming) == (100, 80)
+
+
+def test_teams_without_grade_or_region_are_ranked_once():
+    board = SkillsLeaderboard(None, top=5)
+    board.add_event(1, {team_id: (f"{team_id}A", team_id, 0) for team_id in (10, 11, 12)})
+    for team in board.teams.values():
+        team.program = "V5RC"
+    board.teams[12].grade, board.teams[12].region = "High School", "Ohio"
+    board.add_event(1, {13: ("13A", 99, 0)})
+    board.teams[13].program = "VIQRC"
+
+    assert [team.number for team in board.rankings("V5RC")] == ["12A", "11A", "10A"]
+    assert [team.number for team in board.rankings("V5RC", "High School", "Ohio")] == ["12A"]
+    assert [team.number for team in board.rankings("VIQRC")] == ["13A"]
+    assert [row["rank"] for row in board.rows("V5RC")] == [1, 2, 3]
+
+
+def test_crawl_and_describe_teams(mock_server, fast_limiter):
+    server = mock_server(items=40)
+    with RobotEvents("test", base_url=server.base_url, limiter=fast_limiter) as api:
+        board = SkillsLeaderboard(api, top=10, max_workers=4)
+        summary = board.crawl(197)
+
+    assert summary["failed"] == 0 and summary["crawled"] == summary["events"]
+    ranked = board.rankings("V5RC")
+    assert len(ranked) == 10
+    assert [team.sort_key for team in ranked] == sorted((team.sort_key for team in ranked), reverse=True)
+    assert all(team.grade and team.region for team in board.teams.values())
+    for grade in ("High School", "Middle School"):
+        assert all(team.grade == grade for team in board.rankings("V5RC", grade))
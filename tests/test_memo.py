@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import controllers.memo as memo_module
+from controllers.data import RobotEvents
+from controllers.memo import RequestMemo, request_key
+from models.endpoints import Endpoints
+
+
+def test_request_key_normalizes_params():
+    assert request_key("u", {"season": [197], "per_page": 50}) == request_key(
+        "u", {"per_page": "50", "season": 197, "team": None}
+    )
+    assert request_key("u", {"season": [197, 190]}) != request_key("u", {"season": [197]})
+
+
+def test_concurrent_identical_requests_share_one_fetch():
+    memo = RequestMemo()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"id": 1}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(memo.get_or_fetch, "k", fetch) for _ in range(8)]
+        # Let every caller reach the memo before the leader finishes
+        deadline = time.monotonic() + 5
+        while memo.coalesced < 7 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert memo.stats()["coalesced"] == 7 and memo.stats()["misses"] == 1
+
+
+def test_async_callers_coalesce():
+    memo = RequestMemo()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    async def run():
+        return await asyncio.gather(*(memo.get_or_fetch_async("k", fetch) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1 and results == [{"id": 1}] * 5
+
+
+def test_errors_reach_waiters_and_are_not_kept():
+    memo = RequestMemo()
+
+    def fail():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        memo.get_or_fetch("k", fail)
+    assert memo.get_or_fetch("k", lambda: "ok") == "ok"
+    assert memo.stats()["misses"] == 2
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(memo_module.time, "monotonic", lambda: now[0])
+    memo = RequestMemo(ttl=60.0)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert memo.get_or_fetch("k", fetch) == 1
+    now[0] += 59
+    assert memo.get_or_fetch("k", fetch) == 1
+    now[0] += 2
+    assert memo.get_or_fetch("k", fetch) == 2
+    assert memo.stats()["hits"] == 1 and memo.stats()["misses"] == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    memo = RequestMemo(max_entries=2)
+    calls = []
+
+    def fetch(key):
+        return lambda: calls.append(key) or key
+
+    memo.get_or_fetch("a", fetch("a"))
+    memo.get_or_fetch("b", fetch("b"))
+    # Touching "a" makes "b" the oldest, so "c" pushes "b" out
+    memo.get_or_fetch("a", fetch("a"))
+    memo.get_or_fetch("c", fetch("c"))
+    assert memo.stats()["entries"] == 2
+
+    memo.get_or_fetch("a", fetch("a"))
+    memo.get_or_fetch("b", fetch("b"))
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_memoized_results_are_shared(mock_server, fast_limiter):
+    server = mock_server()
+    with RobotEvents("test", base_url=server.base_url, limiter=fast_limiter) as api:
+        first = api.fetch(Endpoints.TEAM, path_params={"id": 100007})
+        second = api.fetch(Endpoints.TEAM, path_params={"id": 100007})
+        # The memo hands every caller the same object, which is why results are read-only
+        assert second is first
+        assert server.stats["requests"] == 1
+
+        copy = dict(first, number="MUTATED")
+        assert api.fetch(Endpoints.TEAM, path_params={"id": 100007})["number"] != copy["number"]
@@ -0,0 +1,34 @@
+import requests
+
+from controllers.data import RobotEvents
+from controllers.planner import QueryPlanner
+from models.endpoints import Endpoints
+
+
+def test_chunks_keep_every_url_under_the_limit():
+    api = RobotEvents("test")
+    planner = QueryPlanner(api, max_url_length=300)
+    values = list(range(100000, 100200)) + [100000, 100001]
+    chunks = list(planner.chunks(Endpoints.TEAMS, "id[]", values, {"season[]": [197]}))
+
+    assert len(chunks) > 1
+    # Every value once, in order, duplicates dropped
+    assert [value for chunk in chunks for value in chunk] == list(range(100000, 100200))
+    for chunk in chunks:
+        request = requests.Request(
+            "GET",
+            api.BASE_URL + Endpoints.TEAMS.value,
+            params={"season[]": [197], "id[]": chunk, "per_page": 250, "page": 9999},
+        ).prepare()
+        assert len(request.url) <= 300
+
+
+def test_scatter_maps_rows_back_to_requested_ids(mock_server, fast_limiter):
+    server = mock_server(items=50)
+    with RobotEvents("test", base_url=server.base_url, limiter=fast_limiter) as api:
+        teams = QueryPlanner(api, max_url_length=200).teams([100003, 100001, 999])
+
+    assert list(teams) == [100003, 100001, 999]
+    assert teams[100003]["id"] == 100003
+    assert teams[100001]["number"] == "1000B"
+    assert teams[999] is None
@@ -0,0 +1,57 @@
+import requests
+
+from controllers.cache import ResponseCache
+from controllers.data import RobotEvents
+from controllers.proxy import EVENT_COLLECTIONS, CachingProxy, warm_event
+from models.endpoints import Endpoints
+
+
+def test_proxy_serves_the_api_paths(mock_server, fast_limiter):
+    server = mock_server(items=30)
+    with RobotEvents("test", base_url=server.base_url, limiter=fast_limiter) as upstream:
+        with CachingProxy(upstream, port=0) as proxy:
+            response = requests.get(f"{proxy.base_url}/teams/100001")
+            unknown = requests.get(f"{proxy.base_url}/nowhere")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == 100001
+    assert response.headers["ETag"]
+    assert unknown.status_code == 404
+
+
+def test_proxy_forwards_retry_after_when_still_throttled(mock_server, fast_limiter):
+    server = mock_server(throttle_rate=1.0, retry_after=0)
+    with RobotEvents(
+        "test", base_url=server.base_url, limiter=fast_limiter, max_throttle_retries=0
+    ) as upstream:
+        with CachingProxy(upstream, port=0) as proxy:
+            response = requests.get(f"{proxy.base_url}/teams/100001")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "0"
+
+
+def test_empty_2xx_is_an_empty_result():
+    response = requests.Response()
+    response.status_code = 204
+    response._content = b""
+
+    assert RobotEvents("test")._handle_response(response) == {}
+
+
+def test_warmed_event_serves_main_style_requests_from_cache(mock_server, fast_limiter):
+    server = mock_server(items=30)
+    cache = ResponseCache(":memory:")
+    with RobotEvents(
+        "test", base_url=server.base_url, cache=cache, limiter=fast_limiter, memo=False
+    ) as api:
+        summary = warm_event(api, 50003)
+        assert summary["failed"] == 0 and summary["warmed"] > len(EVENT_COLLECTIONS)
+        warmed = server.stats["requests"]
+
+        # What main.py sends for an event and its collections (season filter, 250 per page)
+        params = {"season": [197]}
+        api.fetch(Endpoints.EVENT, path_params={"id": 50003}, params={**params, "per_page": 250})
+        for endpoint in EVENT_COLLECTIONS:
+            assert list(api.iter_all(endpoint, path_params={"id": 50003}, params=params, per_page=250))
+        assert server.stats["requests"] == warmed
@@ -0,0 +1,36 @@
+from controllers.data import _Retry
+from controllers.ratelimit import RateLimiter, parse_retry_after
+
+
+def release_after(limiter, **outcome):
+    limiter.acquire()
+    limiter.release(**outcome)
+    return limiter.concurrency
+
+
+def test_only_success_grows_the_cap():
+    limiter = RateLimiter(rate=1000, burst=1000, concurrency=4)
+    assert release_after(limiter, status=200, latency=0.1) > 4
+    grown = limiter.concurrency
+    assert release_after(limiter, status=304, latency=0.1) > grown
+    grown = limiter.concurrency
+    assert release_after(limiter, status=404, latency=0.1) == grown
+
+
+def test_429_halves_and_slow_responses_shrink_by_ten_percent():
+    limiter = RateLimiter(rate=1000, burst=1000, concurrency=8)
+    assert release_after(limiter, status=429, retry_after=0) == 4
+    assert release_after(limiter, status=200, latency=5.0) == 4 * 0.9
+
+
+def test_urllib3_retry_leaves_429_to_the_limiter():
+    retry = _Retry(total=3, status_forcelist=(500, 502, 503, 504), allowed_methods=["GET"])
+    assert retry.respect_retry_after_header
+    assert not retry.is_retry("GET", 429, has_retry_after=True)
+    assert retry.is_retry("GET", 503, has_retry_after=True)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) == 1.0
+    assert parse_retry_after("garbage", default=2.0) == 2.0
@@ -0,0 +1,96 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from controllers.ratings import EloRatings, match_tuple, run_elo
+
+START = datetime(2025, 9, 1, 9, tzinfo=timezone.utc)
+
+
+def season(events=12, teams_per_event=8, matches_per_event=20, seed=3):
+    """Synthetic division matches: two weeks of events, some sharing teams across weeks."""
+    rng = random.Random(seed)
+    matches = []
+    for event in range(events):
+        # Events 0-5 run in week one, 6-11 in week two; week-two events reuse week-one teams
+        first_team = (event % 6) * teams_per_event
+        teams = list(range(first_team, first_team + teams_per_event))
+        day = START + timedelta(days=7 * (event // 6) + event % 6 // 3)
+        for number in range(matches_per_event):
+            red = rng.sample(teams, 2)
+            blue = rng.sample([t for t in teams if t not in red], 2)
+            matches.append(
+                {
+                    "id": event * 1000 + number,
+                    "event": {"id": 50000 + event},
+                    "round": 2,
+                    "instance": 1,
+                    "matchnum": number + 1,
+                    "scored": True,
+                    "started": (day + timedelta(minutes=10 * number)).isoformat(),
+                    "alliances": [
+                        {"color": "red", "score": rng.randint(0, 100), "teams": [{"team": {"id": t}} for t in red]},
+                        {"color": "blue", "score": rng.randint(0, 100), "teams": [{"team": {"id": t}} for t in blue]},
+                    ],
+                }
+            )
+    rng.shuffle(matches)
+    return matches
+
+
+def serial(matches):
+    """Every match replayed in time order in one process."""
+    rows = sorted(row for row in map(match_tuple, matches) if row is not None)
+    ratings, _ = run_elo({}, rows, 32.0, 400.0, 1500.0)
+    return {team: rating for team, (rating, _) in ratings.items()}
+
+
+def current(elo):
+    return {team: rating for team, (rating, _) in elo.ratings.items()}
+
+
+def test_match_tuple_skips_practice_and_unscored():
+    match = season(events=1, matches_per_event=1)[0]
+    assert match_tuple(match)[5] == match["id"]
+    assert match_tuple({**match, "round": 1}) is None
+    assert match_tuple({**match, "scored": False}) is None
+    sitting = {**match, "alliances": [{**a, "teams": [{**t, "sitting": True} for t in a["teams"]]} for a in match["alliances"]]}
+    assert match_tuple(sitting) is None
+
+
+def test_process_pool_matches_serial_replay(tmp_path):
+    matches = season()
+    with EloRatings(str(tmp_path / "ratings.sqlite"), max_workers=2, min_parallel=0) as elo:
+        summary = elo.apply(matches)
+        assert summary == {"matches": len(matches), "windows": 2, "components": 12}
+        assert current(elo) == pytest.approx(serial(matches))
+
+
+def test_resume_skips_applied_matches(tmp_path):
+    matches = season()
+    path = str(tmp_path / "ratings.sqlite")
+    week_one = [m for m in matches if m["event"]["id"] < 50006]
+
+    with EloRatings(path) as elo:
+        assert elo.apply(week_one)["matches"] == len(week_one)
+    # A fresh process picks up the checkpoint; repeated matches are ignored
+    with EloRatings(path) as elo:
+        assert elo.apply(matches)["matches"] == len(matches) - len(week_one)
+        assert elo.apply(matches)["matches"] == 0
+        assert current(elo) == pytest.approx(serial(matches))
+
+
+def test_history_tracks_every_rated_match(tmp_path):
+    matches = season(events=2)
+    with EloRatings(str(tmp_path / "ratings.sqlite")) as elo:
+        elo.apply(matches)
+        for team_id, (rating, played) in elo.ratings.items():
+            history = elo.history(team_id)
+            assert len(history) == played
+            assert [row[2] for row in history] == sorted(row[2] for row in history)
+            assert history[-1][3] == pytest.approx(rating)
+            assert 1500.0 + sum(row[4] for row in history) == pytest.approx(rating)
+        assert elo.rating(999999) is None
+        top = elo.top(limit=3, min_matches=1)
+        assert [row[1] for row in top] == sorted((row[1] for row in top), reverse=True)
@@ -0,0 +1,97 @@
+import gc
+import json
+import tracemalloc
+
+import pytest
+
+from controllers.data import RobotEvents
+from models import records
+from models.endpoints import Endpoints
+from models.records import Match, Team, decode, dumps, loads, record_type_for
+
+MATCH = {
+    "id": 7,
+    "event": {"id": 50000, "name": "Synthetic Event 0", "code": None},
+    "division": {"id": 1, "name": "Division 1"},
+    "round": 2,
+    "instance": 1,
+    "matchnum": 12,
+    "name": "Qualifier #12",
+    "scored": True,
+    "field": "Field 1",
+    "alliances": [
+        {"color": "red", "score": 40, "teams": [{"team": {"id": 1, "name": "1A"}, "sitting": False}]},
+        {"color": "blue", "score": 35, "teams": [{"team": {"id": 2, "name": "2B"}, "sitting": True}]},
+    ],
+}
+
+
+def test_from_dict_flattens_nested_objects():
+    match = Match.from_dict(MATCH)
+    assert (match.event_id, match.division_id, match.scored) == (50000, 1, True)
+    assert match.alliance("red").team_numbers == ("1A",)
+    assert match.alliance("blue").sitting == (True,)
+    assert match.alliance("green") is None
+
+    team = Team.from_dict({"id": 3, "number": "3C", "location": {"region": "Ohio"}, "program": {"id": 1}})
+    assert (team.number, team.region, team.program_id, team.city) == ("3C", "Ohio", 1, None)
+
+
+def test_decode_goes_from_bytes_to_a_record():
+    assert decode(json.dumps(MATCH).encode(), Match) == Match.from_dict(MATCH)
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_loads_and_dumps_round_trip(monkeypatch, fast):
+    if not fast:
+        # The stdlib fallback used when orjson is not installed
+        monkeypatch.setattr(records, "orjson", None)
+    body = dumps(MATCH)
+    assert isinstance(body, bytes)
+    assert loads(body) == MATCH
+    assert loads(body.decode()) == MATCH
+
+
+def test_endpoints_without_records_raise_value_error():
+    with pytest.raises(ValueError, match="SEASONS"):
+        record_type_for(Endpoints.SEASONS)
+    with pytest.raises(ValueError):
+        next(RobotEvents("test").iter_records(Endpoints.PROGRAMS))
+
+
+def test_iter_records_matches_iter_all(mock_server, fast_limiter):
+    server = mock_server(items=300)
+    path_params = {"id": 50000, "div": 1}
+    with RobotEvents("test", base_url=server.base_url, limiter=fast_limiter) as api:
+        matches = list(api.iter_records(Endpoints.EVENT_DIVISION_MATCHES, path_params, per_page=100))
+        rows = list(api.iter_all(Endpoints.EVENT_DIVISION_MATCHES, path_params, per_page=100))
+        team = list(api.iter_records(Endpoints.TEAM, {"id": 100005}))
+        team_row = api.fetch(Endpoints.TEAM, path_params={"id": 100005})
+
+    assert len(matches) == 300
+    assert matches == [Match.from_dict(row) for row in rows]
+    assert team == [Team.from_dict(team_row)]
+
+
+def retained(build):
+    """Bytes still allocated after build() returns, for the object it returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = build()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return size, result
+
+
+def test_records_hold_less_memory_than_dicts():
+    bodies = [json.dumps({**MATCH, "id": i, "name": f"Qualifier #{i}"}).encode() for i in range(2000)]
+    dict_size, dicts = retained(lambda: [loads(body) for body in bodies])
+    record_size, matches = retained(lambda: [decode(body, Match) for body in bodies])
+
+    assert len(dicts) == len(matches) == 2000
+    assert record_size < dict_size / 2
@@ -0,0 +1,24 @@
+from controllers.registry import Registry
+from models.seasons import Seasons
+
+SEASONS = [
+    {"id": 197, "name": "VEX V5 Robotics Competition 2025-2026: Push Back", "years_start": 2025,
+     "years_end": 2026, "program": {"id": 1, "code": "V5RC"}},
+    {"id": 190, "name": "VEX V5 Robotics Competition 2024-2025: High Stakes", "years_start": 2024,
+     "years_end": 2025, "program": {"id": 1, "code": "V5RC"}},
+]
+
+
+def test_season_id_from_years_names_and_ids(tmp_path):
+    registry = Registry(path=str(tmp_path / "registry.json"))
+    registry.seasons = SEASONS
+    registry._build_indexes()
+
+    assert registry.season_id("2025") == 197
+    assert registry.season_id("2024") == 190
+    assert registry.season_id("197") == 197
+    assert registry.season_id("VEX2425") == Seasons.VEX2425.value
+    assert registry.season_id(SEASONS[1]["name"]) == 190
+    # A year the registry does not know is not a season ID
+    assert registry.season_id("2031") is None
+    assert registry.season_id("Nothing") is None
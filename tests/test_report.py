@@ -0,0 +1,132 @@
+import io
+
+import pytest
+import requests
+from rich.console import Console
+
+from controllers.report import ScoutingReport, check_paths
+from models.endpoints import Endpoints
+
+
+class FakeController:
+    """One event with two teams; TEAM_SKILLS rows for team 2 are malformed."""
+
+    def fetch(self, endpoint, path_params=None, params=None):
+        return {"id": 1, "name": "Test Event", "season": {"id": 197}}
+
+    def iter_all(self, endpoint, path_params=None, params=None):
+        if endpoint == Endpoints.EVENT_TEAMS:
+            return iter([{"id": 1, "number": "1A"}, {"id": 2, "number": "2B"}])
+        if endpoint == Endpoints.TEAM_SKILLS and path_params["id"] == 2:
+            return iter([None])
+        return iter([])
+
+
+def test_any_worker_error_counts_as_failed():
+    errors = []
+    scouting = ScoutingReport(FakeController(), 1)
+    summary = scouting.collect(progress=lambda team, endpoint, error: error and errors.append(error))
+
+    assert summary == {"teams": 2, "requests": 8, "failed": 1}
+    assert len(errors) == 1
+    assert not isinstance(errors[0], requests.exceptions.RequestException)
+
+
+def test_check_paths_rejects_unknown_extensions():
+    check_paths(["report.html", "REPORT.MD", "report.htm"])
+    with pytest.raises(ValueError):
+        check_paths(["report.html", "report.pdf"])
+
+
+def match(match_id, red, blue, red_score, blue_score, scored=True):
+    def alliance(color, teams, score):
+        return {"color": color, "score": score, "teams": [{"team": {"id": t}} for t in teams]}
+
+    return {
+        "id": match_id,
+        "event": {"id": 1},
+        "division": {"id": 1},
+        "round": 2,
+        "scored": scored,
+        "alliances": [alliance("red", red, red_score), alliance("blue", blue, blue_score)],
+    }
+
+
+def skill(event_id, kind, score):
+    return {"event": {"id": event_id}, "team": {"id": 1, "name": "1A"}, "type": kind, "score": score}
+
+
+class ScriptedController:
+    """Known season results for team 1A; team 2B has none."""
+
+    MATCHES = [
+        match(1, [1, 3], [2, 4], 50, 40),
+        match(2, [2, 4], [1, 3], 60, 30),
+        match(3, [1, 3], [2, 4], 45, 45),
+        match(4, [2, 3], [1, 4], 10, 70),
+        match(5, [1, 3], [2, 4], 99, 0, scored=False),
+    ]
+    SKILLS = [
+        # Event 10: 120 + 30 = 150; event 11: 90 + 70 = 160 is the best single event
+        skill(10, "driver", 120), skill(10, "programming", 30),
+        skill(11, "driver", 90), skill(11, "programming", 70), skill(11, "driver", 60),
+        # The best driver and programming runs come from different events
+        skill(12, "programming", 75),
+    ]
+
+    def fetch(self, endpoint, path_params=None, params=None):
+        return {"id": 1, "name": "Test | Event", "season": {"id": 197}}
+
+    def iter_all(self, endpoint, path_params=None, params=None):
+        team_id = (path_params or {}).get("id")
+        rows = {
+            Endpoints.EVENT_TEAMS: [
+                {"id": 1, "number": "1A", "organization": "School <1>"},
+                {"id": 2, "number": "2B", "organization": "School 2"},
+            ],
+            Endpoints.TEAM_MATCHES: self.MATCHES if team_id == 1 else [],
+            Endpoints.TEAM_SKILLS: self.SKILLS if team_id == 1 else [],
+            Endpoints.TEAM_RANKINGS: [
+                {"event": {"id": 1, "name": "Test Event"}, "rank": 3},
+                {"event": {"id": 0, "name": "Earlier"}, "rank": 8},
+            ] if team_id == 1 else [],
+            Endpoints.TEAM_AWARDS: [{"title": "Excellence Award (VRC/VEXU/VAIRC)"}] if team_id == 1 else [],
+        }[endpoint]
+        return iter(rows)
+
+
+def test_collect_aggregates_matches_skills_ranks_and_awards():
+    scouting = ScoutingReport(ScriptedController(), 1)
+    assert scouting.collect()["failed"] == 0
+    team = scouting.teams[1]
+
+    assert (team.wins, team.losses, team.ties) == (2, 1, 1)
+    assert (team.points_for, team.points_against, team.high_score) == (195, 155, 70)
+    assert team.win_rate == pytest.approx(0.625)
+    assert team.avg_margin == pytest.approx(10.0)
+    assert (team.skills_combined, team.skills_driver, team.skills_programming) == (160, 90, 70)
+    assert team.event_rank == 3
+    assert team.ranks == [(0, "Earlier", 8), (1, "Test Event", 3)]
+    assert team.awards == ["Excellence Award"]
+    assert scouting.teams[2].played == 0
+
+
+def test_rendered_rows_markdown_and_html(tmp_path):
+    scouting = ScoutingReport(ScriptedController(), 1)
+    scouting.collect()
+    rows = scouting.rows()
+
+    # Ranked teams first, unranked last
+    assert [row[0] for row in rows] == ["1A", "2B"]
+    assert rows[0][2:8] == ["3", "2-1-1", "62", "48.8", "+10.0", "70"]
+    assert rows[0][8:10] == ["160", "90/70"]
+    assert rows[1][3:8] == ["0-0-0", "", "", "", ""]
+
+    paths = [str(tmp_path / "report.md"), str(tmp_path / "report.html")]
+    scouting.render(paths=paths, console=Console(file=io.StringIO()))
+    markdown = open(paths[0], encoding="utf-8").read()
+    html = open(paths[1], encoding="utf-8").read()
+    assert markdown.startswith("# Scouting report: Test | Event")
+    assert "| 1A | School <1> | 3 | 2-1-1 |" in markdown
+    assert "<td>School &lt;1&gt;</td>" in html
+    assert "<title>Scouting report: Test | Event</title>" in html
@@ -0,0 +1,14 @@
+from controllers.startup import build_index, check_budget
+from models.endpoints import Endpoints
+from models.seasons import Seasons
+
+
+def test_index_covers_every_endpoint_and_season():
+    index = build_index()
+    assert {Endpoints[name] for name in index["endpoints"].values()} == set(Endpoints)
+    assert index["endpoints"]["team_matches"] == "TEAM_MATCHES"
+    assert index["seasons"] == {season.name: season.value for season in Seasons}
+
+
+def test_main_starts_within_budget():
+    assert check_budget("main")
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from controllers.data import RobotEvents
+from controllers.stream import PageReader
+from models.endpoints import Endpoints
+
+PAGE = {
+    "data": [
+        {"id": 1, "name": 'Bracket ] brace } "quote"', "tags": ["a", {"b": [1, 2]}]},
+        {"id": 2, "name": "Back\\slash é", "score": -1.5e3, "scored": True, "field": None},
+        {"id": 3, "name": "", "alliances": []},
+    ],
+    "meta": {"current_page": 1, "last_page": 4, "total": 3},
+}
+
+
+def chunked(body, size):
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_rows_and_fields_survive_any_chunking(size):
+    body = json.dumps(PAGE, indent=1).encode()
+    reader = PageReader(chunked(body, size))
+
+    assert list(reader.items()) == PAGE["data"]
+    assert reader.fields["meta"] == PAGE["meta"]
+    assert reader.paginated
+    assert reader.bytes == len(body)
+
+
+def test_read_meta_skips_rows_before_it():
+    reader = PageReader(chunked(json.dumps(PAGE).encode(), 16))
+
+    assert reader.read_meta() == PAGE["meta"]
+    assert list(reader.items()) == []
+
+
+def test_single_object_is_not_paginated():
+    team = {"id": 7, "number": "1234A", "program": {"id": 1, "code": "V5RC"}}
+    reader = PageReader(chunked(json.dumps(team).encode(), 5))
+
+    assert list(reader.items()) == []
+    assert not reader.paginated
+    assert reader.fields == team
+
+
+def test_truncated_body_raises():
+    body = json.dumps(PAGE).encode()
+    with pytest.raises(ValueError):
+        list(PageReader(chunked(body[: len(body) // 2], 32)).items())
+
+
+def test_iter_stream_matches_iter_all(mock_server, fast_limiter):
+    server = mock_server(items=120)
+    with RobotEvents("test", base_url=server.base_url, limiter=fast_limiter, memo=False) as api:
+        streamed = list(api.iter_stream(Endpoints.TEAMS, per_page=50, chunk_size=256))
+        paged = list(api.iter_all(Endpoints.TEAMS, per_page=50))
+
+    assert len(streamed) == 120
+    assert streamed == paged
@@ -0,0 +1,77 @@
+import io
+
+from rich.console import Console
+
+from controllers.viewer import ColumnStore, ResultViewer
+
+ROWS = [
+    {"id": 3, "number": "2775V", "team_name": "Black Hawks", "event": {"name": "Worlds"}},
+    {"id": 1, "number": "1234A", "team_name": "Blue Bots", "score": 10},
+    {"id": 2, "number": "99B", "team_name": "Red Rockets", "event": {"name": "States"}},
+    "not a dict",
+]
+
+
+def quiet_console():
+    return Console(file=io.StringIO(), width=200)
+
+
+def test_column_store_lines_up_rows_and_sorts_mixed_values():
+    store = ColumnStore(ROWS)
+
+    assert list(store.columns) == ["id", "number", "team_name", "event", "score", "value"]
+    assert store.values("event.name") == ["Worlds", None, "States", None]
+    # Numbers first, missing values last
+    assert store.order("id") == [1, 2, 0, 3]
+    assert store.text("team_name") == ["black hawks", "blue bots", "red rockets", ""]
+    assert store.order("id") is store.order("id")
+
+
+def test_sort_and_column_filter():
+    viewer = ResultViewer(ROWS, page_size=2)
+    viewer.sort("id", descending=True)
+    assert [row.get("id") for row in viewer.rows()] == [3, 2, 1, None]
+    assert viewer.pages == 2
+    viewer.sort("score", descending=True)
+    assert [row.get("id") for row in viewer.rows()] == [1, 3, 2, None]
+
+    viewer.filter("B", column="number")
+    assert [row["id"] for row in viewer.rows()] == [2]
+    viewer.filter("")
+    assert len(list(viewer.rows())) == 4
+
+
+def test_filter_command_only_takes_known_columns():
+    viewer = ResultViewer(ROWS)
+    console = quiet_console()
+
+    viewer.command("filter team_name blue", console)
+    assert viewer.filters == {"team_name": "blue"}
+
+    # Several words that do not start with a column search every column
+    viewer.command("filter", console)
+    viewer.command("filter black hawks", console)
+    assert viewer.filters == {None: "black hawks"}
+    assert [row["id"] for row in viewer.rows()] == [3]
+
+    viewer.command("filter", console)
+    viewer.command("filter event.name=states", console)
+    assert viewer.filters == {"event.name": "states"}
+
+    viewer.command("filter", console)
+    viewer.command("filter nope=x", console)
+    assert viewer.filters == {}
+    assert "Unknown column: nope" in console.file.getvalue()
+
+
+def test_sort_command_rejects_unknown_columns():
+    viewer = ResultViewer(ROWS)
+    console = quiet_console()
+
+    viewer.command("sort event.name desc", console)
+    assert viewer.sort_column == "event.name" and viewer.descending
+    assert [row.get("id") for row in viewer.rows()] == [3, 2, 1, None]
+
+    viewer.command("sort nmber", console)
+    assert viewer.sort_column == "event.name"
+    assert "Unknown column: nmber" in console.file.getvalue()
@@ -0,0 +1,43 @@
+from controllers.data import RobotEvents
+from controllers.sync import SeasonSync
+from controllers.warehouse import Warehouse
+from models.endpoints import Endpoints
+
+
+def synced_warehouse(mock_server, fast_limiter):
+    server = mock_server(items=30)
+    warehouse = Warehouse(":memory:")
+    with RobotEvents("test", base_url=server.base_url, limiter=fast_limiter) as api:
+        summary = SeasonSync(api, warehouse).sync(197)
+    assert summary["failed"] == 0
+    return warehouse
+
+
+def test_every_endpoint_is_answered_offline(mock_server, fast_limiter):
+    warehouse = synced_warehouse(mock_server, fast_limiter)
+    for endpoint in Endpoints:
+        if endpoint == Endpoints.PROGRAM:
+            path_params = {"id": 1}
+        elif endpoint in (Endpoints.SEASON, Endpoints.SEASON_EVENTS):
+            path_params = {"id": 197}
+        elif endpoint.value.startswith("/teams/"):
+            path_params = {"id": 100000}
+        else:
+            path_params = {"id": 50000, "div": 1}
+        # No endpoint may fall through to "not mirrored"
+        list(warehouse.iter_all(endpoint, path_params=path_params))
+
+
+def test_seasons_programs_and_finalist_rankings_are_mirrored(mock_server, fast_limiter):
+    warehouse = synced_warehouse(mock_server, fast_limiter)
+    assert [season["id"] for season in warehouse.iter_all(Endpoints.SEASONS)] == [197]
+    assert warehouse.fetch(Endpoints.SEASON, path_params={"id": 197})["program"]["id"] == 1
+    assert [program["id"] for program in warehouse.iter_all(Endpoints.PROGRAMS)] == [1]
+    # The mock repeats ranking IDs across events, so count them season-wide
+    for endpoint in (Endpoints.EVENT_DIVISION_RANKINGS, Endpoints.EVENT_DIVISION_FINALIST_RANKINGS):
+        rows = [
+            row
+            for event_id in range(50000, 50030)
+            for row in warehouse.iter_all(endpoint, path_params={"id": event_id, "div": 1})
+        ]
+        assert len(rows) == 30
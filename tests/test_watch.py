@@ -0,0 +1,58 @@
+import io
+
+import pytest
+import requests
+from rich.console import Console
+
+from controllers.watch import LineDiffDisplay, PolledCollection
+from models.endpoints import Endpoints
+
+
+class FakeController:
+    """Serves two pages; each page's ETag is its content, and any page can be made to fail."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fail = set()
+
+    def fetch_if_changed(self, endpoint, path_params=None, params=None, validators=None):
+        page = params["page"]
+        if page in self.fail:
+            raise requests.exceptions.ConnectionError(f"page {page} failed")
+        etag = repr(self.pages[page])
+        if validators == {"ETag": etag}:
+            return None, validators
+        return {"meta": {"last_page": len(self.pages)}, "data": self.pages[page]}, {"ETag": etag}
+
+
+def test_failed_poll_keeps_changes_for_the_next_poll():
+    controller = FakeController({1: [{"id": 1, "score": 0}], 2: [{"id": 2, "score": 0}]})
+    collection = PolledCollection(controller, Endpoints.EVENT_DIVISION_MATCHES, {"id": 1, "div": 1})
+    assert collection.poll() == ({1, 2}, set())
+
+    # Page 1 changes, but page 2 fails in the same poll
+    controller.pages[1] = [{"id": 1, "score": 5}]
+    controller.fail.add(2)
+    with pytest.raises(requests.exceptions.RequestException):
+        collection.poll()
+    assert collection.rows[1]["score"] == 0
+
+    # The retry must not get a 304 for page 1 and miss its change
+    controller.fail.clear()
+    assert collection.poll() == ({1}, set())
+    assert collection.rows[1]["score"] == 5
+    assert collection.poll() == (set(), set())
+
+
+def test_line_diff_display_rewrites_only_changed_lines():
+    out = io.StringIO()
+    console = Console(file=out, force_terminal=True, width=40, height=20, color_system=None)
+    display = LineDiffDisplay(console)
+
+    assert display.draw("a\nb\nc") == 3
+    out.truncate(0)
+    out.seek(0)
+    assert display.draw("a\nB\nc") == 1
+    written = out.getvalue()
+    assert "B" in written and "a" not in written and "c" not in written
+    assert display.draw("a\nB\nc") == 0